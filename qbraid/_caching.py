@@ -21,11 +21,15 @@ import functools
 import hashlib
 import json
 import os
+import threading
 import time
 from contextlib import contextmanager
-from typing import Any, Callable, Generator, Optional, TypeVar, overload
+from typing import Any, Callable, Generator, Generic, Optional, TypeVar, overload
+
+from qbraid._logging import logger
 
 TFunc = TypeVar("TFunc", bound=Callable)
+T = TypeVar("T")
 
 
 _CACHE_REGISTRY = []
@@ -126,6 +130,73 @@ def cached_method(
     return decorator if func is None else decorator(func)
 
 
+class StaleWhileRevalidateCache(Generic[T]):
+    """
+    A thread-safe cache of a single value with a time-to-live (TTL) and a
+    stale-while-revalidate window.
+
+    Values younger than ``ttl`` seconds are returned as is. Values that are older, but
+    no more than ``max_stale`` seconds past their TTL, are returned immediately while a
+    background thread fetches a fresh value. Older values are re-fetched synchronously.
+    Caching is bypassed when the ``DISABLE_CACHE`` environment variable is set to ``"1"``
+    or ``ttl`` is zero.
+
+    Example usage:
+
+    .. code-block:: python
+
+        cache = StaleWhileRevalidateCache(fetch_device_data, ttl=15, max_stale=45)
+        device_data = cache.get()
+    """
+
+    def __init__(self, fetch: Callable[[], T], ttl: float = 15.0, max_stale: float = 45.0):
+        self._fetch = fetch
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._value: Optional[T] = None
+        self._timestamp: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def _store(self, value: T) -> T:
+        with self._lock:
+            self._value = value
+            self._timestamp = time.monotonic()
+        return value
+
+    def _refresh(self) -> None:
+        try:
+            self._store(self._fetch())
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logger.info("Background cache refresh failed: %s", err)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def get(self) -> T:
+        """Return the cached value, fetching or refreshing it as needed."""
+        if os.getenv("DISABLE_CACHE") == "1" or self.ttl <= 0:
+            return self._fetch()
+
+        with self._lock:
+            age = None if self._timestamp is None else time.monotonic() - self._timestamp
+            if age is not None and age < self.ttl:
+                return self._value
+            if age is not None and age < self.ttl + self.max_stale:
+                if not self._refreshing:
+                    self._refreshing = True
+                    threading.Thread(target=self._refresh, daemon=True).start()
+                return self._value
+
+        return self._store(self._fetch())
+
+    def invalidate(self) -> None:
+        """Discard the cached value, so that the next call to :meth:`get` fetches it."""
+        with self._lock:
+            self._value = None
+            self._timestamp = None
+
+
 @contextmanager
 def cache_disabled(instance) -> Generator[None, None, None]:
     """
@@ -24,12 +24,19 @@ Functions
    :toctree: ../stubs/
 
     rebase
+    rebase_stream
+    is_flat_program
     insert_gate_def
     replace_gate_names
     add_stdgates_include
     remove_stdgates_include
     convert_qasm_pi_to_decimal
     normalize_qasm_gate_params
+    fold_constants
+    run_pipeline
+    evaluate_expression
+    optimize
+    peephole_optimize
 
 """
 from .compat import (
@@ -42,9 +49,15 @@ from .compat import (
     replace_gate_names,
 )
 from .decompose import rebase
+from .expressions import evaluate_expression
+from .peephole import optimize, peephole_optimize
+from .pipeline import fold_constants, run_pipeline
+from .streaming import is_flat_program, rebase_stream
 
 __all__ = [
     "rebase",
+    "rebase_stream",
+    "is_flat_program",
     "insert_gate_def",
     "replace_gate_names",
     "add_stdgates_include",
@@ -52,4 +65,9 @@ __all__ = [
     "remove_stdgates_include",
     "convert_qasm_pi_to_decimal",
     "normalize_qasm_gate_params",
+    "fold_constants",
+    "run_pipeline",
+    "evaluate_expression",
+    "optimize",
+    "peephole_optimize",
 ]
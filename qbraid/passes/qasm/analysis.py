@@ -0,0 +1,222 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module for extracting structural data from OpenQASM programs
+without converting them to another framework.
+
+"""
+from __future__ import annotations
+
+from typing import Any, Optional, Union
+
+from openqasm3 import ast, dumps
+from openqasm3.parser import parse
+
+from .expressions import literal_value
+from .pipeline import fold_constants
+
+RegisterLayout = dict[str, tuple[int, int]]
+
+Operand = Union[ast.Identifier, ast.IndexedIdentifier]
+
+
+def _declared_size(size: Optional[ast.Expression]) -> Optional[int]:
+    """Return the size of a register declaration, or None if it is not a literal."""
+    if size is None:
+        return 1
+    if isinstance(size, ast.IntegerLiteral):
+        return size.value
+    return None
+
+
+def register_layout(program: ast.Program) -> tuple[RegisterLayout, RegisterLayout]:
+    """Map each top-level qubit and bit register to its ``(offset, size)`` in a flat,
+    declaration-ordered index space.
+
+    Args:
+        program (openqasm3.ast.Program): The parsed program.
+
+    Returns:
+        tuple[dict[str, tuple[int, int]], dict[str, tuple[int, int]]]: The qubit and
+            classical bit register layouts.
+    """
+    qubits: RegisterLayout = {}
+    clbits: RegisterLayout = {}
+    num_qubits = num_clbits = 0
+
+    for statement in program.statements:
+        if isinstance(statement, ast.QubitDeclaration):
+            size = _declared_size(statement.size)
+            if size is not None:
+                qubits[statement.qubit.name] = (num_qubits, size)
+                num_qubits += size
+        elif isinstance(statement, ast.ClassicalDeclaration) and isinstance(
+            statement.type, ast.BitType
+        ):
+            size = _declared_size(statement.type.size)
+            if size is not None:
+                clbits[statement.identifier.name] = (num_clbits, size)
+                num_clbits += size
+
+    return qubits, clbits
+
+
+def _resolve_index(index: Any, size: int) -> Optional[list[int]]:
+    """Resolve a single register index expression to a list of positions."""
+    value = literal_value(index)
+    if isinstance(value, int):
+        return [value if value >= 0 else size + value]
+    if isinstance(index, ast.RangeDefinition):
+        start = 0 if index.start is None else literal_value(index.start)
+        end = size - 1 if index.end is None else literal_value(index.end)
+        step = 1 if index.step is None else literal_value(index.step)
+        if all(isinstance(item, int) for item in (start, end, step)) and step != 0:
+            return list(range(start, end + (1 if step > 0 else -1), step))
+    if isinstance(index, ast.DiscreteSet):
+        values = [literal_value(item) for item in index.values]
+        if all(isinstance(item, int) for item in values):
+            return values
+    return None
+
+
+def resolve_operand(operand: Operand, layout: RegisterLayout) -> Optional[list[int]]:
+    """Resolve a qubit or bit operand to flat indices using a register layout.
+
+    Args:
+        operand (Identifier | IndexedIdentifier): The operand to resolve.
+        layout (dict[str, tuple[int, int]]): Register layout from :func:`register_layout`.
+
+    Returns:
+        Optional[list[int]]: The flat indices referenced by the operand, or None if the
+            operand cannot be resolved statically.
+    """
+    if isinstance(operand, ast.Identifier):
+        if operand.name not in layout:
+            return None
+        offset, size = layout[operand.name]
+        return list(range(offset, offset + size))
+
+    if isinstance(operand, ast.IndexedIdentifier) and operand.name.name in layout:
+        offset, size = layout[operand.name.name]
+        if len(operand.indices) == 1 and len(operand.indices[0]) == 1:
+            positions = _resolve_index(operand.indices[0][0], size)
+            if positions is not None:
+                return [offset + position for position in positions]
+
+    return None
+
+
+def _broadcast(operands: list[list[int]]) -> Optional[list[list[int]]]:
+    """Expand register-level operands into per-index operand groups."""
+    width = max((len(indices) for indices in operands), default=1)
+    if any(len(indices) not in (1, width) for indices in operands):
+        return None
+    return [
+        [indices[0] if len(indices) == 1 else indices[i] for indices in operands]
+        for i in range(width)
+    ]
+
+
+def _gate_name(statement: ast.QuantumGate) -> str:
+    """Return the gate name, prefixed with any gate modifiers."""
+    prefix = ""
+    for modifier in statement.modifiers:
+        prefix += modifier.modifier.name
+        if modifier.argument is not None:
+            prefix += f"({dumps(modifier.argument)})"
+        prefix += "@"
+    return prefix + statement.name.name
+
+
+def _param_value(argument: ast.Expression) -> Union[int, float, str]:
+    """Return the numeric value of a folded argument, or its source text."""
+    value = literal_value(argument)
+    return dumps(argument) if value is None else value
+
+
+def _opaque(statement: ast.Statement) -> list[Any]:
+    """Canonical entry for a statement that is not resolved into individual operations."""
+    return [type(statement).__name__, [dumps(statement).strip()], [], []]
+
+
+def _canonical_statement(
+    statement: ast.Statement, qubits: RegisterLayout, clbits: RegisterLayout
+) -> list[list[Any]]:
+    """Return the canonical gate entries of a single top-level statement."""
+    if isinstance(statement, (ast.Include, ast.QubitDeclaration)):
+        return []
+
+    if isinstance(statement, ast.ClassicalDeclaration) and isinstance(statement.type, ast.BitType):
+        return [] if statement.init_expression is None else [_opaque(statement)]
+
+    if isinstance(statement, ast.QuantumGate):
+        operands = [resolve_operand(qubit, qubits) for qubit in statement.qubits]
+        groups = None if None in operands else _broadcast(operands)
+        if groups is None:
+            return [_opaque(statement)]
+        name = _gate_name(statement)
+        params = [_param_value(argument) for argument in statement.arguments]
+        return [[name, params, group, []] for group in groups]
+
+    if isinstance(statement, ast.QuantumMeasurementStatement):
+        operands = [resolve_operand(statement.measure.qubit, qubits)]
+        if statement.target is not None:
+            operands.append(resolve_operand(statement.target, clbits))
+        groups = None if None in operands else _broadcast(operands)
+        if groups is None:
+            return [_opaque(statement)]
+        return [["measure", [], group[:1], group[1:]] for group in groups]
+
+    if isinstance(statement, ast.QuantumReset):
+        indices = resolve_operand(statement.qubits, qubits)
+        if indices is None:
+            return [_opaque(statement)]
+        return [["reset", [], [index], []] for index in indices]
+
+    if isinstance(statement, ast.QuantumBarrier):
+        operands = [resolve_operand(qubit, qubits) for qubit in statement.qubits]
+        if None in operands:
+            return [_opaque(statement)]
+        return [["barrier", [], [index for indices in operands for index in indices], []]]
+
+    return [_opaque(statement)]
+
+
+def canonical_gates(qasm: str) -> list[list[Any]]:
+    """Return a canonical gate-list view of an OpenQASM 2 or 3 program.
+
+    Each entry is ``[name, params, qubits, clbits]``, where ``qubits`` and ``clbits``
+    are flat indices in register declaration order, register-level operations are
+    broadcast into one entry per index, and constant parameter expressions are folded
+    into numeric values. Statements that cannot be resolved statically (e.g. gate
+    definitions or control flow) are represented by their normalized source text.
+
+    Args:
+        qasm (str): The OpenQASM program string.
+
+    Returns:
+        list[list]: The canonical gate entries.
+    """
+    program = fold_constants(parse(qasm))
+    qubits, clbits = register_layout(program)
+
+    gates = []
+    for statement in program.statements:
+        gates.extend(_canonical_statement(statement, qubits, clbits))
+
+    return gates
+
+
+__all__ = ["canonical_gates", "register_layout", "resolve_operand"]
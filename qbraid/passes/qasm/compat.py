@@ -20,12 +20,18 @@ across various other quantum software frameworks.
 import math
 import re
 from functools import reduce
+from typing import Optional
 
 from openqasm3 import dumps, parse
-from openqasm3.ast import Program, QuantumGate, Statement
-from openqasm3.parser import QASM3ParsingError
+from openqasm3.ast import BinaryExpression, Expression, Program, QuantumGate, Statement
 
-from qbraid._logging import logger
+from .expressions import (
+    PRECEDENCE,
+    evaluate,
+    evaluate_expression,
+    parse_expression,
+    top_precedence,
+)
 
 GATE_DEFINITIONS = {
     "iswap": """
@@ -208,11 +214,10 @@ def remove_stdgates_include(qasm: str) -> str:
 def _evaluate_expression(match):
     """Helper function for simplifying arithmetic expressions within parentheses."""
     expr = match.group(1)
-    try:
-        simplified_value = eval(expr)  # pylint: disable=eval-used
-        return f"({simplified_value})"
-    except SyntaxError:
+    simplified_value = evaluate_expression(expr)
+    if simplified_value is None:
         return match.group(0)
+    return f"({simplified_value})"
 
 
 def simplify_arithmetic_expressions(qasm_str: str) -> str:
@@ -223,38 +228,93 @@ def simplify_arithmetic_expressions(qasm_str: str) -> str:
     return re.sub(pattern, _evaluate_expression, qasm_str)
 
 
-def convert_qasm_pi_to_decimal(qasm: str) -> str:
-    """Convert all instances of 'pi' in the QASM string to their decimal value."""
+_PI_PATTERN = re.compile(r"(?<![\w.])(\d*\.?\d*\s*[*/+-]\s*)?pi(\s*[*/+-]\s*\d*\.?\d*)?(?![\w])")
+
+_OPERAND_END = re.compile(r"[\w.)\]]")
+
+
+def _skip_whitespace(text: str, index: int, step: int) -> int:
+    """Return the index of the first non-whitespace character from ``index`` in the
+    direction of ``step``, or an out-of-range index if there is none."""
+    while 0 <= index < len(text) and text[index].isspace():
+        index += step
+    return index
 
-    pattern = r"(?<![a-zA-Z])(\d*\.?\d*\s*[*/+-]\s*)?pi(\s*[*/+-]\s*\d*\.?\d*)?(?![a-zA-Z])"
 
-    gate_defs = set()
+def _adjacent_operators(qasm: str, start: int, end: int) -> tuple[Optional[str], Optional[str]]:
+    """Return the operators directly before and after a span of a QASM string.
+
+    A sign before the span is returned as ``"unary-"`` or ``"unary+"``, and
+    ``"operand"`` is returned if the span directly follows an operand.
+    """
+    previous = None
+    index = _skip_whitespace(qasm, start - 1, -1)
+    if index >= 0 and _OPERAND_END.match(qasm[index]):
+        previous = "operand"
+    elif index >= 0 and qasm[index] in "+-*/%":
+        operand = _skip_whitespace(qasm, index - 1, -1)
+        if operand >= 0 and _OPERAND_END.match(qasm[operand]):
+            previous = qasm[index]
+        else:
+            previous = "unary" + qasm[index]
+
+    index = _skip_whitespace(qasm, end, 1)
+    following = qasm[index : index + 2] if qasm.startswith("**", index) else qasm[index : index + 1]
+    return previous, following or None
+
+
+def _can_fold(node: Expression, previous: Optional[str], following: Optional[str]) -> bool:
+    """Whether replacing a sub-expression by its value preserves the value of the
+    enclosing expression, given the operators directly around it."""
+    precedence = top_precedence(node)
+    top = node.op.name if isinstance(node, BinaryExpression) else None
+
+    if following in PRECEDENCE and PRECEDENCE[following] > precedence:
+        return False
+
+    if previous in (None, "unary+"):
+        return True
+    if previous == "unary-":
+        return precedence >= PRECEDENCE["*"] and top != "%"
+    if previous in ("+", "*"):
+        # associative: x + (a - b) == (x + a) - b and x * (a / b) == (x * a) / b
+        return precedence >= PRECEDENCE[previous] and top != "%"
+    if previous in PRECEDENCE:
+        return precedence > PRECEDENCE[previous]
+    return False
+
+
+def _fold_pi_expression(qasm: str, match: re.Match) -> str:
+    """Return the replacement text for an arithmetic expression containing ``pi``."""
+    expr = match.group()
+    previous, following = _adjacent_operators(qasm, *match.span())
+
+    if expr == "pi" and following is not None and (following.isalpha() or following in "_("):
+        return expr  # gate or subroutine named 'pi'
 
     try:
-        program = parse(qasm)
-
-        for statement in program.statements:
-            if isinstance(statement, QuantumGate):
-                name = statement.name.name
-                if "pi" in name:
-                    gate_defs.add(name)
-    except QASM3ParsingError as err:
-        logger.debug("Failed to parse QASM program for pi conversion: %s", err)
-
-    def replace_with_decimal(match: re.Match) -> str:
-        expr: str = match.group()
-        start = match.start()
-        end = match.end()
-
-        for gate_def in gate_defs:
-            if gate_def in qasm[max(0, start - len(gate_def)) : end]:
-                return expr  # pragma: no cover
-
-        expr_with_pi_as_decimal = expr.replace("pi", str(math.pi))
-        value = eval(expr_with_pi_as_decimal)  # pylint: disable=eval-used
-        return str(value)
-
-    return re.sub(pattern, replace_with_decimal, qasm)
+        node = parse_expression(expr)
+    except ValueError:
+        node = None
+
+    if node is not None and _can_fold(node, previous, following):
+        value = evaluate(node)
+        if value is not None:
+            return str(value)
+
+    # Otherwise, only substitute the value of pi itself
+    prefix = match.group(1) or ""
+    return prefix + expr[len(prefix) :].replace("pi", str(math.pi), 1)
+
+
+def convert_qasm_pi_to_decimal(qasm: str) -> str:
+    """Convert all instances of 'pi' in the QASM string to their decimal value.
+
+    Constant arithmetic directly around ``pi`` (e.g. ``3*pi/4``) is evaluated along
+    with it, as long as doing so does not change operator precedence in the
+    enclosing expression.
+    """
+    return _PI_PATTERN.sub(lambda match: _fold_pi_expression(qasm, match), qasm)
 
 
 def has_redundant_parentheses(qasm_str: str) -> bool:
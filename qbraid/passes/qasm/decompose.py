@@ -13,211 +13,372 @@
 # limitations under the License.
 
 """
-Module for providing transforamtions with basis gates.
-across various other quantum software frameworks.
+Module for decomposing OpenQASM programs into a basis gate set using a table
+of gate decomposition rules.
 
 """
-from typing import Optional, Union
+from __future__ import annotations
 
-from openqasm3 import ast, dumps
-from openqasm3.parser import QASM3ParsingError, parse
+import copy
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, Optional, Union
+
+from openqasm3 import ast
 
 from qbraid.passes.exceptions import CompilationError, QasmDecompositionError
 
-from .compat import _replace_gate_names, declarations_to_qasm2
+from .compat import _replace_gate_names
+from .expressions import parse_expression
+from .pipeline import QasmPass, fold_constants, run_pipeline
 
+# Gate expansion, as (gate name, parameter expressions, qubit operand indices) triples.
+# Parameter expressions refer to the arguments of the expanded gate by placeholder
+# identifiers '#0', '#1', ..., which cannot appear in a parsed program.
+Expansion = tuple[tuple[str, tuple[ast.Expression, ...], tuple[int, ...]], ...]
 
-def _decompose_crx(gate: ast.QuantumGate) -> list[ast.Statement]:
-    """Decompose a crx gate into its basic gate equivalents."""
-    theta = gate.arguments[0]
-    control = gate.qubits[0]
-    target = gate.qubits[1]
 
-    rz_pos_pi_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="rz"),
-        arguments=[
-            ast.BinaryExpression(
-                op=ast.BinaryOperator(17),
-                lhs=ast.Identifier(name="pi"),
-                rhs=ast.FloatLiteral(value=2),
-            )
-        ],
-        qubits=[target],
-    )
-    ry_pos_theta_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="ry"),
-        arguments=[
-            ast.BinaryExpression(
-                op=ast.BinaryOperator(17), lhs=theta, rhs=ast.FloatLiteral(value=2)
-            )
-        ],
-        qubits=[target],
-    )
-    cx = ast.QuantumGate(
-        modifiers=[], name=ast.Identifier(name="cx"), arguments=[], qubits=[control, target]
-    )
-    ry_neg_theta_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="ry"),
-        arguments=[
-            ast.BinaryExpression(
-                op=ast.BinaryOperator(17),
-                lhs=ast.UnaryExpression(ast.UnaryOperator(3), theta),
-                rhs=ast.FloatLiteral(value=2),
-            )
-        ],
-        qubits=[target],
-    )
-    rz_neg_pi_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="rz"),
-        arguments=[
-            ast.BinaryExpression(
-                op=ast.BinaryOperator(17),
-                lhs=ast.UnaryExpression(ast.UnaryOperator(3), ast.Identifier(name="pi")),
-                rhs=ast.FloatLiteral(value=2),
+@dataclass(frozen=True)
+class DecompositionRule:
+    """Exact decomposition of a gate into a sequence of other gates.
+
+    Attributes:
+        params (tuple[str, ...]): Names of the gate parameters.
+        num_qubits (int): Number of qubit operands of the gate.
+        body (tuple[tuple[str, tuple[str, ...], tuple[int, ...]], ...]): The gate sequence,
+            as ``(gate name, parameter expressions, qubit operand indices)`` triples. The
+            parameter expressions may refer to the gate parameters and the built-in constants.
+    """
+
+    params: tuple[str, ...]
+    num_qubits: int
+    body: tuple[tuple[str, tuple[str, ...], tuple[int, ...]], ...]
+
+
+# Alternative rules for each gate are tried in order. Rules must not be cyclic.
+DECOMPOSITION_RULES: dict[str, tuple[DecompositionRule, ...]] = {
+    "crx": (
+        DecompositionRule(
+            ("theta",),
+            2,
+            (
+                ("rz", ("pi / 2",), (1,)),
+                ("ry", ("theta / 2",), (1,)),
+                ("cx", (), (0, 1)),
+                ("ry", ("-theta / 2",), (1,)),
+                ("cx", (), (0, 1)),
+                ("rz", ("-pi / 2",), (1,)),
+            ),
+        ),
+    ),
+    "cry": (
+        DecompositionRule(
+            ("theta",),
+            2,
+            (
+                ("ry", ("theta / 2",), (1,)),
+                ("cx", (), (0, 1)),
+                ("ry", ("-(theta / 2)",), (1,)),
+                ("cx", (), (0, 1)),
+            ),
+        ),
+    ),
+    "crz": (
+        DecompositionRule(
+            ("theta",),
+            2,
+            (
+                ("rz", ("theta / 2",), (1,)),
+                ("cx", (), (0, 1)),
+                ("rz", ("-(theta / 2)",), (1,)),
+                ("cx", (), (0, 1)),
+            ),
+        ),
+    ),
+    "cy": (
+        DecompositionRule((), 2, (("cry", ("pi",), (0, 1)), ("s", (), (0,)))),
+        DecompositionRule((), 2, (("sdg", (), (1,)), ("cx", (), (0, 1)), ("s", (), (1,)))),
+    ),
+    "cz": (
+        DecompositionRule((), 2, (("crz", ("pi",), (0, 1)), ("s", (), (0,)))),
+        DecompositionRule((), 2, (("h", (), (1,)), ("cx", (), (0, 1)), ("h", (), (1,)))),
+    ),
+    "cp": (
+        DecompositionRule(
+            ("lambda",),
+            2,
+            (
+                ("p", ("lambda / 2",), (0,)),
+                ("cx", (), (0, 1)),
+                ("p", ("-(lambda / 2)",), (1,)),
+                ("cx", (), (0, 1)),
+                ("p", ("lambda / 2",), (1,)),
+            ),
+        ),
+    ),
+    "rzz": (
+        DecompositionRule(
+            ("theta",), 2, (("cx", (), (0, 1)), ("rz", ("theta",), (1,)), ("cx", (), (0, 1)))
+        ),
+    ),
+    "swap": (
+        DecompositionRule((), 2, (("cx", (), (0, 1)), ("cx", (), (1, 0)), ("cx", (), (0, 1)))),
+    ),
+}
+
+# Gates expanded when no basis is given. Other rules only apply when a target basis
+# does not contain the gate.
+LEGACY_DECOMPOSITIONS = frozenset({"crx", "cry", "crz", "cy", "cz"})
+
+# Statement fields holding nested statement lists.
+_BLOCK_FIELDS: dict[type, tuple[str, ...]] = {
+    ast.QuantumGateDefinition: ("body",),
+    ast.SubroutineDefinition: ("body",),
+    ast.ForInLoop: ("block",),
+    ast.WhileLoop: ("block",),
+    ast.BranchingStatement: ("if_block", "else_block"),
+    ast.Box: ("body",),
+    ast.CompoundStatement: ("statements",),
+}
+
+
+def _substitute(node: ast.Expression, bindings: dict[str, ast.Expression]) -> ast.Expression:
+    """Copy an expression template, replacing the bound identifiers."""
+    if isinstance(node, ast.Identifier):
+        return bindings[node.name] if node.name in bindings else ast.Identifier(node.name)
+    if isinstance(node, ast.BinaryExpression):
+        return ast.BinaryExpression(
+            op=node.op, lhs=_substitute(node.lhs, bindings), rhs=_substitute(node.rhs, bindings)
+        )
+    if isinstance(node, ast.UnaryExpression):
+        return ast.UnaryExpression(op=node.op, expression=_substitute(node.expression, bindings))
+    return copy.copy(node)
+
+
+def _placeholders(arguments: tuple[ast.Expression, ...]) -> dict[str, ast.Expression]:
+    return {f"#{index}": argument for index, argument in enumerate(arguments)}
+
+
+def _expand_rule(rule: DecompositionRule, basis: Optional[frozenset[str]]) -> Optional[Expansion]:
+    """Flatten a rule into an expansion over the basis, or return None if one of its
+    gates cannot be decomposed into the basis."""
+    formals = {name: ast.Identifier(f"#{index}") for index, name in enumerate(rule.params)}
+    expansion = []
+    for name, params, qubits in rule.body:
+        arguments = tuple(_substitute(parse_expression(param), formals) for param in params)
+        inner = _expand(name, len(arguments), len(qubits), basis)
+        if inner is None:
+            if basis is not None and name not in basis:
+                return None
+            expansion.append((name, arguments, qubits))
+            continue
+        bindings = _placeholders(arguments)
+        for inner_name, inner_arguments, inner_qubits in inner:
+            expansion.append(
+                (
+                    inner_name,
+                    tuple(_substitute(arg, bindings) for arg in inner_arguments),
+                    tuple(qubits[index] for index in inner_qubits),
+                )
             )
-        ],
-        qubits=[target],
-    )
-    return [rz_pos_pi_half, ry_pos_theta_half, cx, ry_neg_theta_half, cx, rz_neg_pi_half]
+    return tuple(expansion)
 
 
-def _decompose_cry(gate: ast.QuantumGate) -> list[ast.Statement]:
-    """Decompose a cry gate into its basic gate equivalents."""
-    theta = gate.arguments[0]
-    control = gate.qubits[0]
-    target = gate.qubits[1]
+@lru_cache(maxsize=1024)
+def _expand(
+    name: str, num_params: int, num_qubits: int, basis: Optional[frozenset[str]]
+) -> Optional[Expansion]:
+    """Return the memoized expansion of a gate into the basis.
 
-    ry_pos_theta_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="ry"),
-        arguments=[
-            ast.BinaryExpression(
-                op=ast.BinaryOperator(17), lhs=theta, rhs=ast.FloatLiteral(value=2)
-            )
-        ],
-        qubits=[target],
-    )
-    cx = ast.QuantumGate(
-        modifiers=[], name=ast.Identifier(name="cx"), arguments=[], qubits=[control, target]
-    )
-    ry_neg_theta_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="ry"),
-        arguments=[
-            ast.UnaryExpression(
-                ast.UnaryOperator(3),
-                ast.BinaryExpression(
-                    op=ast.BinaryOperator(17), lhs=theta, rhs=ast.FloatLiteral(value=2)
-                ),
-            )
-        ],
-        qubits=[target],
-    )
-    return [ry_pos_theta_half, cx, ry_neg_theta_half, cx]
+    Returns:
+        Optional[Expansion]: The expansion, or None if the gate is in the basis or
+            cannot be decomposed into it. If no basis is given, only the gates in
+            :data:`LEGACY_DECOMPOSITIONS` are expanded.
 
+    Raises:
+        ValueError: If the gate has decomposition rules, but none for the given
+            number of parameters and qubits.
+    """
+    if basis is None:
+        if name not in LEGACY_DECOMPOSITIONS:
+            return None
+    elif name in basis:
+        return None
+
+    rules = DECOMPOSITION_RULES.get(name, ())
+    candidates = [
+        rule for rule in rules if len(rule.params) == num_params and rule.num_qubits == num_qubits
+    ]
+    if rules and not candidates:
+        raise ValueError(
+            f"Cannot decompose gate '{name}' with {num_params} parameter(s) "
+            f"and {num_qubits} qubit(s)."
+        )
+
+    for rule in candidates:
+        expansion = _expand_rule(rule, basis)
+        if expansion is not None:
+            return expansion
+    return None
+
+
+def _decompose_gate(gate: ast.QuantumGate, basis: Optional[frozenset[str]]) -> list[ast.Statement]:
+    """Decompose a single gate application, leaving modified gates untouched."""
+    if gate.modifiers:
+        return [gate]
+
+    expansion = _expand(gate.name.name, len(gate.arguments), len(gate.qubits), basis)
+    if expansion is None:
+        return [gate]
+
+    bindings = _placeholders(gate.arguments)
+    return [
+        ast.QuantumGate(
+            modifiers=[],
+            name=ast.Identifier(name=name),
+            arguments=[_substitute(arg, bindings) for arg in arguments],
+            qubits=[gate.qubits[index] for index in qubits],
+        )
+        for name, arguments, qubits in expansion
+    ]
+
+
+def _decompose_statements(
+    statements: list[ast.Statement], basis: Optional[frozenset[str]]
+) -> list[ast.Statement]:
+    """Decompose the gates in a list of statements, descending into compound statements."""
+    transformed_statements = []
+    for statement in statements:
+        if isinstance(statement, ast.QuantumGate):
+            transformed_statements.extend(_decompose_gate(statement, basis))
+            continue
 
-def _decompose_crz(gate: ast.QuantumGate) -> list[ast.Statement]:
-    """Decompose a cry gate into its basic gate equivalents."""
-    theta = gate.arguments[0]
-    control = gate.qubits[0]
-    target = gate.qubits[1]
+        fields = _BLOCK_FIELDS.get(type(statement))
+        if fields is not None:
+            statement = copy.copy(statement)
+            for field in fields:
+                setattr(statement, field, _decompose_statements(getattr(statement, field), basis))
+        transformed_statements.append(statement)
 
-    rz_pos_theta_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="rz"),
-        arguments=[
-            ast.BinaryExpression(
-                op=ast.BinaryOperator(17), lhs=theta, rhs=ast.FloatLiteral(value=2)
-            )
-        ],
-        qubits=[target],
-    )
-    cx = ast.QuantumGate(
-        modifiers=[], name=ast.Identifier(name="cx"), arguments=[], qubits=[control, target]
-    )
-    rz_neg_theta_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="rz"),
-        arguments=[
-            ast.UnaryExpression(
-                ast.UnaryOperator(3),
-                ast.BinaryExpression(
-                    op=ast.BinaryOperator(17), lhs=theta, rhs=ast.FloatLiteral(value=2)
-                ),
+    return transformed_statements
+
+
+def decompose(program: ast.Program, gateset: Optional[set[str]] = None) -> ast.Program:
+    """Decompose a program into its basic gate equivalents.
+
+    Gates are expanded using :data:`DECOMPOSITION_RULES`, searching recursively for a
+    sequence of rules that reaches the given gate set. Expansions are memoized per gate
+    name, number of parameters and qubits, and gate set, so each distinct gate is only
+    resolved once. Gates inside gate and subroutine definitions, loops, branches and
+    boxes are decomposed as well. Gates with modifiers are left unchanged.
+
+    Args:
+        program (openqasm3.ast.Program): The program to decompose.
+        gateset (Optional[set[str]]): The target basis gates. Gates that are in the gate
+            set, or cannot be decomposed into it, are left unchanged. If not given, only
+            the gates in :data:`LEGACY_DECOMPOSITIONS` are expanded.
+
+    Returns:
+        openqasm3.ast.Program: The decomposed program.
+    """
+    basis = frozenset(gateset) if gateset else None
+    statements = _decompose_statements(program.statements, basis)
+    return ast.Program(statements=statements, version=program.version)
+
+
+def _iter_gates(statements: list[ast.Statement]) -> Iterator[ast.QuantumGate]:
+    """Yield the gates applied by a list of statements, including those nested in
+    control flow and subroutines, but not the bodies of gate definitions."""
+    for statement in statements:
+        if isinstance(statement, ast.QuantumGate):
+            yield statement
+        elif not isinstance(statement, ast.QuantumGateDefinition):
+            for field in _BLOCK_FIELDS.get(type(statement), ()):
+                yield from _iter_gates(getattr(statement, field))
+
+
+def assert_gates_in_basis(program: ast.Program, gateset: set[str]) -> None:
+    """Verify that the program is represented only by gates in the given basis gate set."""
+    for statement in _iter_gates(program.statements):
+        gate_name = statement.name.name
+        if gate_name not in gateset:
+            raise ValueError(
+                f"OpenQASM program uses gate '{gate_name}' which is not in the basis gate set."
             )
-        ],
-        qubits=[target],
-    )
-    return [rz_pos_theta_half, cx, rz_neg_theta_half, cx]
 
 
-def _decompose_cy(gate: ast.QuantumGate, *args) -> list[ast.Statement]:
-    """Decompose a cy gate into its basic gate equivalents."""
-    control = gate.qubits[0]
-    target = gate.qubits[1]
+def _decompose_pass(gateset: set[str]) -> QasmPass:
+    """Return a pipeline pass that decomposes gates not in the given gate set."""
 
-    cry_pi = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="cry"),
-        arguments=[ast.Identifier(name="pi")],
-        qubits=[control, target],
-    )
-    s = ast.QuantumGate(modifiers=[], name=ast.Identifier(name="s"), arguments=[], qubits=[control])
-    return decompose(ast.Program(statements=[cry_pi, s]), *args).statements
+    def decompose_pass(program: ast.Program) -> ast.Program:
+        try:
+            return decompose(program, gateset)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            raise QasmDecompositionError from err
 
+    return decompose_pass
 
-def _decompose_cz(gate: ast.QuantumGate) -> list[ast.Statement]:
-    """Decompose a cz gate into its basic gate equivalents."""
-    control = gate.qubits[0]
-    target = gate.qubits[1]
 
-    crz_pi = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="crz"),
-        arguments=[ast.Identifier(name="pi")],
-        qubits=[control, target],
-    )
-    s = ast.QuantumGate(modifiers=[], name=ast.Identifier(name="s"), arguments=[], qubits=[control])
-    return decompose(ast.Program(statements=[crz_pi, s])).statements
+def _replace_gate_names_pass(gate_mappings: dict[str, str], case_sensitive: bool) -> QasmPass:
+    """Return a pipeline pass that renames gates according to the given mappings."""
 
+    def replace_gate_names_pass(program: ast.Program) -> ast.Program:
+        return _replace_gate_names(program, gate_mappings, case_sensitive)
 
-def decompose(program: ast.Program, gateset: Optional[set[str]] = None) -> ast.Program:
-    """Decompose a program into its basic gate equivalents."""
-    decomposition_map = {
-        "crx": _decompose_crx,
-        "cry": _decompose_cry,
-        "crz": _decompose_crz,
-        "cy": _decompose_cy,
-        "cz": _decompose_cz,
-    }
+    return replace_gate_names_pass
 
-    transformed_statements = []
-    for statement in program.statements:
-        if isinstance(statement, ast.QuantumGate):
-            gate_name = statement.name.name
-            if gate_name in decomposition_map and (gateset is None or gate_name not in gateset):
-                transformed_statements.extend(decomposition_map[gate_name](statement))
-            else:
-                transformed_statements.append(statement)
+
+def _assert_gates_in_basis_pass(gateset: set[str]) -> QasmPass:
+    """Return a pipeline pass that checks the program only uses gates in the given gate set."""
+
+    def assert_gates_in_basis_pass(program: ast.Program) -> ast.Program:
+        try:
+            assert_gates_in_basis(program, gateset)
+        except ValueError as err:
+            raise CompilationError(
+                "Rebasing the specified quantum program to the provided "
+                f"basis gate set {gateset} is not supported."
+            ) from err
+        return program
+
+    return assert_gates_in_basis_pass
+
+
+def _rebase_passes(
+    gateset: Union[set[str], str],
+    require_predicates: bool,
+    gate_mappings: Optional[dict[str, str]],
+    case_sensitive: bool,
+    normalize_params: bool,
+) -> list[QasmPass]:
+    """Validate the basis gate set and return the AST passes applied by :func:`rebase`."""
+    # Validate basis gates
+    if isinstance(gateset, set):
+        if len(gateset) == 0:
+            raise ValueError("Basis gate set cannot be empty.")
+    elif isinstance(gateset, str):
+        if gateset.lower() == "any":
+            gateset = set()
         else:
-            transformed_statements.append(statement)
+            raise ValueError("Invalid basis gate set identifier.")
+    else:
+        raise TypeError("Basis gate set must be a set of strings or a string identifier.")
 
-    return ast.Program(statements=transformed_statements, version=program.version)
+    passes = [_decompose_pass(gateset)]
 
+    if gate_mappings is not None:
+        passes.append(_replace_gate_names_pass(gate_mappings, case_sensitive))
+        if require_predicates:
+            gateset = {gate_mappings.get(gate, gate) for gate in gateset}
 
-def assert_gates_in_basis(program: ast.Program, gateset: set[str]) -> None:
-    """Verify that the program is represented only by gates in the given basis gate set."""
-    for statement in program.statements:
-        if isinstance(statement, ast.QuantumGate):
-            gate_name = statement.name.name
-            if gate_name not in gateset:
-                raise ValueError(
-                    f"OpenQASM program uses gate '{gate_name}' which is not in the basis gate set."
-                )
+    # Check if the program meets the compilation predicates
+    if len(gateset) > 0:
+        passes.append(_assert_gates_in_basis_pass(gateset))
+
+    if normalize_params:
+        passes.append(fold_constants)
+
+    return passes
 
 
 def rebase(
@@ -226,10 +387,14 @@ def rebase(
     require_predicates: bool = True,
     gate_mappings: Optional[dict[str, str]] = None,
     case_sensitive: bool = False,
+    normalize_params: bool = False,
 ) -> str:
     """
     Rebases an OpenQASM 3 program according to a given basis gate set.
 
+    The decomposition, gate renaming, and (optionally) gate parameter normalization
+    are applied as AST passes in a single parse-transform-dump cycle.
+
     Args:
         qasm (str): The original OpenQASM 3 program as a string.
         gateset (set[str]): The target basis gates to decompose the program to.
@@ -237,6 +402,8 @@ def rebase(
             predicates. If False, returns the original program on failure. Defaults to True.
         gate_mappings (dict[str, str]): A dictionary mapping gate names to new gate names.
         case_sensitive (bool): If True, the gate mappings are case-sensitive. Defaults to False.
+        normalize_params (bool): If True, constant gate parameter expressions (e.g. ``pi / 2``)
+            are folded into decimal values. Defaults to False.
 
     Returns:
         str: The decomposed OpenQASM 3 program.
@@ -248,54 +415,23 @@ def rebase(
         CompilationError: If the program cannot be rebased to the provided basis gate set
 
     """
-    # Validate basis gates
-    if isinstance(gateset, set):
-        if len(gateset) == 0:
-            raise ValueError("Basis gate set cannot be empty.")
-    elif isinstance(gateset, str):
-        if gateset.lower() == "any":
-            gateset = set()
-        else:
-            raise ValueError("Invalid basis gate set identifier.")
-    else:
-        raise TypeError("Basis gate set must be a set of strings or a string identifier.")
-
-    # Parse program and apply decomposition(s)
-    try:
-        program = parse(qasm)
-    except QASM3ParsingError as err:
-        raise ValueError("Invalid OpenQASM program.") from err
-
-    try:
-        converted_program = decompose(program, gateset)
-    except Exception as err:  # pylint: disable=broad-exception-caught
-        raise QasmDecompositionError from err
-
-    if gate_mappings is not None:
-        converted_program = _replace_gate_names(converted_program, gate_mappings, case_sensitive)
-        if require_predicates:
-            gateset = {gate_mappings.get(gate, gate) for gate in gateset}
+    passes = _rebase_passes(
+        gateset, require_predicates, gate_mappings, case_sensitive, normalize_params
+    )
 
-    # Check if the program meets the compilation predicates
     try:
-        if len(gateset) > 0:
-            assert_gates_in_basis(converted_program, gateset)
-    except ValueError as err:
+        return run_pipeline(qasm, passes)
+    except CompilationError:
         if require_predicates:
-            raise CompilationError(
-                "Rebasing the specified quantum program to the provided "
-                f"basis gate set {gateset} is not supported."
-            ) from err
-
-        return qasm
-
-    version_major = converted_program.version.split(".")[0]
-    qasm = dumps(converted_program)
-
-    if int(version_major) == 2:
-        qasm = declarations_to_qasm2(qasm)
+            raise
 
-    return qasm
+    return run_pipeline(qasm, [fold_constants]) if normalize_params else qasm
 
 
-__all__ = ["decompose", "rebase", "assert_gates_in_basis"]
+__all__ = [
+    "DECOMPOSITION_RULES",
+    "DecompositionRule",
+    "decompose",
+    "rebase",
+    "assert_gates_in_basis",
+]
@@ -0,0 +1,292 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module for parsing and evaluating constant OpenQASM arithmetic expressions
+without the use of ``eval``.
+
+"""
+from __future__ import annotations
+
+import math
+import operator
+import re
+from functools import lru_cache
+from typing import Any, Callable, Optional, Union
+
+from openqasm3 import ast
+
+Number = Union[int, float]
+
+CONSTANTS: dict[str, float] = {
+    "pi": math.pi,
+    "π": math.pi,
+    "tau": math.tau,
+    "τ": math.tau,
+    "euler": math.e,
+    "ℇ": math.e,
+}
+
+_BINARY_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "**": operator.pow,
+}
+
+# Binding strength of each binary operator, used to decide where parentheses are needed.
+PRECEDENCE: dict[str, int] = {"+": 1, "-": 1, "*": 2, "/": 2, "%": 2, "**": 4}
+
+# Largest integer exponent that is evaluated exactly; larger powers are left unevaluated.
+_MAX_INT_EXPONENT = 1024
+
+_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+    r"|(?P<name>[A-Za-z_πτℇ]\w*)"
+    r"|(?P<op>\*\*|[-+*/%()])"
+    r")"
+)
+
+
+def literal_value(node: ast.Expression) -> Optional[Number]:
+    """Return the numeric value of a folded literal node, or None if not constant."""
+    if isinstance(node, (ast.IntegerLiteral, ast.FloatLiteral)):
+        return node.value
+    if isinstance(node, ast.Identifier):
+        return CONSTANTS.get(node.name)
+    if (
+        isinstance(node, ast.UnaryExpression)
+        and node.op.name == "-"
+        and isinstance(node.expression, (ast.IntegerLiteral, ast.FloatLiteral))
+    ):
+        return -node.expression.value
+    return None
+
+
+def to_literal(value: Number) -> ast.Expression:
+    """Build a literal node for a folded value, keeping the sign outside of the literal."""
+    literal_type = ast.IntegerLiteral if isinstance(value, int) else ast.FloatLiteral
+    if value < 0:
+        return ast.UnaryExpression(op=ast.UnaryOperator["-"], expression=literal_type(-value))
+    return literal_type(value)
+
+
+def apply_binary(op: str, lhs: Number, rhs: Number, true_division: bool = True) -> Optional[Number]:
+    """Apply an arithmetic operator to two numbers.
+
+    Args:
+        op (str): The operator.
+        lhs (int | float): The left operand.
+        rhs (int | float): The right operand.
+        true_division (bool): Whether ``/`` on two integers is real division, as in gate
+            arguments. If False, integer division is not evaluated.
+
+    Returns:
+        Optional[int | float]: The result, or None if the operator is not arithmetic or
+            the result is undefined, non-real or too large to compute.
+    """
+    func = _BINARY_OPS.get(op)
+    if func is None:
+        return None
+    if op == "/" and not true_division and isinstance(lhs, int) and isinstance(rhs, int):
+        return None
+    if op == "**" and isinstance(lhs, int) and isinstance(rhs, int) and rhs > _MAX_INT_EXPONENT:
+        return None
+    try:
+        value = func(lhs, rhs)
+    except (ArithmeticError, ValueError):
+        return None
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        return None
+    return value
+
+
+def evaluate(node: ast.Expression) -> Optional[Number]:
+    """Evaluate a constant arithmetic expression node.
+
+    Supports integer and float literals, the built-in constants ``pi``, ``tau`` and
+    ``euler``, unary negation and the ``+ - * / % **`` binary operators.
+
+    Args:
+        node (openqasm3.ast.Expression): The expression to evaluate.
+
+    Returns:
+        Optional[int | float]: The value of the expression, or None if it is not constant.
+    """
+    if isinstance(node, ast.UnaryExpression):
+        if node.op.name != "-":
+            return None
+        value = evaluate(node.expression)
+        return None if value is None else -value
+    if isinstance(node, ast.BinaryExpression):
+        lhs = evaluate(node.lhs)
+        if lhs is None:
+            return None
+        rhs = evaluate(node.rhs)
+        if rhs is None:
+            return None
+        return apply_binary(node.op.name, lhs, rhs)
+    return literal_value(node)
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    """Split an arithmetic expression into ``(kind, text)`` tokens."""
+    tokens = []
+    position, end = 0, len(text.rstrip())
+    while position < end:
+        match = _TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid expression '{text}'.")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+class _ExpressionParser:
+    """Recursive descent parser for arithmetic expressions, following Python operator
+    precedence: ``**`` binds tighter than unary signs, which bind tighter than
+    ``* / %``, which bind tighter than ``+ -``."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.position = 0
+
+    def _peek(self) -> Optional[str]:
+        if self.position < len(self.tokens):
+            kind, value = self.tokens[self.position]
+            return value if kind == "op" else None
+        return None
+
+    def _error(self) -> ValueError:
+        return ValueError(f"Invalid expression '{self.text}'.")
+
+    def parse(self) -> ast.Expression:
+        """Parse the full token stream into a single expression."""
+        node = self._sum()
+        if self.position != len(self.tokens):
+            raise self._error()
+        return node
+
+    def _binary(self, operators: set[str], operand: Callable[[], ast.Expression]):
+        node = operand()
+        while self._peek() in operators:
+            op = self.tokens[self.position][1]
+            self.position += 1
+            node = ast.BinaryExpression(op=ast.BinaryOperator[op], lhs=node, rhs=operand())
+        return node
+
+    def _sum(self) -> ast.Expression:
+        return self._binary({"+", "-"}, self._product)
+
+    def _product(self) -> ast.Expression:
+        return self._binary({"*", "/", "%"}, self._unary)
+
+    def _unary(self) -> ast.Expression:
+        op = self._peek()
+        if op in ("+", "-"):
+            self.position += 1
+            operand = self._unary()
+            if op == "+":
+                return operand
+            return ast.UnaryExpression(op=ast.UnaryOperator["-"], expression=operand)
+        return self._power()
+
+    def _power(self) -> ast.Expression:
+        node = self._atom()
+        if self._peek() == "**":
+            self.position += 1
+            node = ast.BinaryExpression(op=ast.BinaryOperator["**"], lhs=node, rhs=self._unary())
+        return node
+
+    def _atom(self) -> ast.Expression:
+        if self.position >= len(self.tokens):
+            raise self._error()
+        kind, value = self.tokens[self.position]
+        self.position += 1
+        if kind == "number":
+            if any(char in value for char in ".eE"):
+                return ast.FloatLiteral(float(value))
+            if len(value) > 1 and value.startswith("0") and value.strip("0"):
+                raise self._error()  # leading zeros are ambiguous, e.g. '007'
+            return ast.IntegerLiteral(int(value))
+        if kind == "name":
+            return ast.Identifier(value)
+        if value == "(":
+            node = self._sum()
+            if self._peek() != ")":
+                raise self._error()
+            self.position += 1
+            return node
+        raise self._error()
+
+
+def parse_expression(text: str) -> ast.Expression:
+    """Parse an arithmetic expression string into an OpenQASM AST expression.
+
+    Args:
+        text (str): The expression, e.g. ``"-3 * pi / 4"``.
+
+    Returns:
+        openqasm3.ast.Expression: The parsed expression.
+
+    Raises:
+        ValueError: If the text is not a valid arithmetic expression.
+    """
+    return _ExpressionParser(text).parse()
+
+
+@lru_cache(maxsize=4096)
+def evaluate_expression(text: str) -> Optional[Number]:
+    """Evaluate a constant arithmetic expression string.
+
+    Results are cached, so repeated parameter expressions are only parsed once.
+
+    Args:
+        text (str): The expression, e.g. ``"-3 * pi / 4"``.
+
+    Returns:
+        Optional[int | float]: The value of the expression, or None if the text is not
+            a valid constant arithmetic expression.
+    """
+    try:
+        return evaluate(parse_expression(text))
+    except ValueError:
+        return None
+
+
+def top_precedence(node: ast.Expression) -> int:
+    """Return the binding strength of the outermost operator of an expression."""
+    if isinstance(node, ast.BinaryExpression):
+        return PRECEDENCE.get(node.op.name, 0)
+    if isinstance(node, ast.UnaryExpression):
+        return 3
+    return 5
+
+
+__all__ = [
+    "CONSTANTS",
+    "PRECEDENCE",
+    "apply_binary",
+    "evaluate",
+    "evaluate_expression",
+    "literal_value",
+    "parse_expression",
+    "to_literal",
+    "top_precedence",
+]
@@ -0,0 +1,294 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module for peephole optimization of OpenQASM programs: cancelling adjacent inverse
+gate pairs, merging adjacent rotations and removing identity gates.
+
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+from openqasm3 import ast
+
+from .analysis import RegisterLayout, register_layout, resolve_operand
+from .expressions import evaluate, to_literal
+from .pipeline import run_pipeline
+
+SELF_INVERSE_GATES = frozenset(
+    {"h", "x", "y", "z", "cx", "cnot", "cy", "cz", "ch", "swap", "ccx", "ccnot", "cswap"}
+)
+
+INVERSE_GATES = {"s": "sdg", "sdg": "s", "t": "tdg", "tdg": "t", "sx": "sxdg", "sxdg": "sx"}
+
+# Gates with a single angle parameter that compose additively and are the identity at zero.
+ROTATION_GATES = frozenset(
+    {
+        "rx",
+        "ry",
+        "rz",
+        "p",
+        "phase",
+        "u1",
+        "crx",
+        "cry",
+        "crz",
+        "cp",
+        "cphase",
+        "cu1",
+        "rxx",
+        "ryy",
+        "rzz",
+    }
+)
+
+IDENTITY_GATES = frozenset({"id", "i"})
+
+# Statements that do not act on qubits or change the value of gate parameters.
+# Classical declarations are handled separately, since they may be initialized by a
+# measurement or a subroutine call.
+_TRANSPARENT_STATEMENTS = (
+    ast.Include,
+    ast.QubitDeclaration,
+    ast.ConstantDeclaration,
+    ast.IODeclaration,
+    ast.QuantumGateDefinition,
+    ast.SubroutineDefinition,
+)
+
+# Tolerance below which a constant rotation angle is treated as zero.
+ANGLE_TOLERANCE = 1e-12
+
+
+def _resolve_qubits(operands: list[ast.Expression], layout: RegisterLayout) -> Optional[list[int]]:
+    """Resolve operands to flat qubit indices, or None if any operand is unresolvable."""
+    qubits = []
+    for operand in operands:
+        indices = resolve_operand(operand, layout)
+        if indices is None:
+            return None
+        qubits.extend(indices)
+    return qubits
+
+
+def _single_qubits(gate: ast.QuantumGate, layout: RegisterLayout) -> Optional[tuple[int, ...]]:
+    """Return the qubits of a gate that applies to one qubit per operand."""
+    qubits = []
+    for operand in gate.qubits:
+        indices = resolve_operand(operand, layout)
+        if indices is None or len(indices) != 1:
+            return None
+        qubits.append(indices[0])
+    return tuple(qubits) if len(set(qubits)) == len(qubits) else None
+
+
+def _is_zero(angle: ast.Expression) -> bool:
+    value = evaluate(angle)
+    return value is not None and abs(value) < ANGLE_TOLERANCE
+
+
+def _is_identity(gate: ast.QuantumGate) -> bool:
+    """Return True if the gate is an identity or a rotation by a zero angle."""
+    name = gate.name.name
+    if name in IDENTITY_GATES:
+        return True
+    return name in ROTATION_GATES and len(gate.arguments) == 1 and _is_zero(gate.arguments[0])
+
+
+def _cancels(first: ast.QuantumGate, second: ast.QuantumGate) -> bool:
+    """Return True if two gates applied to the same qubits multiply to the identity."""
+    if first.arguments or second.arguments:
+        return False
+    name = first.name.name
+    if name in SELF_INVERSE_GATES:
+        return second.name.name == name
+    return INVERSE_GATES.get(name) == second.name.name
+
+
+def _merge(first: ast.QuantumGate, second: ast.QuantumGate) -> Optional[ast.QuantumGate]:
+    """Merge two rotations about the same axis applied to the same qubits."""
+    name = first.name.name
+    if (
+        name not in ROTATION_GATES
+        or second.name.name != name
+        or len(first.arguments) != 1
+        or len(second.arguments) != 1
+    ):
+        return None
+
+    lhs, rhs = first.arguments[0], second.arguments[0]
+    lhs_value, rhs_value = evaluate(lhs), evaluate(rhs)
+    if lhs_value is not None and rhs_value is not None:
+        angle = to_literal(lhs_value + rhs_value)
+    else:
+        angle = ast.BinaryExpression(op=ast.BinaryOperator["+"], lhs=lhs, rhs=rhs)
+
+    return ast.QuantumGate(
+        modifiers=[], name=ast.Identifier(name), arguments=[angle], qubits=first.qubits
+    )
+
+
+def _combine(first: ast.QuantumGate, second: ast.QuantumGate) -> Optional[list[ast.QuantumGate]]:
+    """Combine two gates applied to the same qubits.
+
+    Returns:
+        Optional[list[ast.QuantumGate]]: The gates replacing the pair, which is empty
+            if they cancel, or None if the gates cannot be combined.
+    """
+    if _cancels(first, second):
+        return []
+    merged = _merge(first, second)
+    if merged is None:
+        return None
+    return [] if _is_identity(merged) else [merged]
+
+
+def _combine_with_previous(
+    gate: ast.QuantumGate,
+    qubits: tuple[int, ...],
+    statements: list[Optional[ast.Statement]],
+    gate_qubits: dict[int, tuple[int, ...]],
+    history: dict[int, list[int]],
+) -> bool:
+    """Combine a gate with the previous operation on its qubits, if that operation is a
+    gate on exactly the same qubits, updating the scan state in place.
+
+    Returns:
+        bool: True if the gate was cancelled or merged into the previous gate.
+    """
+    previous = history.get(qubits[0])
+    index = previous[-1] if previous else None
+    if (
+        index is None
+        or gate_qubits.get(index) != qubits
+        or any(history[qubit][-1] != index for qubit in qubits)
+    ):
+        return False
+
+    replacement = _combine(statements[index], gate)
+    if replacement is None:
+        return False
+
+    if replacement:
+        statements[index] = replacement[0]
+    else:
+        statements[index] = None
+        del gate_qubits[index]
+        for qubit in qubits:
+            history[qubit].pop()
+    return True
+
+
+def peephole_optimize(program: ast.Program) -> ast.Program:
+    """Remove redundant gates from a program in a single linear scan.
+
+    The pass tracks the most recent operation applied to each qubit. When a gate acts
+    on exactly the qubits of the previous gate on each of them, the two gates are
+    cancelled if they are inverses (e.g. ``h h``, ``cx cx``, ``s sdg``), or merged
+    if they are rotations about the same axis (e.g. ``rz(a) rz(b)`` becomes
+    ``rz(a + b)``). Identity gates and rotations by a zero angle are removed.
+    Cancellations cascade, so ``h x x h`` is removed entirely.
+
+    Only top-level gates without modifiers whose operands resolve to single qubits
+    are optimized. Measurements (including declarations initialized by a measurement),
+    resets and barriers block optimization on the qubits they act on, and a barrier
+    without operands, like other statements (e.g. control flow or classical
+    assignments), blocks optimization on all qubits.
+
+    Args:
+        program (openqasm3.ast.Program): The program to optimize.
+
+    Returns:
+        openqasm3.ast.Program: The optimized program.
+    """
+    layout, _ = register_layout(program)
+    statements: list[Optional[ast.Statement]] = []
+    # Qubits of the optimizable gates in 'statements', by index.
+    gate_qubits: dict[int, tuple[int, ...]] = {}
+    # Indices into 'statements' of the operations applied to each qubit, in order.
+    history: dict[int, list[int]] = {}
+
+    def append(statement: ast.Statement, qubits: Optional[list[int]]) -> None:
+        if qubits is None:
+            history.clear()
+        else:
+            for qubit in qubits:
+                history.setdefault(qubit, []).append(len(statements))
+        statements.append(statement)
+
+    for statement in program.statements:
+        if isinstance(statement, _TRANSPARENT_STATEMENTS):
+            statements.append(statement)
+        elif isinstance(statement, ast.ClassicalDeclaration):
+            init = statement.init_expression
+            if isinstance(init, ast.QuantumMeasurement):
+                append(statement, _resolve_qubits([init.qubit], layout))
+            elif isinstance(init, ast.FunctionCall):
+                append(statement, None)
+            else:
+                statements.append(statement)
+        elif isinstance(statement, ast.QuantumMeasurementStatement):
+            append(statement, _resolve_qubits([statement.measure.qubit], layout))
+        elif isinstance(statement, ast.QuantumReset):
+            append(statement, _resolve_qubits([statement.qubits], layout))
+        elif isinstance(statement, ast.QuantumBarrier):
+            qubits = _resolve_qubits(statement.qubits, layout) if statement.qubits else None
+            append(statement, qubits)
+        elif not isinstance(statement, ast.QuantumGate):
+            append(statement, None)
+        else:
+            qubits = None if statement.modifiers else _single_qubits(statement, layout)
+            if qubits is None:
+                append(statement, _resolve_qubits(statement.qubits, layout))
+                continue
+            if _is_identity(statement):
+                continue
+            if _combine_with_previous(statement, qubits, statements, gate_qubits, history):
+                continue
+
+            gate_qubits[len(statements)] = qubits
+            append(statement, list(qubits))
+
+    return ast.Program(
+        statements=[statement for statement in statements if statement is not None],
+        version=program.version,
+    )
+
+
+def optimize(qasm: str) -> str:
+    """Apply peephole optimization to an OpenQASM 2 or 3 program.
+
+    See :func:`peephole_optimize` for the optimizations applied.
+
+    Args:
+        qasm (str): The OpenQASM program string.
+
+    Returns:
+        str: The optimized OpenQASM program.
+
+    Raises:
+        ValueError: If the program cannot be parsed.
+    """
+    return run_pipeline(qasm, [peephole_optimize])
+
+
+__all__ = [
+    "IDENTITY_GATES",
+    "INVERSE_GATES",
+    "ROTATION_GATES",
+    "SELF_INVERSE_GATES",
+    "optimize",
+    "peephole_optimize",
+]
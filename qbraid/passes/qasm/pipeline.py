@@ -0,0 +1,167 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module for applying a sequence of OpenQASM AST passes in a single
+parse-transform-dump cycle.
+
+"""
+from __future__ import annotations
+
+from typing import Callable, Iterable
+
+from openqasm3 import ast, dumps
+from openqasm3.parser import QASM3ParsingError, parse
+from openqasm3.visitor import QASMTransformer
+
+from .compat import declarations_to_qasm2
+from .expressions import CONSTANTS, apply_binary, literal_value, to_literal
+
+QasmPass = Callable[[ast.Program], ast.Program]
+
+_REAL_TYPES = (ast.FloatType, ast.AngleType, ast.ComplexType)
+
+
+def _fold_identifier(node: ast.Expression) -> ast.Expression:
+    """Replace a built-in constant identifier by its decimal literal."""
+    if isinstance(node, ast.Identifier) and node.name in CONSTANTS:
+        return to_literal(CONSTANTS[node.name])
+    return node
+
+
+class _ConstantFolder(QASMTransformer):
+    """Transformer that folds arithmetic on numeric literals and built-in constants.
+
+    Division of two integers is only folded in real-valued contexts (gate arguments and
+    float or angle declarations), since it is integer division elsewhere.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._real_context = False
+
+    def _visit_real(self, node: ast.Expression) -> ast.Expression:
+        """Visit an expression whose value is real-valued."""
+        previous, self._real_context = self._real_context, True
+        try:
+            return self.visit(node)
+        finally:
+            self._real_context = previous
+
+    def visit_UnaryExpression(self, node: ast.UnaryExpression) -> ast.Expression:
+        """Fold the negation of a numeric literal."""
+        node = self.generic_visit(node)
+        if node.op.name != "-":
+            return node
+        value = literal_value(node.expression)
+        if value is None:
+            return node
+        return to_literal(-value)
+
+    def visit_BinaryExpression(self, node: ast.BinaryExpression) -> ast.Expression:
+        """Fold a binary operation on two numeric literals."""
+        node = self.generic_visit(node)
+        lhs, rhs = literal_value(node.lhs), literal_value(node.rhs)
+        if lhs is None or rhs is None:
+            node.lhs, node.rhs = _fold_identifier(node.lhs), _fold_identifier(node.rhs)
+            return node
+        value = apply_binary(node.op.name, lhs, rhs, true_division=self._real_context)
+        return node if value is None else to_literal(value)
+
+    def visit_QuantumGate(self, node: ast.QuantumGate) -> ast.QuantumGate:
+        """Fold gate arguments, which are real-valued."""
+        arguments, node.arguments = node.arguments, []
+        node = self.generic_visit(node)
+        node.arguments = [_fold_identifier(self._visit_real(arg)) for arg in arguments]
+        return node
+
+    def visit_QuantumPhase(self, node: ast.QuantumPhase) -> ast.QuantumPhase:
+        """Fold the global phase argument, which is real-valued."""
+        argument, node.argument = node.argument, None
+        node = self.generic_visit(node)
+        node.argument = _fold_identifier(self._visit_real(argument))
+        return node
+
+    def _visit_declaration(self, node):
+        """Fold a declaration, treating float and angle initializers as real-valued."""
+        if node.init_expression is None or not isinstance(node.type, _REAL_TYPES):
+            return self.generic_visit(node)
+        init_expression, node.init_expression = node.init_expression, None
+        node = self.generic_visit(node)
+        node.init_expression = self._visit_real(init_expression)
+        return node
+
+    def visit_ClassicalDeclaration(
+        self, node: ast.ClassicalDeclaration
+    ) -> ast.ClassicalDeclaration:
+        """Fold a classical declaration."""
+        return self._visit_declaration(node)
+
+    def visit_ConstantDeclaration(self, node: ast.ConstantDeclaration) -> ast.ConstantDeclaration:
+        """Fold a constant declaration."""
+        return self._visit_declaration(node)
+
+
+def fold_constants(program: ast.Program) -> ast.Program:
+    """Fold arithmetic on numeric literals and the built-in constants ``pi``, ``tau``
+    and ``euler`` into decimal literals, in place.
+
+    Args:
+        program (openqasm3.ast.Program): The program to transform.
+
+    Returns:
+        openqasm3.ast.Program: The transformed program.
+    """
+    _ConstantFolder().visit(program)
+    return program
+
+
+def dumps_program(program: ast.Program) -> str:
+    """Serialize a program, converting register declarations back to OpenQASM 2
+    syntax if the program version is 2.x."""
+    qasm = dumps(program)
+
+    if program.version is not None and int(program.version.split(".")[0]) == 2:
+        qasm = declarations_to_qasm2(qasm)
+
+    return qasm
+
+
+def run_pipeline(qasm: str, passes: Iterable[QasmPass]) -> str:
+    """Apply a sequence of AST passes to an OpenQASM program in a single
+    parse-transform-dump cycle.
+
+    Args:
+        qasm (str): The OpenQASM 2 or 3 program string.
+        passes (Iterable[Callable[[ast.Program], ast.Program]]): The passes to apply, in order.
+            Each pass receives the output of the previous one.
+
+    Returns:
+        str: The transformed OpenQASM program.
+
+    Raises:
+        ValueError: If the program cannot be parsed.
+    """
+    try:
+        program = parse(qasm)
+    except QASM3ParsingError as err:
+        raise ValueError("Invalid OpenQASM program.") from err
+
+    for qasm_pass in passes:
+        program = qasm_pass(program)
+
+    return dumps_program(program)
+
+
+__all__ = ["CONSTANTS", "QasmPass", "dumps_program", "fold_constants", "run_pipeline"]
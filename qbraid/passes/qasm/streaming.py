@@ -0,0 +1,292 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module for rebasing flat OpenQASM programs one statement at a time, without
+building an AST of the whole program.
+
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from openqasm3 import ast, dumps
+from openqasm3.parser import QASM3ParsingError, parse
+
+from .decompose import _rebase_passes
+from .expressions import parse_expression
+from .pipeline import QasmPass
+
+QasmSource = Union[str, IO[str], Iterable[str]]
+
+CHUNK_SIZE = 1 << 16
+
+# Keywords of statements that open a nested scope.
+_SCOPED_KEYWORDS = frozenset(
+    {"gate", "def", "defcal", "cal", "for", "while", "if", "else", "box", "switch"}
+)
+
+# Keywords of statements that are never changed by a rebase, and are copied verbatim.
+_VERBATIM_KEYWORDS = frozenset(
+    {
+        "OPENQASM",
+        "include",
+        "qubit",
+        "qreg",
+        "bit",
+        "creg",
+        "measure",
+        "reset",
+        "barrier",
+        "input",
+        "output",
+        "const",
+        "int",
+        "uint",
+        "float",
+        "angle",
+        "bool",
+        "complex",
+        "duration",
+        "stretch",
+        "opaque",
+        "extern",
+        "let",
+        "array",
+        "defcalgrammar",
+        "delay",
+        "end",
+    }
+)
+
+_DELIMITER = re.compile(r";|\{|//|/\*")
+_KEYWORD = re.compile(r"[A-Za-z_]\w*")
+_GATE = re.compile(r"([A-Za-z_]\w*)(?:\s*\((.*)\)\s*|\s+)([A-Za-z_$][\w$\[\]\s,]*)", re.S)
+_OPERAND = re.compile(r"\s*([A-Za-z_]\w*|\$\d+)\s*(?:\[\s*(\d+)\s*\])?\s*")
+
+_NOT_FLAT = (
+    "Streaming rebase only supports flat programs, without gate definitions, "
+    "subroutines or control flow."
+)
+
+
+def _read_chunks(source: QasmSource) -> Iterator[str]:
+    """Yield the text of a program string, text file or iterable of strings in chunks."""
+    if isinstance(source, str):
+        yield source
+    elif hasattr(source, "read"):
+        yield from iter(lambda: source.read(CHUNK_SIZE), "")
+    else:
+        yield from source
+
+
+def _iter_statements(source: QasmSource) -> Iterator[str]:
+    """Split a program into statements, without their terminating semicolons and
+    with comments removed.
+
+    Raises:
+        ValueError: If the program contains a braced block, or ends with an
+            unterminated statement or comment.
+    """
+    pending: list[str] = []
+    buffer = ""
+    for chunk in _read_chunks(source):
+        buffer += chunk
+        position = 0
+        while True:
+            match = _DELIMITER.search(buffer, position)
+            if match is None:
+                # Keep a trailing '/', which may start a comment continued in the next chunk.
+                end = len(buffer)
+                if end > position and buffer[-1] == "/":
+                    end -= 1
+                pending.append(buffer[position:end])
+                buffer = buffer[end:]
+                break
+
+            token = match.group()
+            if token == "{":
+                raise ValueError(_NOT_FLAT)
+
+            pending.append(buffer[position : match.start()])
+            if token == ";":
+                yield "".join(pending).strip()
+                pending = []
+                position = match.end()
+                continue
+
+            closing = "\n" if token == "//" else "*/"
+            end = buffer.find(closing, match.end())
+            if end < 0:
+                buffer = buffer[match.start() :]
+                break
+            pending.append(" ")
+            position = end + len(closing)
+
+    if buffer.startswith("/*") or "".join(pending).strip() or buffer.strip() == "/":
+        raise ValueError("Invalid OpenQASM program: unterminated statement or comment.")
+
+
+def _keyword(statement: str) -> Optional[str]:
+    match = _KEYWORD.match(statement)
+    return match.group() if match else None
+
+
+def _split_arguments(text: str) -> list[str]:
+    """Split a gate argument list at top-level commas."""
+    if "," not in text:
+        return [text]
+    arguments, depth, start = [], 0, 0
+    for index, char in enumerate(text):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            arguments.append(text[start:index])
+            start = index + 1
+    arguments.append(text[start:])
+    return arguments
+
+
+def _parse_operand(text: str) -> Optional[ast.Expression]:
+    match = _OPERAND.fullmatch(text)
+    if match is None:
+        return None
+    name, index = match.groups()
+    if index is None:
+        return ast.Identifier(name)
+    return ast.IndexedIdentifier(ast.Identifier(name), [[ast.IntegerLiteral(int(index))]])
+
+
+def _parse_gate(statement: str) -> Optional[ast.QuantumGate]:
+    """Parse a simple gate statement without the OpenQASM parser, or return None if
+    the statement is not of the form ``name(expr, ...) reg[i], ...``."""
+    match = _GATE.fullmatch(statement)
+    if match is None:
+        return None
+    name, arguments, operands = match.groups()
+
+    qubits = [_parse_operand(operand) for operand in operands.split(",")]
+    if None in qubits:
+        return None
+
+    try:
+        params = [parse_expression(arg) for arg in _split_arguments(arguments)] if arguments else []
+    except ValueError:
+        return None
+
+    return ast.QuantumGate(modifiers=[], name=ast.Identifier(name), arguments=params, qubits=qubits)
+
+
+def _parse_statement(statement: str) -> list[ast.Statement]:
+    gate = _parse_gate(statement)
+    if gate is not None:
+        return [gate]
+    try:
+        return parse(statement + ";").statements
+    except QASM3ParsingError as err:
+        raise ValueError("Invalid OpenQASM program.") from err
+
+
+def _check_flat(statement: str) -> Optional[str]:
+    """Return the leading keyword of a statement, raising if it opens a nested scope."""
+    keyword = _keyword(statement)
+    if keyword in _SCOPED_KEYWORDS:
+        raise ValueError(_NOT_FLAT)
+    return keyword
+
+
+def is_flat_program(source: QasmSource) -> bool:
+    """Check whether a program can be rebased with :func:`rebase_stream`, i.e. that it
+    has no gate or subroutine definitions, control flow or other braced blocks.
+
+    Args:
+        source (str | IO[str] | Iterable[str]): The OpenQASM program string, a text
+            file object, or an iterable of program text chunks.
+
+    Returns:
+        bool: True if the program is flat.
+    """
+    try:
+        for statement in _iter_statements(source):
+            _check_flat(statement)
+    except ValueError:
+        return False
+    return True
+
+
+def rebase_stream(
+    source: QasmSource,
+    sink: IO[str],
+    gateset: Union[set[str], str],
+    gate_mappings: Optional[dict[str, str]] = None,
+    case_sensitive: bool = False,
+    normalize_params: bool = False,
+    cache_size: int = 4096,
+) -> None:
+    """
+    Rebases a flat OpenQASM 2 or 3 program according to a given basis gate set, reading
+    and writing one statement at a time.
+
+    Unlike :func:`~qbraid.passes.qasm.rebase`, the program is never parsed as a whole, so
+    memory use does not grow with program size. Gate statements are decomposed, renamed,
+    checked against the basis and (optionally) have their parameters normalized with the
+    same passes as :func:`~qbraid.passes.qasm.rebase`, and are written in normalized form.
+    Declarations, measurements, resets and barriers are copied verbatim. Results are
+    cached by statement text, so repeated statements are only processed once.
+
+    Args:
+        source (str | IO[str] | Iterable[str]): The OpenQASM program string, a text file
+            object, or an iterable of program text chunks.
+        sink (IO[str]): Text stream that the rebased program is written to.
+        gateset (set[str]): The target basis gates to decompose the program to.
+        gate_mappings (dict[str, str]): A dictionary mapping gate names to new gate names.
+        case_sensitive (bool): If True, the gate mappings are case-sensitive. Defaults to False.
+        normalize_params (bool): If True, constant gate parameter expressions (e.g. ``pi / 2``)
+            are folded into decimal values. Defaults to False.
+        cache_size (int): Maximum number of distinct statements whose output is cached.
+
+    Raises:
+        ValueError: If the program is not flat or cannot be parsed, if no basis gates are
+            provided or if the basis gate set identifier is invalid.
+        TypeError: If the basis gate set is not a set of strings or a string identifier
+        QasmDecompositionError: If an error occurrs during the decomposition process
+        CompilationError: If the program cannot be rebased to the provided basis gate set.
+            The output written before the failing statement is left in the sink.
+    """
+    passes: list[QasmPass] = _rebase_passes(
+        gateset, True, gate_mappings, case_sensitive, normalize_params
+    )
+
+    @lru_cache(maxsize=cache_size)
+    def rebase_statement(statement: str) -> str:
+        program = ast.Program(statements=_parse_statement(statement))
+        for qasm_pass in passes:
+            program = qasm_pass(program)
+        return "".join(dumps(stmnt) for stmnt in program.statements)
+
+    for statement in _iter_statements(source):
+        if not statement:
+            continue
+        keyword = _check_flat(statement)
+        if keyword in _VERBATIM_KEYWORDS:
+            sink.write(statement + ";\n")
+        else:
+            sink.write(rebase_statement(statement))
+
+
+__all__ = ["is_flat_program", "rebase_stream"]
@@ -25,6 +25,9 @@ Classes
    :toctree: ../stubs/
 
    GateModelProgram
+   CircuitStats
+   GateArray
+   GateArrayBuilder
 
 Submodules
 ------------
@@ -46,7 +49,8 @@ Submodules
 """
 import importlib
 
-from ._model import GateModelProgram
+from ._gate_array import GateArray, GateArrayBuilder
+from ._model import CircuitStats, GateModelProgram
 
 _qbraid = importlib.import_module("qbraid.programs._import")
 NATIVE_REGISTRY = getattr(_qbraid, "NATIVE_REGISTRY", {})
@@ -67,6 +71,6 @@ for lib in key_set:
         pass
 
 
-__all__ = ["GateModelProgram"]
+__all__ = ["GateModelProgram", "CircuitStats", "GateArray", "GateArrayBuilder"]
 
 __all__.extend(submodules)
@@ -0,0 +1,404 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module defining a compact, array-backed gate sequence representation
+
+"""
+from __future__ import annotations
+
+import json
+import numbers
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+
+TARGET_LIST = 1
+CONTROL_LIST = 2
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+def _padded(values: list[int], counts: np.ndarray) -> np.ndarray:
+    """Scatter a flat list of per-gate values into a ``-1`` padded 2D array."""
+    width = int(counts.max(initial=0))
+    array = np.full((len(counts), width), -1, dtype=np.int32)
+    if values:
+        rows = np.repeat(np.arange(len(counts)), counts)
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        array[rows, np.arange(len(values)) - starts] = values
+    return array
+
+
+def _first_column(array: np.ndarray) -> np.ndarray:
+    """Return the first column of a padded operand array, or ``-1`` if it has none."""
+    if array.shape[1] == 0:
+        return np.full(len(array), -1, dtype=array.dtype)
+    return array[:, 0]
+
+
+@dataclass(eq=False)
+class GateArray:
+    """Columnar representation of a sequence of gates.
+
+    Gate names are interned in a name table and referenced by integer opcode. Qubit
+    operands are stored in ``-1`` padded arrays, and numeric parameters in a flat
+    value array indexed by per-gate offsets (CSR layout). Parameters that are not
+    numbers or lists of numbers are kept in a sparse ``extras`` table.
+
+    Attributes:
+        names (list[str]): Interned gate name table.
+        opcodes (np.ndarray): Index into ``names`` for each gate.
+        targets (np.ndarray): Target qubits of each gate, padded with ``-1``.
+        controls (np.ndarray): Control qubits of each gate, padded with ``-1``.
+        num_targets (np.ndarray): Number of target qubits of each gate.
+        num_controls (np.ndarray): Number of control qubits of each gate.
+        flags (np.ndarray): Bit flags recording whether the targets (``TARGET_LIST``)
+            and controls (``CONTROL_LIST``) of each gate were given as lists.
+        param_keys (list[tuple[str, bool]]): Interned parameter key table. The flag
+            marks list-valued parameters, whose values are stored as consecutive entries.
+        param_key_ids (np.ndarray): Index into ``param_keys`` for each parameter value.
+        param_values (np.ndarray): Flat array of parameter values.
+        param_is_int (np.ndarray): Boolean mask of the parameter values that were given
+            as integers, so that they are emitted with their original literal type.
+        param_offsets (np.ndarray): Start of the parameters of each gate in
+            ``param_values``, with a final entry marking the end.
+        extras (dict[int, dict[str, Any]]): Non-numeric parameters, keyed by gate index.
+    """
+
+    names: list[str]
+    opcodes: np.ndarray
+    targets: np.ndarray
+    controls: np.ndarray
+    num_targets: np.ndarray
+    num_controls: np.ndarray
+    flags: np.ndarray
+    param_keys: list[tuple[str, bool]]
+    param_key_ids: np.ndarray
+    param_values: np.ndarray
+    param_is_int: np.ndarray
+    param_offsets: np.ndarray
+    extras: dict[int, dict[str, Any]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    @property
+    def num_qubits(self) -> int:
+        """Return the number of qubits spanned by the gates, i.e. the highest
+        qubit index plus one."""
+        highest = max(self.targets.max(initial=-1), self.controls.max(initial=-1))
+        return int(highest) + 1
+
+    def name(self, index: int) -> str:
+        """Return the name of the gate at the given position."""
+        return self.names[self.opcodes[index]]
+
+    def name_mask(self, names: Iterable[str]) -> np.ndarray:
+        """Return a boolean mask of the gates whose name is in the given set."""
+        names = set(names)
+        table = np.array([name in names for name in self.names], dtype=bool)
+        return table[self.opcodes] if len(table) > 0 else np.zeros(len(self), dtype=bool)
+
+    def has_param(self, key: str) -> np.ndarray:
+        """Return a boolean mask of the gates that define the given parameter."""
+        mask = np.zeros(len(self), dtype=bool)
+        key_ids = [i for i, (name, _) in enumerate(self.param_keys) if name == key]
+        if key_ids:
+            counts = np.diff(self.param_offsets)
+            owners = np.repeat(np.arange(len(self)), counts)
+            mask[owners[np.isin(self.param_key_ids, key_ids)]] = True
+        for index, extras in self.extras.items():
+            if extras.get(key) is not None:
+                mask[index] = True
+        return mask
+
+    def _param_value_list(self) -> list[Union[int, float]]:
+        """Return the parameter values as Python numbers, restoring integer literals."""
+        values = self.param_values.tolist()
+        for j in np.flatnonzero(self.param_is_int).tolist():
+            values[j] = int(values[j])
+        return values
+
+    @classmethod
+    def from_ionq(cls, circuit: list[dict[str, Any]]) -> GateArray:
+        """Build a gate array from an IonQ JSON circuit gate list.
+
+        Args:
+            circuit (list[dict]): The IonQ circuit gate list.
+
+        Returns:
+            GateArray: The columnar representation of the circuit.
+        """
+        builder = GateArrayBuilder()
+        for instr in circuit:
+            instr = instr.copy()
+            name = instr.pop("gate", None)
+            targets = instr.pop("targets", instr.pop("target", None))
+            controls = instr.pop("controls", instr.pop("control", None))
+            builder.append(name, targets, controls, instr)
+        return builder.build()
+
+    def to_ionq(self) -> list[dict[str, Any]]:
+        """Emit the gates as an IonQ JSON circuit gate list.
+
+        Numeric parameters keep the literal type they were given with.
+
+        Returns:
+            list[dict]: The IonQ circuit gate list.
+        """
+        names = self.names
+        opcodes = self.opcodes.tolist()
+        targets = self.targets.tolist()
+        controls = self.controls.tolist()
+        num_targets = self.num_targets.tolist()
+        num_controls = self.num_controls.tolist()
+        flags = self.flags.tolist()
+        param_keys = self.param_keys
+        key_ids = self.param_key_ids.tolist()
+        values = self._param_value_list()
+        offsets = self.param_offsets.tolist()
+
+        circuit = []
+        for i, opcode in enumerate(opcodes):
+            gate: dict[str, Any] = {"gate": names[opcode]}
+            if num_controls[i] > 0 or flags[i] & CONTROL_LIST:
+                if flags[i] & CONTROL_LIST:
+                    gate["controls"] = controls[i][: num_controls[i]]
+                else:
+                    gate["control"] = controls[i][0]
+            if num_targets[i] > 0 or flags[i] & TARGET_LIST:
+                if flags[i] & TARGET_LIST:
+                    gate["targets"] = targets[i][: num_targets[i]]
+                else:
+                    gate["target"] = targets[i][0]
+            for j in range(offsets[i], offsets[i + 1]):
+                key, is_list = param_keys[key_ids[j]]
+                if is_list:
+                    gate.setdefault(key, []).append(values[j])
+                else:
+                    gate[key] = values[j]
+            if i in self.extras:
+                gate.update(self.extras[i])
+            circuit.append(gate)
+
+        return circuit
+
+    def _format_gate(
+        self,
+        index: int,
+        heads: list[str],
+        param_keys: list[tuple[str, bool]],
+        param_values: list[Union[int, float]],
+    ) -> str:
+        """Format a single gate as a JSON object, in the key order of :meth:`to_ionq`."""
+        num_targets = int(self.num_targets[index])
+        num_controls = int(self.num_controls[index])
+        flags = int(self.flags[index])
+        gate = [heads[self.opcodes[index]]]
+        if flags & CONTROL_LIST:
+            gate.append(f', "controls": {self.controls[index, :num_controls].tolist()}')
+        elif num_controls > 0:
+            gate.append(f', "control": {self.controls[index, 0]}')
+        if flags & TARGET_LIST:
+            gate.append(f', "targets": {self.targets[index, :num_targets].tolist()}')
+        elif num_targets > 0:
+            gate.append(f', "target": {self.targets[index, 0]}')
+
+        start, stop = self.param_offsets[index], self.param_offsets[index + 1]
+        key_ids = self.param_key_ids[start:stop].tolist()
+        values = param_values[start:stop]
+        j = 0
+        while j < len(key_ids):
+            key, is_list = param_keys[key_ids[j]]
+            end = j + 1
+            if is_list:
+                while end < len(key_ids) and key_ids[end] == key_ids[j]:
+                    end += 1
+                gate.append(f", {key}: [{', '.join(map(repr, values[j:end]))}]")
+            else:
+                gate.append(f", {key}: {values[j]!r}")
+            j = end
+        for key, value in self.extras.get(index, {}).items():
+            gate.append(f", {json.dumps(key)}: {json.dumps(value)}")
+        gate.append("}")
+        return "".join(gate)
+
+    def to_ionq_json(self) -> bytes:
+        """Serialize the gates as an IonQ JSON circuit gate list.
+
+        Equivalent to ``json.dumps(self.to_ionq()).encode()``, but formatted directly from
+        the columns without building intermediate dictionaries. Gates are grouped by
+        shape with vectorized masks: gates with a single target, at most one control and
+        no parameters, and single-qubit gates with one scalar parameter, are each formatted
+        from a per-opcode template. Only the remaining gates are formatted individually.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON array of IonQ gates.
+        """
+        if not np.isfinite(self.param_values).all():
+            return json.dumps(self.to_ionq()).encode()
+
+        targets = _first_column(self.targets)
+        controls = _first_column(self.controls)
+
+        values = self._param_value_list()
+        heads = [f'{{"gate": {json.dumps(name)}' for name in self.names]
+        escaped = [head.replace("%", "%%") for head in heads]
+        param_keys = [(json.dumps(key), is_list) for key, is_list in self.param_keys]
+        parts: list[Optional[str]] = [None] * len(self)
+
+        num_params = np.diff(self.param_offsets)
+        plain = (self.flags == 0) & (self.num_targets == 1) & (self.num_controls <= 1)
+        if self.extras:
+            plain[list(self.extras)] = False
+
+        rows = np.flatnonzero(plain & (num_params == 0) & (self.num_controls == 0))
+        templates = [f'{head}, "target": %d}}' for head in escaped]
+        for row, opcode, target in zip(
+            rows.tolist(), self.opcodes[rows].tolist(), targets[rows].tolist()
+        ):
+            parts[row] = templates[opcode] % target
+
+        rows = np.flatnonzero(plain & (num_params == 0) & (self.num_controls == 1))
+        templates = [f'{head}, "control": %d, "target": %d}}' for head in escaped]
+        for row, opcode, control, target in zip(
+            rows.tolist(),
+            self.opcodes[rows].tolist(),
+            controls[rows].tolist(),
+            targets[rows].tolist(),
+        ):
+            parts[row] = templates[opcode] % (control, target)
+
+        scalar_keys = np.array([not is_list for _, is_list in param_keys], dtype=bool)
+        rows = np.flatnonzero(plain & (num_params == 1) & (self.num_controls == 0))
+        key_ids = self.param_key_ids[self.param_offsets[rows]]
+        if len(rows) > 0:
+            rows, key_ids = rows[scalar_keys[key_ids]], key_ids[scalar_keys[key_ids]]
+        for row, opcode, target, key_id, offset in zip(
+            rows.tolist(),
+            self.opcodes[rows].tolist(),
+            targets[rows].tolist(),
+            key_ids.tolist(),
+            self.param_offsets[rows].tolist(),
+        ):
+            key = param_keys[key_id][0]
+            parts[row] = f'{heads[opcode]}, "target": {target}, {key}: {values[offset]!r}}}'
+
+        for row, part in enumerate(parts):
+            if part is None:
+                parts[row] = self._format_gate(row, heads, param_keys, values)
+
+        return f"[{', '.join(parts)}]".encode()
+
+
+class GateArrayBuilder:
+    """Incrementally collects gates into flat columns and packs them into a
+    :class:`GateArray`."""
+
+    def __init__(self):
+        self._name_ids: dict[str, int] = {}
+        self._param_key_ids: dict[tuple[str, bool], int] = {}
+        self._opcodes: list[int] = []
+        self._targets: list[int] = []
+        self._controls: list[int] = []
+        self._num_targets: list[int] = []
+        self._num_controls: list[int] = []
+        self._flags: list[int] = []
+        self._param_keys: list[int] = []
+        self._param_values: list[float] = []
+        self._num_params: list[int] = []
+        self._extras: dict[int, dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._opcodes)
+
+    def _intern_key(self, key: str, is_list: bool) -> int:
+        return self._param_key_ids.setdefault((key, is_list), len(self._param_key_ids))
+
+    def append(
+        self,
+        name: str,
+        targets: Optional[Union[int, list[int]]] = None,
+        controls: Optional[Union[int, list[int]]] = None,
+        params: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Append a gate.
+
+        Args:
+            name (str): The gate name.
+            targets (Optional[int | list[int]]): The target qubit, or list of target qubits.
+            controls (Optional[int | list[int]]): The control qubit, or list of control qubits.
+            params (Optional[dict[str, Any]]): The gate parameters. Numbers and lists of
+                numbers are stored in the parameter columns; other values are stored as-is.
+        """
+        flags = 0
+        if isinstance(targets, list):
+            flags |= TARGET_LIST
+        else:
+            targets = [] if targets is None else [targets]
+        if isinstance(controls, list):
+            flags |= CONTROL_LIST
+        else:
+            controls = [] if controls is None else [controls]
+
+        self._opcodes.append(self._name_ids.setdefault(name, len(self._name_ids)))
+        self._targets.extend(targets)
+        self._controls.extend(controls)
+        self._num_targets.append(len(targets))
+        self._num_controls.append(len(controls))
+        self._flags.append(flags)
+
+        num_params = 0
+        for key, value in (params or {}).items():
+            if _is_number(value):
+                self._param_keys.append(self._intern_key(key, False))
+                self._param_values.append(value)
+                num_params += 1
+            elif isinstance(value, list) and value and all(_is_number(v) for v in value):
+                key_id = self._intern_key(key, True)
+                self._param_keys.extend([key_id] * len(value))
+                self._param_values.extend(value)
+                num_params += len(value)
+            else:
+                self._extras.setdefault(len(self._opcodes) - 1, {})[key] = value
+        self._num_params.append(num_params)
+
+    def build(self) -> GateArray:
+        """Pack the collected gates into a :class:`GateArray`."""
+        num_targets = np.array(self._num_targets, dtype=np.int32)
+        num_controls = np.array(self._num_controls, dtype=np.int32)
+        param_offsets = np.zeros(len(self._num_params) + 1, dtype=np.int64)
+        np.cumsum(self._num_params, out=param_offsets[1:])
+
+        return GateArray(
+            names=list(self._name_ids),
+            opcodes=np.array(self._opcodes, dtype=np.int32),
+            targets=_padded(self._targets, num_targets),
+            controls=_padded(self._controls, num_controls),
+            num_targets=num_targets,
+            num_controls=num_controls,
+            flags=np.array(self._flags, dtype=np.uint8),
+            param_keys=list(self._param_key_ids),
+            param_key_ids=np.array(self._param_keys, dtype=np.int32),
+            param_values=np.array(self._param_values, dtype=np.float64),
+            param_is_int=np.array(
+                [isinstance(value, numbers.Integral) for value in self._param_values], dtype=bool
+            ),
+            param_offsets=param_offsets,
+            extras=dict(self._extras),
+        )
@@ -18,8 +18,12 @@ Module defining GateModelProgram Class
 """
 from __future__ import annotations
 
+import numbers
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Optional
+from collections import Counter
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 
 import numpy as np
 from qbraid_core.services.runtime.schemas import Program
@@ -27,8 +31,126 @@ from qbraid_core.services.runtime.schemas import Program
 from qbraid.programs.program import QuantumProgram
 
 if TYPE_CHECKING:
+    import qbraid.programs
     import qbraid.runtime
 
+PARAM_DECIMALS = 10
+
+
+def canonical_param(value: Any) -> Any:
+    """Normalize a gate parameter to a JSON-serializable canonical value.
+
+    Real numbers are rounded to :data:`PARAM_DECIMALS` decimal places, complex numbers
+    and arrays are expanded into lists, and symbolic parameters are represented by
+    their string form.
+    """
+    if isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        rounded = round(float(value), PARAM_DECIMALS)
+        return rounded + 0.0  # normalize -0.0
+    if isinstance(value, numbers.Complex):
+        return [canonical_param(value.real), canonical_param(value.imag)]
+    if isinstance(value, np.ndarray):
+        return [canonical_param(item) for item in value.ravel().tolist()]
+    if isinstance(value, (list, tuple)):
+        return [canonical_param(item) for item in value]
+    return str(value)
+
+
+_NON_GATE_OPS = frozenset({"measure", "barrier", "reset"})
+
+
+@dataclass(frozen=True)
+class CircuitStats:
+    """Resource statistics of a gate model circuit.
+
+    Qubit indices refer to the integer qubit indexing used by the program wrapper.
+
+    Attributes:
+        num_qubits (int): Number of qubits in the circuit.
+        gate_counts (dict[str, int]): Number of operations of each type, keyed by the
+            framework-native operation name.
+        num_two_qubit_gates (int): Number of gates acting on exactly two qubits,
+            excluding measurements, resets and barriers.
+        depth (int): Number of layers of operations, scheduled as early as possible
+            on their qubits and classical bits. Barriers are not counted.
+        measured_qubits (frozenset[int]): Qubits that are measured.
+        idle_qubits (frozenset[int]): Qubits that no operation other than a barrier
+            acts upon.
+    """
+
+    num_qubits: int
+    gate_counts: dict[str, int]
+    num_two_qubit_gates: int
+    depth: int
+    measured_qubits: frozenset[int]
+    idle_qubits: frozenset[int]
+
+    @classmethod
+    def from_gates(cls, gates: list[list[Any]], num_qubits: int) -> CircuitStats:
+        """Collect statistics from a canonical gate list in a single pass.
+
+        Args:
+            gates (list[list]): Canonical ``[name, params, qubits, clbits]`` entries.
+            num_qubits (int): Number of qubits in the circuit.
+
+        Returns:
+            CircuitStats: The collected statistics.
+        """
+        gate_counts: Counter[str] = Counter()
+        num_two_qubit_gates = 0
+        measured: set[int] = set()
+        used: set[int] = set()
+        qubit_layers: dict[int, int] = {}
+        clbit_layers: dict[int, int] = {}
+        depth = 0
+
+        for name, _, qubits, clbits in gates:
+            if not qubits and not clbits:
+                continue
+
+            kind = name.lower()
+            gate_counts[name] += 1
+            if kind == "barrier":
+                continue
+
+            used.update(qubits)
+            if kind == "measure":
+                measured.update(qubits)
+            elif kind not in _NON_GATE_OPS and len(qubits) == 2:
+                num_two_qubit_gates += 1
+
+            layer = 1 + max(
+                [qubit_layers.get(q, 0) for q in qubits] + [clbit_layers.get(c, 0) for c in clbits]
+            )
+            qubit_layers.update(dict.fromkeys(qubits, layer))
+            clbit_layers.update(dict.fromkeys(clbits, layer))
+            depth = max(depth, layer)
+
+        width = max(num_qubits, max(used, default=-1) + 1)
+
+        return cls(
+            num_qubits=num_qubits,
+            gate_counts=dict(gate_counts),
+            num_two_qubit_gates=num_two_qubit_gates,
+            depth=depth,
+            measured_qubits=frozenset(measured),
+            idle_qubits=frozenset(range(width)) - used,
+        )
+
+
+def _program_stats(program: Any) -> CircuitStats:
+    """Return the statistics of a program wrapper or native quantum program."""
+    if not isinstance(program, GateModelProgram):
+        # pylint: disable-next=import-outside-toplevel
+        from qbraid.programs.loader import load_program
+
+        program = load_program(program)
+    return program.stats()
+
 
 class GateModelProgram(QuantumProgram, ABC):
     """Abstract class for qbraid program wrapper objects."""
@@ -57,6 +179,70 @@ class GateModelProgram(QuantumProgram, ABC):
         """Calculate unitary of circuit."""
         raise NotImplementedError
 
+    def _canonical_gates(self) -> list[list[Any]]:
+        """Return the canonical gate-list view of the circuit.
+
+        Each entry is ``[name, params, qubits, clbits]``, where ``params`` are normalized
+        with :func:`canonical_param`, and ``qubits`` and ``clbits`` are integer indices.
+        """
+        raise NotImplementedError
+
+    def _gate_list(self) -> list[list[Any]]:
+        """Return the cached canonical gate list of the circuit."""
+        return self._cached("gates", self._canonical_gates)
+
+    def _canonical_form(self) -> dict[str, Any]:
+        """Return a JSON-serializable canonical view of the circuit."""
+        return {
+            "alias": self.spec.alias,
+            "num_qubits": self.num_qubits,
+            "gates": self._gate_list(),
+        }
+
+    def stats(self) -> CircuitStats:
+        """Return resource statistics of the circuit: gate counts by name, two-qubit
+        gate count, depth, measured qubits and idle qubits.
+
+        The statistics are collected in a single traversal of the circuit. For immutable
+        programs (e.g. OpenQASM strings), the traversal is shared with :meth:`fingerprint`
+        and cached until the wrapped program object is replaced. Mutable circuits are
+        traversed on every call, so that in-place mutations are reflected.
+
+        Returns:
+            CircuitStats: The circuit resource statistics.
+
+        Raises:
+            NotImplementedError: If the program type does not support gate-level analysis.
+        """
+        return self._cached(
+            "stats", lambda: CircuitStats.from_gates(self._gate_list(), self.num_qubits)
+        )
+
+    @staticmethod
+    def batch_stats(
+        programs: Iterable[GateModelProgram | qbraid.programs.QPROGRAM],
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> list[CircuitStats]:
+        """Collect resource statistics for multiple programs on a worker pool.
+
+        Args:
+            programs (Iterable): Program wrappers or native quantum programs.
+            max_workers (Optional[int]): Maximum number of worker threads. Ignored if an
+                executor is provided.
+            executor (Optional[concurrent.futures.Executor]): Executor to run on, e.g. a
+                ``ProcessPoolExecutor`` for large CPU-bound batches. If not provided, a
+                thread pool is created for the duration of the call.
+
+        Returns:
+            list[CircuitStats]: The statistics of each program, in input order.
+        """
+        if executor is not None:
+            return list(executor.map(_program_stats, programs))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_program_stats, programs))
+
     def unitary(self) -> np.ndarray:
         """Calculate unitary of circuit."""
         if self.spec.alias in ["pyquil", "qiskit", "qasm3"]:
@@ -18,7 +18,7 @@ Module defining BraketCircuit Class
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from braket.circuits import Circuit, Instruction, Qubit
 from braket.circuits.measure import Measure
@@ -26,7 +26,7 @@ from qbraid_core.services.runtime.schemas import Program
 
 from qbraid.programs.exceptions import ProgramTypeError
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, canonical_param
 
 if TYPE_CHECKING:
     import braket.circuits
@@ -67,6 +67,25 @@ class BraketCircuit(GateModelProgram):
         """Calculate unitary of circuit."""
         return self.program.to_unitary()
 
+    def _canonical_gates(self) -> list[list[Any]]:
+        """Return the canonical gate-list view of the circuit."""
+        gates = []
+        for instr in self.program.instructions:
+            params = canonical_param(list(getattr(instr.operator, "parameters", [])))
+            if instr.power != 1:
+                params.append(["power", canonical_param(instr.power)])
+            if instr.control_state:
+                params.append(["control_state", list(instr.control_state)])
+            qubits = [int(qubit) for qubit in instr.control] + [
+                int(qubit) for qubit in instr.target
+            ]
+            gates.append([instr.operator.name, params, qubits, []])
+
+        for result_type in self.program.result_types:
+            gates.append([type(result_type).__name__, [str(result_type)], [], []])
+
+        return gates
+
     def populate_idle_qubits(self) -> None:
         """Checks whether the circuit uses contiguous qubits/indices,
         and if not, adds identity gates to vacant registers as needed."""
@@ -156,17 +175,17 @@ class BraketCircuit(GateModelProgram):
             if isinstance(instruction.operator, Measure):
                 partial_measurement_qubits.append(int(instruction.target[0]))
 
+        num_qubits = max(self._program.qubits) + 1
+
         # Only apply padding when there is partial measurement or there is non-continguous qubits
-        if (
-            len(partial_measurement_qubits) == 0
-            and max(self._program.qubits) + 1 == self._program.qubit_count
-        ):
+        if len(partial_measurement_qubits) == 0 and num_qubits == self._program.qubit_count:
             return
 
         # Add measurements on qubit 0 to N if any of them doesn't already have a
         # measurement. N is the highest qubit index in the circuit.
-        for qubit in range(max(self._program.qubits) + 1):
-            if qubit not in partial_measurement_qubits:
+        measured = set(partial_measurement_qubits)
+        for qubit in range(num_qubits):
+            if qubit not in measured:
                 self._program.measure(qubit)
 
         # Store the original partial measurement qubits for result processing
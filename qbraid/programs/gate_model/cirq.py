@@ -16,13 +16,14 @@
 Module defining CirqCircuit Class
 
 """
+from typing import Any
 
 import cirq
 import numpy as np
 
 from qbraid.programs.exceptions import ProgramTypeError
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, canonical_param
 
 
 class CirqCircuit(GateModelProgram):
@@ -54,6 +55,34 @@ class CirqCircuit(GateModelProgram):
         """Calculate unitary of circuit."""
         return self.program.unitary()
 
+    def _canonical_gates(self) -> list[list[Any]]:
+        """Return the canonical gate-list view of the circuit."""
+        qubit_index = {qubit: index for index, qubit in enumerate(sorted(self.qubits))}
+        gates = []
+        for moment in self.program:
+            operations = sorted(
+                moment.operations, key=lambda op: [qubit_index[q] for q in op.qubits]
+            )
+            for op in operations:
+                qubits = [qubit_index[q] for q in op.qubits]
+                gate = op.gate
+                if isinstance(gate, cirq.MeasurementGate):
+                    gates.append(["measure", [gate.key], qubits, []])
+                elif gate is not None and hasattr(gate, "_value_equality_values_"):
+                    values = gate._value_equality_values_()
+                    values = values if isinstance(values, tuple) else (values,)
+                    params = [
+                        [v.value, v.period] if isinstance(v, cirq.PeriodicValue) else v
+                        for v in values
+                    ]
+                    gates.append([type(gate).__name__, canonical_param(params), qubits, []])
+                elif gate is not None and cirq.has_unitary(gate):
+                    params = canonical_param(cirq.unitary(gate))
+                    gates.append([type(gate).__name__, params, qubits, []])
+                else:
+                    gates.append([type(gate or op).__name__, [repr(gate or op)], qubits, []])
+        return gates
+
     @staticmethod
     def is_measurement_gate(op: cirq.Operation) -> bool:
         """Returns whether Cirq gate/operation is MeasurementGate."""
@@ -232,14 +261,14 @@ class CirqCircuit(GateModelProgram):
         Returns:
             cirq.Circuit: A new circuit with all measurement gates removed.
         """
-        new_circuit = cirq.Circuit()
+        moments = []
         for mom in circuit:
             filtered_operations = [
                 op for op in mom.operations if not isinstance(op.gate, cirq.MeasurementGate)
             ]
             if filtered_operations:
-                new_circuit.append(cirq.Moment(filtered_operations))
-        return new_circuit
+                moments.append(cirq.Moment(filtered_operations))
+        return cirq.Circuit.from_moments(*moments)
 
     @staticmethod
     def align_final_measurements(circuit: cirq.Circuit) -> cirq.Circuit:
@@ -253,28 +282,23 @@ class CirqCircuit(GateModelProgram):
         Returns:
             cirq.Circuit: New circuit where all final measurements are aligned in the same moment.
         """
-        new_circuit = cirq.Circuit()
-
         last_ops = {qubit: None for qubit in circuit.all_qubits()}
 
-        for moment in circuit:
-            for op in moment.operations:
-                if isinstance(op.gate, cirq.MeasurementGate):
-                    last_ops[op.qubits[0]] = op
-
-        if all(op is not None for op in last_ops.values()):
-            measurement_moment = cirq.Moment()
-            for op in last_ops.values():
-                measurement_moment = measurement_moment.with_operation(op)
-            for moment in circuit:
-                non_measurement_moment = cirq.Moment()
-                for op in moment.operations:
-                    if not isinstance(op.gate, cirq.MeasurementGate):
-                        non_measurement_moment = non_measurement_moment.with_operation(op)
-                if non_measurement_moment.operations:
-                    new_circuit.append(non_measurement_moment)
-            new_circuit.append(measurement_moment)
-        else:
+        for op in circuit.all_operations():
+            if isinstance(op.gate, cirq.MeasurementGate):
+                last_ops[op.qubits[0]] = op
+
+        if not all(op is not None for op in last_ops.values()):
             return circuit
 
-        return new_circuit
+        # Each moment is built once from its operations, since Moment.with_operation
+        # copies the moment and makes wide circuits quadratic.
+        moments = []
+        for moment in circuit:
+            operations = [
+                op for op in moment.operations if not isinstance(op.gate, cirq.MeasurementGate)
+            ]
+            if operations:
+                moments.append(cirq.Moment(operations))
+        moments.append(cirq.Moment(last_ops.values()))
+        return cirq.Circuit.from_moments(*moments)
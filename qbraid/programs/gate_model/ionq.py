@@ -20,14 +20,16 @@ from __future__ import annotations
 
 import json
 from enum import Enum
-from typing import Any
+from typing import Any, Optional, Union
 
+import numpy as np
 from qbraid_core.services.runtime.schemas import Program
 
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.typer import IonQDict
 
-from ._model import GateModelProgram
+from ._gate_array import GateArray
+from ._model import GateModelProgram, canonical_param
 
 # https://docs.ionq.com/api-reference/v0.3/writing-quantum-programs#supported-gates
 IONQ_QIS_GATES = [
@@ -99,6 +101,7 @@ class IonQProgram(GateModelProgram):
         super().__init__(program)
         if not isinstance(program, IonQDict):
             raise ProgramTypeError(message=f"Expected 'IonQDict' object, got '{type(program)}'.")
+        self._gate_array: Optional[tuple[IonQDict, list[dict[str, Any]], int, GateArray]] = None
 
     @property
     def qubits(self) -> list[int]:
@@ -111,12 +114,53 @@ class IonQProgram(GateModelProgram):
         """Return the number of classical bits in the circuit."""
         return 0
 
+    def _canonical_gates(self) -> list[list[Any]]:
+        """Return the canonical gate-list view of the circuit."""
+        qubit_keys = ("control", "controls", "target", "targets")
+        gates = []
+        for instr in self.program.get("circuit", []):
+            qubits = []
+            for key in qubit_keys:
+                value = instr.get(key)
+                if value is not None:
+                    qubits.extend(value if isinstance(value, list) else [value])
+            params = [
+                [key, canonical_param(value)]
+                for key, value in sorted(instr.items())
+                if key != "gate" and key not in qubit_keys
+            ]
+            gates.append([instr.get("gate"), params, qubits, []])
+        return gates
+
+    @property
+    def gate_array(self) -> GateArray:
+        """Return the columnar representation of the circuit gate list.
+
+        The array is built once and reused until the program, or its ``circuit`` list, is
+        replaced or changes length. In-place edits of individual gate dictionaries are not
+        detected; reassign :attr:`program` after making them.
+        """
+        program = self.program
+        circuit = program["circuit"]
+        cached = self._gate_array
+        if (
+            cached is not None
+            and cached[0] is program
+            and cached[1] is circuit
+            and cached[2] == len(circuit)
+        ):
+            return cached[3]
+
+        gates = GateArray.from_ionq(circuit)
+        self._gate_array = (program, circuit, len(circuit), gates)
+        return gates
+
     @staticmethod
-    def determine_gateset(circuit: list[dict[str, Any]]) -> GateSet:
+    def determine_gateset(circuit: Union[list[dict[str, Any]], GateArray]) -> GateSet:
         """Determines the gate set of an IonQ circuit gate list.
 
         Args:
-            circuit (list[dict]): The IonQ circuit to analyze.
+            circuit (list[dict] | GateArray): The IonQ circuit to analyze.
 
         Returns:
             GateSet: The gate set of the circuit.
@@ -124,28 +168,24 @@ class IonQProgram(GateModelProgram):
         Raises:
             ValueError: If the circuit is empty, or mixes native and abstract (qis) gates.
         """
-        if not circuit:
+        if len(circuit) == 0:
             raise ValueError("Circuit is empty. Must contain at least one gate.")
 
-        native_gate_set = set(IONQ_NATIVE_GATES)
-
-        def is_native_gate(gate_info: dict) -> bool:
-            """Helper function to determine if a gate is native."""
-            gate = gate_info.get("gate")
-            if gate == "zz":
-                return gate_info.get("angle") is not None
-            return gate in native_gate_set
+        gates = circuit if isinstance(circuit, GateArray) else GateArray.from_ionq(circuit)
 
-        first_gate_native = is_native_gate(circuit[0])
+        # zz is only a native gate when given an 'angle' (rather than a 'rotation')
+        is_native = gates.name_mask(set(IONQ_NATIVE_GATES) - {"zz"}) | (
+            gates.name_mask({"zz"}) & gates.has_param("angle")
+        )
 
-        for instr in circuit:
-            if is_native_gate(instr) != first_gate_native:
-                raise ValueError(
-                    f"Invalid gate '{instr.get('gate')}'. "
-                    "Cannot mix native and QIS gates in the same circuit."
-                )
+        mismatched = np.flatnonzero(is_native != is_native[0])
+        if mismatched.size > 0:
+            raise ValueError(
+                f"Invalid gate '{gates.name(mismatched[0])}'. "
+                "Cannot mix native and QIS gates in the same circuit."
+            )
 
-        return GateSet.NATIVE if first_gate_native else GateSet.QIS
+        return GateSet.NATIVE if is_native[0] else GateSet.QIS
 
     def validate_for_gateset(self) -> None:
         """Validate that the circuit only contains gates from the derived gate set.
@@ -158,18 +198,16 @@ class IonQProgram(GateModelProgram):
             GateSet.QIS: set(IONQ_QIS_GATES),
         }
 
-        circuit: list[dict[str, Any]] = self.program["circuit"]
-
-        gate_set_name = IonQProgram.determine_gateset(circuit)
+        gates = self.gate_array
 
-        gate_set = gate_set_map[gate_set_name]
+        gate_set_name = IonQProgram.determine_gateset(gates)
 
-        for instr in circuit:
-            gate = instr.get("gate")
-            if gate not in gate_set:
-                raise ValueError(
-                    f"Invalid gate '{gate}'. Must be in the '{gate_set_name.value}' gate set."
-                )
+        invalid = np.flatnonzero(~gates.name_mask(gate_set_map[gate_set_name]))
+        if invalid.size > 0:
+            raise ValueError(
+                f"Invalid gate '{gates.name(invalid[0])}'. "
+                f"Must be in the '{gate_set_name.value}' gate set."
+            )
 
     def serialize(self) -> Program:
         """Return the program in a format suitable for submission to the qBraid API."""
@@ -17,7 +17,7 @@ Module defining PytketCircuit Class
 
 """
 
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import numpy as np
 from pytket.circuit import Circuit, Command, OpType
@@ -36,7 +36,7 @@ from pytket.unit_id import Qubit
 
 from qbraid.programs.exceptions import ProgramTypeError, TransformError
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, canonical_param
 
 IONQ_GATES = {
     OpType.X,
@@ -111,11 +111,13 @@ class PytketCircuit(GateModelProgram):
         for creg in original_circuit.bits:
             new_circuit.add_bit(creg)
 
+        # Commands are re-added with their original op and arguments, which avoids
+        # converting every gate's parameters back from symbolic expressions.
+        add_gate = new_circuit.add_gate
         for command in original_circuit.get_commands():
-            if command.op.type != OpType.Measure:
-                new_circuit.add_gate(
-                    command.op.type, command.op.params, [q.index[0] for q in command.qubits]
-                )
+            operation = command.op
+            if operation.type != OpType.Measure:
+                add_gate(operation, command.args)
 
         return new_circuit
 
@@ -127,6 +129,21 @@ class PytketCircuit(GateModelProgram):
             program_copy = self.remove_measurements(self.program)
             return program_copy.get_unitary()
 
+    def _canonical_gates(self) -> list[list[Any]]:
+        """Return the canonical gate-list view of the circuit."""
+        circuit = self.program
+        qubit_index = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+        bit_index = {bit: index for index, bit in enumerate(circuit.bits)}
+        return [
+            [
+                command.op.type.name,
+                canonical_param(list(command.op.params)),
+                [qubit_index[qubit] for qubit in command.qubits],
+                [bit_index[bit] for bit in command.bits],
+            ]
+            for command in circuit.get_commands()
+        ]
+
     def remove_idle_qubits(self) -> None:
         """Checks whether the circuit uses contiguous qubits/indices,
         and if not, reduces dimension accordingly."""
@@ -18,18 +18,19 @@ Module defining OpenQasm2Program class.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pyqasm
 from qbraid_core._import import LazyLoader
 from qbraid_core.services.runtime.schemas import Program
 
-from qbraid.passes.qasm import normalize_qasm_gate_params, rebase
+from qbraid.passes.qasm import rebase
+from qbraid.passes.qasm.analysis import canonical_gates
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.typer import Qasm2String, Qasm2StringType
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, canonical_param
 
 if TYPE_CHECKING:
     import qbraid.runtime
@@ -76,6 +77,13 @@ class OpenQasm2Program(GateModelProgram):
         """Return the unitary of the QASM"""
         raise NotImplementedError
 
+    def _canonical_gates(self) -> list[list[Any]]:
+        """Return the canonical gate-list view of the program."""
+        return [
+            [name, canonical_param(params), qubits, clbits]
+            for name, params, qubits, clbits in canonical_gates(self.program)
+        ]
+
     def validate(self) -> None:
         """Validate the QASM."""
         self._module.validate()
@@ -85,8 +93,7 @@ class OpenQasm2Program(GateModelProgram):
         basis_gates = device.profile.get("basis_gates")
 
         if basis_gates is not None and len(basis_gates) > 0:
-            transformed_qasm = rebase(self.program, basis_gates, **kwargs)
-            self._program = normalize_qasm_gate_params(transformed_qasm)
+            self._program = rebase(self.program, basis_gates, normalize_params=True, **kwargs)
 
     def serialize(self) -> Program:
         """Return the program in a format suitable for submission to the qBraid API."""
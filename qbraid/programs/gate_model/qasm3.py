@@ -18,17 +18,20 @@ Module defining OpenQasm3Program class.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator
 
 import numpy as np
 import pyqasm
 from qbraid_core.services.runtime.schemas import Program
 
-from qbraid.passes.qasm import normalize_qasm_gate_params, rebase
+from qbraid.passes.qasm import rebase
+from qbraid.passes.qasm.analysis import canonical_gates
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.typer import Qasm3String, Qasm3StringType
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, canonical_param
 
 if TYPE_CHECKING:
     import qbraid.runtime
@@ -36,12 +39,18 @@ if TYPE_CHECKING:
 
 def auto_reparse(func):
     """Decorator that ensures the quantum circuit's state
-    is validated and reparsed after method execution."""
+    is validated and reparsed after method execution.
 
+    Inside of an :meth:`OpenQasm3Program.batch` context, the reparse
+    is deferred until the outermost context exits."""
+
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         result = func(self, *args, **kwargs)
-        self._module.validate()
-        self._program = str(self._module)
+        if self._batch_depth > 0:
+            self._reparse_pending = True
+        else:
+            self._reparse()
         return result
 
     return wrapper
@@ -56,6 +65,8 @@ class OpenQasm3Program(GateModelProgram):
             raise ProgramTypeError(message=f"Expected 'str' object, got '{type(program)}'.")
         self._program: str = program
         self._module = pyqasm.loads(program)
+        self._batch_depth = 0
+        self._reparse_pending = False
 
     @property
     def module(self) -> pyqasm.Module:
@@ -87,10 +98,51 @@ class OpenQasm3Program(GateModelProgram):
         """Return the unrolled circuit depth (i.e., length of critical path)."""
         return self._module.depth(decompose_native_gates=False)
 
+    def _reparse(self) -> None:
+        """Validate the pyqasm module and re-serialize it to the program string."""
+        self._module.validate()
+        self._program = str(self._module)
+        self._reparse_pending = False
+
+    @contextmanager
+    def batch(self) -> Iterator[OpenQasm3Program]:
+        """Context manager that defers validation and re-serialization of the program
+        until the context exits, so that consecutive mutations are applied directly to
+        the pyqasm module and the program is only validated and dumped once.
+
+        Example:
+
+        .. code-block:: python
+
+            with program.batch():
+                program.populate_idle_qubits()
+                program.remove_idle_qubits()
+                program.reverse_qubit_order()
+
+        Note that :attr:`program` is not updated until the context exits, except by
+        :meth:`transform`, which applies any pending mutations before rebasing. If an
+        exception is raised inside the context, the mutations applied before it are still
+        reparsed, so that :attr:`program` stays consistent with :attr:`module`.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._reparse_pending:
+                self._reparse()
+
     def _unitary(self) -> np.ndarray:
         """Calculate unitary of circuit."""
         raise NotImplementedError
 
+    def _canonical_gates(self) -> list[list[Any]]:
+        """Return the canonical gate-list view of the program."""
+        return [
+            [name, canonical_param(params), qubits, clbits]
+            for name, params, qubits, clbits in canonical_gates(self.program)
+        ]
+
     def validate(self) -> None:
         """Validate the quantum circuit."""
         self._module.validate()
@@ -117,8 +169,9 @@ class OpenQasm3Program(GateModelProgram):
         basis_gates = device.profile.get("basis_gates")
 
         if basis_gates is not None and len(basis_gates) > 0:
-            transformed_qasm = rebase(self.program, basis_gates, **kwargs)
-            self._program = normalize_qasm_gate_params(transformed_qasm)
+            if self._reparse_pending:
+                self._reparse()
+            self._program = rebase(self.program, basis_gates, normalize_params=True, **kwargs)
             self._module.validate()
 
     def serialize(self) -> Program:
@@ -19,7 +19,7 @@ Module defining QiskitCircuit Class
 from __future__ import annotations
 
 from collections import OrderedDict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import qiskit
 from packaging import version
@@ -30,7 +30,7 @@ from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
 from qbraid.programs.exceptions import ProgramTypeError
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, canonical_param
 
 if TYPE_CHECKING:
     import numpy as np
@@ -73,6 +73,21 @@ class QiskitCircuit(GateModelProgram):
         circuit.remove_final_measurements()
         return Operator(circuit).data
 
+    def _canonical_gates(self) -> list[list[Any]]:
+        """Return the canonical gate-list view of the circuit."""
+        circuit = self.program
+        qubit_index = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+        clbit_index = {clbit: index for index, clbit in enumerate(circuit.clbits)}
+        return [
+            [
+                instruction.operation.name,
+                canonical_param(list(instruction.operation.params)),
+                [qubit_index[qubit] for qubit in instruction.qubits],
+                [clbit_index[clbit] for clbit in instruction.clbits],
+            ]
+            for instruction in circuit.data
+        ]
+
     def remove_idle_qubits(self) -> None:
         """Checks whether the circuit uses contiguous qubits/indices,
         and if not, reduces dimension accordingly."""
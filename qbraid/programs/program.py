@@ -18,8 +18,10 @@ Module defining QuantumProgram Class
 """
 from __future__ import annotations
 
+import hashlib
+import json
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from qbraid_core.services.runtime.schemas import Program
 
@@ -36,12 +38,16 @@ if TYPE_CHECKING:
     import qbraid.runtime
 
 
+_IMMUTABLE_PROGRAM_TYPES = (str, bytes)
+
+
 class QuantumProgram(ABC):
     """Abstract class for qbraid program wrapper objects."""
 
     def __init__(self, program: qbraid.programs.QPROGRAM):
         self.spec = self.get_spec(program)
         self._program: Any = None
+        self._derived: dict[str, tuple[Any, Any]] = {}
         self.program = program
 
     @property
@@ -78,6 +84,62 @@ class QuantumProgram(ABC):
 
         return ProgramSpec(type(program), alias)
 
+    def _cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return a value derived from the program.
+
+        Values are only memoized for immutable programs (e.g. OpenQASM strings), and
+        recomputed when the wrapped program object is replaced. Mutable programs (e.g.
+        circuit objects or IonQ dictionaries) can be mutated in place without the
+        wrapper knowing, so their derived values are recomputed on every call.
+        """
+        if not isinstance(self._program, _IMMUTABLE_PROGRAM_TYPES):
+            return compute()
+
+        cached = self._derived.get(key)
+        if cached is not None and cached[0] is self._program:
+            return cached[1]
+
+        value = compute()
+        self._derived[key] = (self._program, value)
+        return value
+
+    def _canonical_form(self) -> Any:
+        """Return a JSON-serializable canonical view of the program, used to
+        compute its :meth:`fingerprint`.
+
+        Program types that support fingerprinting override this method.
+        :class:`~qbraid.programs.GateModelProgram` implements it in terms of
+        ``_canonical_gates``, which each gate model program type provides.
+
+        Raises:
+            NotImplementedError: If the program type does not support fingerprinting.
+        """
+        raise NotImplementedError(
+            f"Fingerprinting is not supported for program type '{self.spec.alias}'."
+        )
+
+    def fingerprint(self) -> str:
+        """Return a stable hash of the structure of the program.
+
+        The hash is computed over a canonical, framework-native view of the program
+        (e.g. gate names, normalized parameters, qubit indices and measurements for
+        gate model programs), so two structurally identical programs of the same type
+        have the same fingerprint. The value is only cached for immutable programs,
+        so in-place mutations of circuit objects are always reflected.
+
+        Returns:
+            str: Hex-encoded SHA-256 digest of the canonical program structure.
+
+        Raises:
+            NotImplementedError: If the program type does not support fingerprinting.
+        """
+
+        def compute() -> str:
+            canonical = json.dumps(self._canonical_form(), separators=(",", ":"), sort_keys=True)
+            return hashlib.sha256(canonical.encode()).hexdigest()
+
+        return self._cached("fingerprint", compute)
+
     @property
     @abstractmethod
     def num_qubits(self) -> int:
@@ -40,7 +40,10 @@ Functions
 
     load_job
     get_providers
+    gather_results
+    as_completed
     load_provider
+    instrument
 
 Classes
 --------
@@ -52,13 +55,16 @@ Classes
     TargetProfile
     QuantumDevice
     QuantumJob
+    JobWatcher
     QuantumProvider
+    PollingStrategy
     Result
     ResultData
     GateModelResultData
     AnalogResultData
     AnalogShotResult
     AnnealingResultData
+    StageRecord
 
 Exceptions
 ------------
@@ -67,6 +73,8 @@ Exceptions
    :toctree: ../stubs/
 
     JobStateError
+    BatchPreparationError
+    BatchSubmissionError
     ProgramValidationError
     QbraidRuntimeError
     ResourceNotFoundError
@@ -81,16 +89,20 @@ from typing import TYPE_CHECKING
 from .device import QuantumDevice
 from .enums import DeviceStatus, JobStatus, ValidationLevel
 from .exceptions import (
+    BatchPreparationError,
+    BatchSubmissionError,
     DeviceProgramTypeMismatchError,
     JobStateError,
     ProgramValidationError,
     QbraidRuntimeError,
     ResourceNotFoundError,
 )
+from .instrumentation import StageRecord, instrument
 from .job import QuantumJob
 from .loader import JobLoaderError, ProviderLoaderError, get_providers, load_job, load_provider
 from .noise import NoiseModel, NoiseModelSet
 from .options import RuntimeOptions
+from .polling import PollingStrategy
 from .profile import TargetProfile
 from .provider import QuantumProvider
 from .result import Result
@@ -101,6 +113,7 @@ from .result_data import (
     GateModelResultData,
     ResultData,
 )
+from .watcher import JobWatcher, as_completed, gather_results
 
 PROVIDERS = get_providers()
 
@@ -111,7 +124,11 @@ __all__ = [
     "load_job",
     "get_providers",
     "load_provider",
+    "instrument",
+    "StageRecord",
     "JobStateError",
+    "BatchPreparationError",
+    "BatchSubmissionError",
     "ProgramValidationError",
     "QbraidRuntimeError",
     "ResourceNotFoundError",
@@ -120,8 +137,12 @@ __all__ = [
     "ProviderLoaderError",
     "TargetProfile",
     "QuantumJob",
+    "JobWatcher",
+    "gather_results",
+    "as_completed",
     "QuantumProvider",
     "RuntimeOptions",
+    "PollingStrategy",
     "NoiseModel",
     "NoiseModelSet",
     "Result",
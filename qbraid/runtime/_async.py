@@ -0,0 +1,71 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module running blocking provider calls (HTTP requests, SDK calls) from coroutines
+on a shared executor, so that they do not block the event loop.
+
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Calls are I/O bound, so many more threads than cores can be busy at once.
+DEFAULT_MAX_WORKERS = 32
+
+_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> Executor:
+    """Return the executor shared by the asynchronous runtime APIs, creating it if needed."""
+    global _executor  # pylint: disable=global-statement
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="qbraid-runtime"
+                )
+    return _executor
+
+
+def set_executor(executor: Optional[Executor]) -> None:
+    """Set the executor shared by the asynchronous runtime APIs.
+
+    Args:
+        executor (Optional[concurrent.futures.Executor]): The executor, e.g. a thread pool
+            sized for the number of jobs driven concurrently. If None, a default thread
+            pool is created on next use. The previous executor is not shut down.
+    """
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        _executor = executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking function on the shared executor and await its result.
+
+    Like :func:`asyncio.to_thread`, the function runs in a copy of the caller's context.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(), call)
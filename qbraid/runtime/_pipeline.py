@@ -0,0 +1,112 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module sharing program wrappers and type aliases between the stages of the
+runtime pipeline (transpile, transform, validate and prepare).
+
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from qbraid.programs import get_program_type_alias, load_program
+
+if TYPE_CHECKING:
+    import qbraid.programs
+
+
+class ProgramCache:
+    """Program wrappers and type aliases shared by the stages of one runtime pipeline.
+
+    Entries are keyed by the identity of the native program object, and hold a reference
+    to it so that the identity cannot be reused while the cache is alive.
+    """
+
+    def __init__(self):
+        self._aliases: dict[int, tuple[Any, Optional[str]]] = {}
+        self._wrappers: list[qbraid.programs.QuantumProgram] = []
+
+    def alias(self, program: qbraid.programs.QPROGRAM) -> Optional[str]:
+        """Return the type alias of a program, or None if it is not a registered type."""
+        cached = self._aliases.get(id(program))
+        if cached is not None and cached[0] is program:
+            return cached[1]
+
+        alias = get_program_type_alias(program, safe=True)
+        self._aliases[id(program)] = (program, alias)
+        return alias
+
+    def load(self, program: qbraid.programs.QPROGRAM) -> qbraid.programs.QuantumProgram:
+        """Return the wrapper of a program, reusing the wrapper that produced it if any.
+
+        Raises:
+            ProgramLoaderError: If the program cannot be wrapped.
+        """
+        # Wrappers are reused while they still hold the program, e.g. after a device
+        # transform returned ``wrapper.program``.
+        for wrapper in reversed(self._wrappers):
+            if wrapper.program is program:
+                return wrapper
+
+        wrapper = load_program(program)
+        self._wrappers.append(wrapper)
+        if wrapper.program is program:
+            self._aliases.setdefault(id(program), (program, wrapper.spec.alias))
+        return wrapper
+
+
+_program_cache: ContextVar[Optional[ProgramCache]] = ContextVar("program_cache", default=None)
+
+
+@contextmanager
+def program_cache() -> Iterator[ProgramCache]:
+    """Share program wrappers and aliases between calls made within the context.
+
+    Nested contexts reuse the outermost cache.
+    """
+    cache = _program_cache.get()
+    if cache is not None:
+        yield cache
+        return
+
+    cache = ProgramCache()
+    token = _program_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _program_cache.reset(token)
+
+
+def load_pipeline_program(program: qbraid.programs.QPROGRAM) -> qbraid.programs.QuantumProgram:
+    """Wrap a program, reusing the wrapper from an earlier pipeline stage if available.
+
+    Outside of a :func:`program_cache` context this is equivalent to
+    :func:`~qbraid.programs.load_program`.
+    """
+    cache = _program_cache.get()
+    if cache is None:
+        return load_program(program)
+    return cache.load(program)
+
+
+def pipeline_program_alias(program: qbraid.programs.QPROGRAM) -> Optional[str]:
+    """Return the type alias of a program, reusing the alias detected by an earlier
+    pipeline stage if available."""
+    cache = _program_cache.get()
+    if cache is None:
+        return get_program_type_alias(program, safe=True)
+    return cache.alias(program)
@@ -27,6 +27,7 @@ from braket.circuits import Circuit
 from braket.circuits.measure import Measure
 
 from qbraid.programs import NATIVE_REGISTRY, QPROGRAM_REGISTRY, ExperimentType, load_program
+from qbraid.runtime._pipeline import load_pipeline_program
 from qbraid.runtime.device import QuantumDevice
 from qbraid.runtime.enums import DeviceStatus
 from qbraid.runtime.exceptions import DeviceProgramTypeMismatchError
@@ -63,14 +64,19 @@ class BraketDevice(QuantumDevice):
         """String representation of the BraketDevice object."""
         return f"{self.__class__.__name__}('{self._provider_name} {self.name}')"
 
+    def _fetch_device_data(self) -> tuple[str, bool]:
+        self._device.refresh_metadata()
+        return self._device.status, self._device.is_available
+
     def status(self) -> qbraid.runtime.DeviceStatus:
         """Return the status of this Device."""
-        if self._device.status == "ONLINE":
-            if self._device.is_available:
+        status, is_available = self._device_data()
+        if status == "ONLINE":
+            if is_available:
                 return DeviceStatus.ONLINE
             return DeviceStatus.UNAVAILABLE
 
-        if self._device.status == "RETIRED":
+        if status == "RETIRED":
             return DeviceStatus.RETIRED
 
         return DeviceStatus.OFFLINE
@@ -148,7 +154,7 @@ class BraketDevice(QuantumDevice):
                 )
                 program = braket_transformed
 
-        qprogram = load_program(program)
+        qprogram = load_pipeline_program(program)
         qprogram.transform(self)
         program = qprogram.program
 
@@ -65,10 +65,15 @@ class BraketQuantumTask(QuantumJob):
         super().__init__(task_id, **kwargs)
         self._task = task or AwsQuantumTask(task_id)
 
+    def _fetch_job_data(self) -> str:
+        return self._task.state()
+
+    def _job_data_status(self, job_data: str) -> JobStatus:
+        return AWS_TASK_STATUS_MAP.get(job_data, JobStatus.UNKNOWN)
+
     def status(self):
         """Returns status from Braket QuantumTask object metadata."""
-        state = self._task.state()
-        status = AWS_TASK_STATUS_MAP.get(state, JobStatus.UNKNOWN)
+        status = self._job_data_status(self._job_data())
         self._cache_metadata["status"] = status
         return status
 
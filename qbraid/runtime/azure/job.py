@@ -54,19 +54,18 @@ class AzureQuantumJob(QuantumJob):
     def details(self) -> dict[str, Any]:
         """Return the details of the Azure job and
         update the metadata cache."""
-        self._job.refresh()
-        details = self._job.details.as_dict()
+        details = self._job_data()
         self._cache_metadata["details"] = details
         return details
 
-    def status(self) -> JobStatus:
-        """Return the current status of the Azure job.
+    def _fetch_job_data(self) -> dict[str, Any]:
+        """Refresh the Azure job and return its details."""
+        self._job.refresh()
+        return self._job.details.as_dict()
 
-        Returns:
-            JobStatus: The current status of the job.
-        """
-        details: dict = self.details()
-        status: str = details.get("status")
+    def _job_data_status(self, job_data: dict[str, Any]) -> JobStatus:
+        """Return the status of the job described by the given job details."""
+        status: str = job_data.get("status")
 
         status_map = {
             "Succeeded": JobStatus.COMPLETED,
@@ -78,6 +77,14 @@ class AzureQuantumJob(QuantumJob):
         }
         return status_map.get(status, JobStatus.UNKNOWN)
 
+    def status(self) -> JobStatus:
+        """Return the current status of the Azure job.
+
+        Returns:
+            JobStatus: The current status of the job.
+        """
+        return self._job_data_status(self.details())
+
     @staticmethod
     def _make_estimator_result(data: dict[str, Any]) -> dict[str, Any]:
         """Create a resource estimator result dict from the given data.
@@ -22,16 +22,13 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
+from qbraid._caching import StaleWhileRevalidateCache
 from qbraid._logging import logger
-from qbraid.programs import (
-    ProgramLoaderError,
-    ProgramSpec,
-    ProgramTypeError,
-    get_program_type_alias,
-    load_program,
-)
+from qbraid.passes.qasm import optimize as optimize_qasm
+from qbraid.programs import ProgramLoaderError, ProgramSpec, ProgramTypeError
 from qbraid.transpiler import (
     ConversionGraph,
     ConversionPathNotFoundError,
@@ -40,8 +37,11 @@ from qbraid.transpiler import (
     transpile,
 )
 
+from . import instrumentation
+from ._async import run_blocking
+from ._pipeline import load_pipeline_program, pipeline_program_alias, program_cache
 from .enums import DeviceStatus, ValidationLevel
-from .exceptions import ProgramValidationError, ResourceNotFoundError
+from .exceptions import BatchPreparationError, ProgramValidationError, ResourceNotFoundError
 from .options import RuntimeOptions
 
 if TYPE_CHECKING:
@@ -49,9 +49,24 @@ if TYPE_CHECKING:
     import qbraid.runtime
     import qbraid.transpiler
 
+# Seconds for which device status and queue information are reused by default.
+STATUS_CACHE_TTL = 5.0
+
+
+# The asynchronous counterparts of run and submit take the interface one past the limit.
+class QuantumDevice(ABC):  # pylint: disable=too-many-public-methods
+    """Abstract interface for quantum devices.
 
-class QuantumDevice(ABC):
-    """Abstract interface for quantum devices."""
+    Attributes:
+        status_cache (StaleWhileRevalidateCache): Cache of the device data from which
+            :meth:`status`, :meth:`queue_depth` and :meth:`avg_queue_time` are derived
+            (where supported), so that submitting many jobs, each of which is validated
+            against the device status, costs one request per ``ttl``. By default, data is
+            reused for :data:`STATUS_CACHE_TTL` seconds and never served stale. Set its
+            ``ttl`` to zero to request the data on every call, or its ``max_stale`` to
+            serve the previous data for that many seconds past ``ttl`` while fresh data is
+            fetched in the background. Call ``invalidate()`` to discard the cached data.
+    """
 
     def __init__(
         self,
@@ -76,6 +91,9 @@ class QuantumDevice(ABC):
         self._options = self._default_options()
         if options:
             self._options.merge(options, override_validators=False)
+        self.status_cache: StaleWhileRevalidateCache[Any] = StaleWhileRevalidateCache(
+            self._fetch_device_data, ttl=STATUS_CACHE_TTL, max_stale=0.0
+        )
 
     @property
     def profile(self) -> qbraid.runtime.TargetProfile:
@@ -112,11 +130,28 @@ class QuantumDevice(ABC):
     def status(self) -> qbraid.runtime.DeviceStatus:
         """Return device status."""
 
+    def _fetch_device_data(self) -> Any:
+        """Fetch the provider's device data from which :meth:`status` and the queue
+        information are derived. Devices that make a network request for these should
+        override this method and read the data through :meth:`_device_data`. Returns
+        None by default."""
+        return None
+
+    def _device_data(self) -> Any:
+        """Return the device data, cached according to :attr:`status_cache`."""
+        if getattr(self, "__cache_disabled", False):
+            return self._fetch_device_data()
+        return self.status_cache.get()
+
     @classmethod
     def _default_options(cls) -> RuntimeOptions:
         """Define default options for the QuantumDevice."""
         options = RuntimeOptions(
-            transpile=True, transform=True, validate=ValidationLevel.RAISE, prepare=True
+            transpile=True,
+            transform=True,
+            validate=ValidationLevel.RAISE,
+            prepare=True,
+            optimize=False,
         )
 
         # pylint: disable=unnecessary-lambda
@@ -127,6 +162,7 @@ class QuantumDevice(ABC):
             lambda x: isinstance(x, ValidationLevel) or (isinstance(x, int) and 0 <= x <= 2),
         )
         options.set_validator("prepare", lambda x: isinstance(x, bool))
+        options.set_validator("optimize", lambda x: isinstance(x, bool))
 
         # pylint: enable=unnecessary-lambda
 
@@ -284,7 +320,7 @@ class QuantumDevice(ABC):
             raise ValueError("Target profile has no program spec defined.")
 
     def _get_target_spec(self, run_input: qbraid.programs.QPROGRAM) -> ProgramSpec:
-        run_input_alias = get_program_type_alias(run_input, safe=True)
+        run_input_alias = pipeline_program_alias(run_input)
         target_specs = (
             self._target_spec
             if isinstance(self._target_spec, list)
@@ -384,6 +420,19 @@ class QuantumDevice(ABC):
         """
         return run_input
 
+    @staticmethod
+    def _optimize(run_input: qbraid.programs.QPROGRAM) -> qbraid.programs.QPROGRAM:
+        """Apply peephole optimization to OpenQASM 2 and 3 programs, cancelling adjacent
+        inverse gates, merging adjacent rotations and removing identity gates. Other program
+        types are returned unchanged.
+
+        Enabled in :meth:`apply_runtime_profile` by setting the ``optimize`` runtime option.
+
+        """
+        if pipeline_program_alias(run_input) in {"qasm2", "qasm3"}:
+            return optimize_qasm(run_input)
+        return run_input
+
     def validate(
         self, run_input_batch: list[qbraid.programs.QPROGRAM], suppress_device_warning: bool = False
     ) -> None:
@@ -408,7 +457,7 @@ class QuantumDevice(ABC):
 
         for run_input in run_input_batch:
             try:
-                program = load_program(run_input)
+                program = load_pipeline_program(run_input)
             except ProgramLoaderError:
                 logger.info(
                     "Skipping qubit count validation: program type '%s' not supported natively.",
@@ -456,28 +505,66 @@ class QuantumDevice(ABC):
     ) -> qbraid.programs.QPROGRAM:
         """Process quantum program before passing to device run method.
 
+        The stages share one program wrapper and type alias per program object, so a
+        program is wrapped and type-detected once rather than again in each stage.
+
         Returns:
             Transpiled and transformed quantum program
         """
+        with program_cache():
+            return self._apply_runtime_profile(run_input)
+
+    def _apply_runtime_profile(
+        self, run_input: qbraid.programs.QPROGRAM
+    ) -> qbraid.programs.QPROGRAM:
+        device_id = self.id
+
         if self._target_spec is not None and self._options.get("transpile") is True:
-            run_input_alias = get_program_type_alias(run_input, safe=True)
+            run_input_alias = pipeline_program_alias(run_input)
             run_input_spec = ProgramSpec(type(run_input), alias=run_input_alias)
-            run_input = self.transpile(run_input, run_input_spec)
+            with instrumentation.stage("transpile", device_id):
+                run_input = self.transpile(run_input, run_input_spec)
 
         is_single_output = not isinstance(run_input, list)
         run_input = [run_input] if is_single_output else run_input
 
         if self._options.get("transform") is True:
             logger.debug("Applying device-specific transformations (no-op in base class)")
-            run_input = [self.transform(p) for p in cast(list, run_input)]
-
-        self.validate(run_input)
-
-        run_input = [self.prepare(p) for p in cast(list, run_input)]
+            transformed = []
+            for program in cast(list, run_input):
+                with instrumentation.stage("transform", device_id):
+                    transformed.append(self.transform(program))
+            run_input = transformed
+
+        if self._options.get("optimize") is True:
+            logger.debug("Applying peephole optimization to OpenQASM programs")
+            optimized = []
+            for program in cast(list, run_input):
+                with instrumentation.stage("optimize", device_id):
+                    optimized.append(self._optimize(program))
+            run_input = optimized
+
+        with instrumentation.stage("validate", device_id):
+            self.validate(run_input)
+
+        prepared = []
+        for program in cast(list, run_input):
+            with instrumentation.stage("prepare", device_id) as record:
+                prepared.append(self.prepare(program))
+                if record.active:
+                    record.set(serialized_bytes=instrumentation.payload_size(prepared[-1]))
+        run_input = prepared
 
         run_input = run_input[0] if is_single_output else run_input
         return run_input
 
+    def _apply_runtime_profile_at(
+        self, index: int, run_input: qbraid.programs.QPROGRAM
+    ) -> qbraid.programs.QPROGRAM:
+        """Apply the runtime profile to the program at the given index of a batch."""
+        with instrumentation.program_index(index):
+            return self.apply_runtime_profile(run_input)
+
     @abstractmethod
     def submit(
         self,
@@ -487,10 +574,44 @@ class QuantumDevice(ABC):
     ) -> Union[qbraid.runtime.QuantumJob, list[qbraid.runtime.QuantumJob]]:
         """Vendor run method. Should return dictionary with the following keys."""
 
+    def _apply_runtime_profile_batch(
+        self,
+        run_input: list[qbraid.programs.QPROGRAM],
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> list[qbraid.programs.QPROGRAM]:
+        """Apply the runtime profile to a batch of programs on a worker pool.
+
+        Raises:
+            BatchPreparationError: If any of the programs could not be prepared, with the
+                error raised for each failed program.
+        """
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return self._apply_runtime_profile_batch(run_input, executor=pool)
+
+        futures = [
+            executor.submit(self._apply_runtime_profile_at, index, program)
+            for index, program in enumerate(run_input)
+        ]
+        results = []
+        errors: dict[int, Exception] = {}
+        for index, future in enumerate(futures):
+            try:
+                results.append(future.result())
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                errors[index] = err
+
+        if errors:
+            raise BatchPreparationError(errors) from next(iter(errors.values()))
+        return results
+
     def run(
         self,
         run_input: Union[qbraid.programs.QPROGRAM, list[qbraid.programs.QPROGRAM]],
         *args,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
         **kwargs,
     ) -> Union[qbraid.runtime.QuantumJob, list[qbraid.runtime.QuantumJob]]:
         """
@@ -498,17 +619,62 @@ class QuantumDevice(ABC):
 
         Args:
             run_input: A single quantum program or a list of quantum programs to run on the device.
+            max_workers (Optional[int]): If given, prepare a list of programs (transpile,
+                transform, validate and prepare) on a thread pool with this many workers.
+                Defaults to preparing the programs sequentially.
+            executor (Optional[concurrent.futures.Executor]): Executor on which to prepare
+                a list of programs. Takes precedence over ``max_workers``.
 
         Returns:
             A QuantumJob object or a list of QuantumJob objects corresponding to the input.
+
+        Raises:
+            BatchPreparationError: If a list of programs is prepared concurrently and any of
+                them could not be prepared. No programs are submitted in that case.
         """
         is_single_input = not isinstance(run_input, list)
         run_input = [run_input] if is_single_input else run_input
-        run_input_compat = [self.apply_runtime_profile(program) for program in run_input]
+        if not is_single_input and (
+            executor is not None or (max_workers is not None and max_workers > 1)
+        ):
+            run_input_compat = self._apply_runtime_profile_batch(run_input, max_workers, executor)
+        else:
+            run_input_compat = [
+                self._apply_runtime_profile_at(index, program)
+                for index, program in enumerate(run_input)
+            ]
         run_input_compat = run_input_compat[0] if is_single_input else run_input_compat
         logger.debug(
             "Submitting quantum program %s to device '%s'",
             "batch" if not is_single_input else "",
             self.id,
         )
-        return self.submit(run_input_compat, *args, **kwargs)
+        with instrumentation.stage("submit", self.id):
+            return self.submit(run_input_compat, *args, **kwargs)
+
+    async def async_submit(
+        self,
+        run_input: Union[qbraid.programs.QPROGRAM, list[qbraid.programs.QPROGRAM]],
+        *args,
+        **kwargs,
+    ) -> Union[qbraid.runtime.QuantumJob, list[qbraid.runtime.QuantumJob]]:
+        """Asynchronously submit prepared run input to the device.
+
+        The provider request runs on the executor shared by the asynchronous runtime APIs,
+        so that it does not block the event loop. Takes the same arguments as :meth:`submit`.
+        """
+        return await run_blocking(self.submit, run_input, *args, **kwargs)
+
+    async def async_run(
+        self,
+        run_input: Union[qbraid.programs.QPROGRAM, list[qbraid.programs.QPROGRAM]],
+        *args,
+        **kwargs,
+    ) -> Union[qbraid.runtime.QuantumJob, list[qbraid.runtime.QuantumJob]]:
+        """Asynchronously run a quantum job or a list of quantum jobs on this device.
+
+        Program preparation and submission run on the executor shared by the asynchronous
+        runtime APIs, so that they do not block the event loop. Takes the same arguments
+        as :meth:`run`.
+        """
+        return await run_blocking(self.run, run_input, *args, **kwargs)
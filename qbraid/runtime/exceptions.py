@@ -48,3 +48,43 @@ class DeviceProgramTypeMismatchError(ProgramValidationError):
             f"requires a program of type '{expected_type}'."
         )
         super().__init__(message)
+
+
+class BatchPreparationError(QbraidRuntimeError):
+    """Exception raised when programs in a batch could not be prepared for submission.
+
+    Attributes:
+        errors (dict[int, Exception]): The error raised for each failed program, keyed by
+            the index of the program in the batch.
+    """
+
+    def __init__(self, errors: dict[int, Exception]):
+        self.errors = dict(sorted(errors.items()))
+        details = "\n".join(
+            f"  [{index}] {type(err).__name__}: {err}" for index, err in self.errors.items()
+        )
+        message = f"{len(self.errors)} program(s) in the batch could not be prepared:\n{details}"
+        super().__init__(message)
+
+
+class BatchSubmissionError(QbraidRuntimeError):
+    """Exception raised when some jobs in a batch could not be submitted.
+
+    Attributes:
+        jobs (list[Optional[QuantumJob]]): The submitted jobs, in input order, with None
+            in place of each job that could not be submitted.
+        errors (dict[int, Exception]): The error raised for each failed submission, keyed
+            by the index of the program in the batch.
+    """
+
+    def __init__(self, jobs: list, errors: dict[int, Exception]):
+        self.jobs = jobs
+        self.errors = dict(sorted(errors.items()))
+        details = "\n".join(
+            f"  [{index}] {type(err).__name__}: {err}" for index, err in self.errors.items()
+        )
+        message = (
+            f"{len(self.errors)} of {len(jobs)} job(s) in the batch could not be "
+            f"submitted:\n{details}"
+        )
+        super().__init__(message)
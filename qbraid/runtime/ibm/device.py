@@ -24,7 +24,7 @@ from qiskit.transpiler import PassManager
 from qiskit_ibm_runtime import QiskitRuntimeService
 from qiskit_ibm_runtime import SamplerV2 as Sampler
 
-from qbraid.programs import load_program
+from qbraid.runtime._pipeline import load_pipeline_program
 from qbraid.runtime.device import QuantumDevice
 from qbraid.runtime.enums import DeviceStatus
 from qbraid.runtime.options import RuntimeOptions
@@ -84,7 +84,7 @@ class QiskitBackend(QuantumDevice):
 
     def transform(self, run_input: qiskit.QuantumCircuit) -> qiskit.QuantumCircuit:
         """Transpile a circuit for the device."""
-        program = load_program(run_input)
+        program = load_pipeline_program(run_input)
         program.transform(self)
         return program.program
 
@@ -97,11 +97,16 @@ class QiskitJob(QuantumJob):
         except Exception as err:
             raise QbraidRuntimeError(f"Error retrieving job {self.id}") from err
 
+    def _fetch_job_data(self) -> str:
+        job_status = self._job.status()
+        return job_status if isinstance(job_status, str) else job_status.name
+
+    def _job_data_status(self, job_data: str) -> JobStatus:
+        return IBM_JOB_STATUS_MAP.get(job_data, JobStatus.UNKNOWN)
+
     def status(self):
         """Returns status from Qiskit Job object."""
-        job_status = self._job.status()
-        job_status = job_status if isinstance(job_status, str) else job_status.name
-        status = IBM_JOB_STATUS_MAP.get(job_status, JobStatus.UNKNOWN)
+        status = self._job_data_status(self._job_data())
         self._cache_metadata["status"] = status
         return status
 
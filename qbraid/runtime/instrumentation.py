@@ -0,0 +1,323 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module providing instrumentation hooks that time the stages of the device run pipeline
+(transpile, transform, optimize, validate, prepare and submit).
+
+Example usage:
+
+.. code-block:: python
+
+    from qbraid.runtime import instrument
+
+    with instrument() as records:
+        device.run(circuits, shots=100)
+
+    for record in records:
+        print(record.stage, record.program_index, record.wall_time)
+
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Iterator, Optional, Union
+
+from qbraid._logging import logger
+from qbraid.transpiler.converter import conversion_observer
+
+Hook = Callable[["StageRecord"], None]
+
+
+@dataclass
+class StageRecord:
+    """Timing and resource usage of one stage of the device run pipeline.
+
+    Attributes:
+        stage (str): Name of the stage, e.g. ``"transpile"`` or ``"submit"``.
+        device_id (str): ID of the device running the pipeline.
+        start_time (int): Start of the stage, in nanoseconds since the epoch.
+        wall_time (float): Elapsed wall-clock time, in seconds.
+        cpu_time (float): CPU time of the calling thread, in seconds.
+        program_index (Optional[int]): Index of the program within the submitted batch,
+            or None for stages that process the whole batch.
+        allocated_bytes (Optional[int]): Net memory allocated during the stage, if
+            allocation tracking is enabled. :mod:`tracemalloc` counts allocations
+            process-wide, so this is left unset for stages that overlapped another
+            stage, e.g. in a concurrent batch or asynchronous submission.
+        conversion_path (Optional[str]): Conversions applied by the transpile stage,
+            e.g. ``"qasm3 -> cirq"``.
+        serialized_bytes (Optional[int]): Size of the serialized program produced by
+            the prepare stage.
+        error (Optional[str]): Name of the exception raised by the stage, if any.
+    """
+
+    stage: str
+    device_id: str
+    start_time: int
+    wall_time: float
+    cpu_time: float
+    program_index: Optional[int] = None
+    allocated_bytes: Optional[int] = None
+    conversion_path: Optional[str] = None
+    serialized_bytes: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def end_time(self) -> int:
+        """End of the stage, in nanoseconds since the epoch."""
+        return self.start_time + int(self.wall_time * 1e9)
+
+    def attributes(self) -> dict[str, Union[str, int, float]]:
+        """Return the span attributes of the record, omitting unset values."""
+        values = {
+            "qbraid.device_id": self.device_id,
+            "qbraid.cpu_time": self.cpu_time,
+            "qbraid.program_index": self.program_index,
+            "qbraid.allocated_bytes": self.allocated_bytes,
+            "qbraid.conversion_path": self.conversion_path,
+            "qbraid.serialized_bytes": self.serialized_bytes,
+            "qbraid.error": self.error,
+        }
+        return {key: value for key, value in values.items() if value is not None}
+
+    def to_span(self) -> dict[str, Any]:
+        """Return the record as an OpenTelemetry-style span dictionary."""
+        return {
+            "name": f"qbraid.runtime.{self.stage}",
+            "start_time_unix_nano": self.start_time,
+            "end_time_unix_nano": self.end_time,
+            "attributes": self.attributes(),
+            "status": "ERROR" if self.error else "OK",
+        }
+
+
+class OpenTelemetryHook:
+    """Hook that exports stage records as spans through an OpenTelemetry tracer.
+
+    Args:
+        tracer: An ``opentelemetry.trace.Tracer``, e.g. from ``trace.get_tracer(__name__)``.
+    """
+
+    def __init__(self, tracer: Any):
+        self.tracer = tracer
+
+    def __call__(self, record: StageRecord) -> None:
+        span = self.tracer.start_span(
+            f"qbraid.runtime.{record.stage}",
+            start_time=record.start_time,
+            attributes=record.attributes(),
+        )
+        span.end(end_time=record.end_time)
+
+
+_hooks: tuple[Hook, ...] = ()
+_allocation_hooks: tuple[Hook, ...] = ()
+_hooks_lock = threading.Lock()
+_started_tracemalloc = False
+
+# Stages currently measuring allocations, used to detect overlapping stages.
+_allocation_stages: set[_Stage] = set()
+_allocation_lock = threading.Lock()
+
+_program_index: ContextVar[Optional[int]] = ContextVar("program_index", default=None)
+
+
+def add_hook(hook: Hook, track_allocations: bool = False) -> None:
+    """Register a callback that receives a :class:`StageRecord` for every pipeline stage.
+
+    Args:
+        hook (Callable[[StageRecord], None]): The callback.
+        track_allocations (bool): Whether to record the memory allocated by each stage.
+            Starts :mod:`tracemalloc` if it is not already tracing, which slows down
+            the pipeline considerably. Allocations are only recorded for stages that
+            do not overlap other stages.
+    """
+    global _hooks, _allocation_hooks, _started_tracemalloc  # pylint: disable=global-statement
+    with _hooks_lock:
+        _hooks = (*_hooks, hook)
+        if track_allocations:
+            _allocation_hooks = (*_allocation_hooks, hook)
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _started_tracemalloc = True
+
+
+def remove_hook(hook: Hook) -> None:
+    """Unregister a callback added with :func:`add_hook`."""
+    global _hooks, _allocation_hooks, _started_tracemalloc  # pylint: disable=global-statement
+    with _hooks_lock:
+        _hooks = tuple(h for h in _hooks if h is not hook)
+        _allocation_hooks = tuple(h for h in _allocation_hooks if h is not hook)
+        if not _allocation_hooks and _started_tracemalloc:
+            tracemalloc.stop()
+            _started_tracemalloc = False
+
+
+@contextmanager
+def instrument(
+    hook: Optional[Hook] = None, track_allocations: bool = False
+) -> Iterator[list[StageRecord]]:
+    """Record the pipeline stages run within the context.
+
+    Hooks are process-wide, so stages run concurrently by other threads are recorded too.
+
+    Args:
+        hook (Optional[Callable[[StageRecord], None]]): Callback that also receives each
+            record, e.g. an :class:`OpenTelemetryHook`.
+        track_allocations (bool): Whether to record the memory allocated by each stage.
+
+    Yields:
+        list[StageRecord]: The records, in the order in which the stages finished.
+    """
+    records: list[StageRecord] = []
+
+    def collect(record: StageRecord) -> None:
+        records.append(record)
+        if hook is not None:
+            hook(record)
+
+    add_hook(collect, track_allocations=track_allocations)
+    try:
+        yield records
+    finally:
+        remove_hook(collect)
+
+
+def payload_size(payload: Any) -> Optional[int]:
+    """Return the size in bytes of a serialized program, or None if it is not known."""
+    data = getattr(payload, "data", payload)
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode())
+    if isinstance(data, dict):
+        return len(json.dumps(data, default=str).encode())
+    return None
+
+
+class _Stage:
+    """Context manager measuring one stage and passing its record to the hooks."""
+
+    active = True
+
+    def __init__(self, stage: str, device_id: str):
+        self.record = StageRecord(
+            stage=stage,
+            device_id=device_id,
+            start_time=0,
+            wall_time=0.0,
+            cpu_time=0.0,
+            program_index=_program_index.get(),
+        )
+        self._track_allocations = bool(_allocation_hooks) and tracemalloc.is_tracing()
+        self._overlapped = False
+        self._observer_token = None
+        self._memory = 0
+        self._wall = 0.0
+        self._cpu = 0.0
+
+    def _observe_conversion(self, path: str) -> None:
+        self.record.conversion_path = path
+
+    def set(self, **attributes: Any) -> None:
+        """Set attributes of the stage record, e.g. ``serialized_bytes``."""
+        for name, value in attributes.items():
+            setattr(self.record, name, value)
+
+    def __enter__(self) -> _Stage:
+        if self.record.stage == "transpile":
+            self._observer_token = conversion_observer.set(self._observe_conversion)
+        if self._track_allocations:
+            with _allocation_lock:
+                if _allocation_stages:
+                    self._overlapped = True
+                    for other in _allocation_stages:
+                        other._overlapped = True
+                _allocation_stages.add(self)
+            self._memory = tracemalloc.get_traced_memory()[0]
+        self.record.start_time = time.time_ns()
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        record = self.record
+        record.wall_time = time.perf_counter() - self._wall
+        record.cpu_time = time.thread_time() - self._cpu
+        if self._track_allocations:
+            memory = tracemalloc.get_traced_memory()[0]
+            with _allocation_lock:
+                _allocation_stages.discard(self)
+            if not self._overlapped:
+                record.allocated_bytes = memory - self._memory
+        if self._observer_token is not None:
+            conversion_observer.reset(self._observer_token)
+        if exc_type is not None:
+            record.error = exc_type.__name__
+
+        for hook in _hooks:
+            try:
+                hook(record)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                logger.warning("Instrumentation hook %r failed: %s", hook, err)
+
+
+class _NullStage:
+    """Stage context manager used when no hooks are registered."""
+
+    active = False
+
+    def set(self, **attributes: Any) -> None:
+        """Ignore the attributes."""
+
+    def __enter__(self) -> _NullStage:
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        return None
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name: str, device_id: str) -> Union[_Stage, _NullStage]:
+    """Return a context manager that records a pipeline stage, or a no-op if no hooks
+    are registered."""
+    if not _hooks:
+        return _NULL_STAGE
+    return _Stage(name, device_id)
+
+
+def program_index(index: int) -> ContextManager[None]:
+    """Return a context manager attributing the stages run within it to a program of
+    the submitted batch."""
+    if not _hooks:
+        return nullcontext()
+    return _program_index_context(index)
+
+
+@contextmanager
+def _program_index_context(index: int) -> Iterator[None]:
+    token = _program_index.set(index)
+    try:
+        yield
+    finally:
+        _program_index.reset(token)
@@ -29,11 +29,12 @@ from qbraid_core._import import LazyLoader
 
 from qbraid._logging import logger
 from qbraid.passes import CompilationError
-from qbraid.programs import QPROGRAM_REGISTRY, load_program
+from qbraid.programs import QPROGRAM_REGISTRY
 from qbraid.programs.gate_model.ionq import GateSet, InputFormat
 from qbraid.programs.gate_model.qasm2 import OpenQasm2Program
 from qbraid.programs.gate_model.qasm3 import OpenQasm3Program
 from qbraid.programs.typer import IonQDict, IonQDictType, QasmStringType
+from qbraid.runtime._pipeline import load_pipeline_program
 from qbraid.runtime.device import QuantumDevice
 from qbraid.runtime.enums import DeviceStatus
 from qbraid.transpiler.conversions.openqasm3.openqasm3_to_ionq import (
@@ -79,9 +80,12 @@ class IonQDevice(QuantumDevice):
         """String representation of the IonQDevice object."""
         return f"{self.__class__.__name__}('{self.id}')"
 
+    def _fetch_device_data(self) -> dict[str, Any]:
+        return self.session.get_device(self.id)
+
     def status(self) -> qbraid.runtime.DeviceStatus:
         """Return the current status of the IonQ device."""
-        device_data = self.session.get_device(self.id)
+        device_data = self._device_data()
         status = device_data.get("status")
 
         if status in ["available", "running"]:
@@ -100,14 +104,14 @@ class IonQDevice(QuantumDevice):
 
     def avg_queue_time(self) -> int:
         """Return the average queue time for the IonQ device (in minutes)."""
-        device_data = self.session.get_device(self.id)
+        device_data = self._device_data()
         milliseconds = device_data["average_queue_time"]
         minutes = milliseconds / 60000
         return int(minutes)
 
     def transform(self, run_input: QasmStringType) -> QasmStringType:
         """Transform the input to the IonQ device."""
-        program: OpenQasm2Program | OpenQasm3Program = load_program(run_input)
+        program: OpenQasm2Program | OpenQasm3Program = load_pipeline_program(run_input)
 
         try:
             program.transform(device=self, gate_mappings=IONQ_GATE_MAP)
@@ -151,7 +155,7 @@ class IonQDevice(QuantumDevice):
     # pylint:disable-next=arguments-differ,too-many-arguments
     def submit(
         self,
-        run_input: Union[IonQDictType, list[IonQDictType]],
+        run_input: Union[IonQDictType, list[IonQDictType], bytes],
         shots: int,
         dry_run: bool = False,
         name: Optional[str] = None,
@@ -160,18 +164,27 @@ class IonQDevice(QuantumDevice):
         metadata: Optional[dict[str, Any]] = None,
         **kwargs,
     ) -> IonQJob:
-        """Submit a job to the IonQ device."""
-        ionq_input = (
-            self._squash_multicircuit_input(run_input) if isinstance(run_input, list) else run_input
-        )
+        """Submit a job to the IonQ device.
+
+        The ``run_input`` may also be a single IonQ JSON program that has already been
+        serialized to bytes, e.g. by
+        :func:`~qbraid.transpiler.conversions.openqasm3.openqasm3_to_ionq.openqasm3_to_ionq_json`,
+        in which case it is spliced into the request body as-is instead of being re-encoded.
+        """
+        is_serialized = isinstance(run_input, (bytes, bytearray))
         job_data = {
             "backend": self.id,
             "shots": shots,
             "dry_run": dry_run,
-            "input": ionq_input,
             "type": "ionq.multi-circuit.v1" if isinstance(run_input, list) else "ionq.circuit.v1",
             **kwargs,
         }
+        if not is_serialized:
+            job_data["input"] = (
+                self._squash_multicircuit_input(run_input)
+                if isinstance(run_input, list)
+                else run_input
+            )
         optional_fields = {
             "name": name,
             "noise": noise,
@@ -180,7 +193,12 @@ class IonQDevice(QuantumDevice):
         if error_mitigation is not None:
             job_data["settings"] = {"error_mitigation": error_mitigation}
         job_data.update({key: value for key, value in optional_fields.items() if value is not None})
-        serialized_data = json.dumps(job_data)
+        if is_serialized:
+            serialized_data = b"".join(
+                [json.dumps(job_data)[:-1].encode(), b', "input": ', bytes(run_input), b"}"]
+            )
+        else:
+            serialized_data = json.dumps(job_data)
         job_data = self.session.create_job(serialized_data)
         job_id = job_data.get("id")
         if not job_id:
@@ -21,7 +21,7 @@ Module defining IonQ job class
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional, TypedDict, Union
+from typing import TYPE_CHECKING, Any, Hashable, Optional, TypedDict, Union
 
 from qbraid_core._import import LazyLoader
 
@@ -71,6 +71,10 @@ class IonQJob(QuantumJob):
         """Return the IonQ session."""
         return self._session
 
+    def _poll_group(self) -> Hashable:
+        """Group IonQ jobs by session."""
+        return (IonQJob, id(self.session))
+
     @staticmethod
     def _map_status(status: str) -> JobStatus:
         """Convert IonQ job status to qBraid job status."""
@@ -84,18 +88,21 @@ class IonQJob(QuantumJob):
         }
         return status_map.get(status, JobStatus.UNKNOWN)
 
+    def _fetch_job_data(self) -> dict[str, Any]:
+        """Request the job data from the IonQ API."""
+        return self.session.get_job(self.id)
+
+    def _job_data_status(self, job_data: dict[str, Any]) -> JobStatus:
+        """Return the status of the job described by the given job data."""
+        return self._map_status(job_data.get("status"))
+
     def status(self) -> JobStatus:
         """Return the current status of the IonQ job."""
-        job_data = self.session.get_job(self.id)
-        status = job_data.get("status")
-        return self._map_status(status)
+        return self._job_data_status(self._job_data())
 
     def metadata(self) -> dict[str, Any]:
         """Store and return the metadata of the IonQ job."""
-        if self.is_terminal_state() and "status" in self._cache_metadata:
-            return self._cache_metadata
-
-        job_metadata = self.session.get_job(self.id)
+        job_metadata = self._job_data()
         self._cache_metadata.update(job_metadata)
         self._cache_metadata["status"] = self._map_status(self._cache_metadata["status"])
         return self._cache_metadata
@@ -146,7 +153,7 @@ class IonQJob(QuantumJob):
     def result(self) -> Result:
         """Return the result of the IonQ job."""
         self.wait_for_final_state()
-        job_data = self.session.get_job(self.id)
+        job_data = dict(self._job_data())
         success = job_data.get("status") == "completed"
         if not success:
             failure: dict = job_data.get("failure") or {}
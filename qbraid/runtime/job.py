@@ -19,12 +19,18 @@ Module defining abstract QuantumJob Class
 from __future__ import annotations
 
 import asyncio
+import threading
 from abc import ABC, abstractmethod
-from time import sleep, time
-from typing import TYPE_CHECKING, Any, Optional
+from concurrent.futures import Future
+from time import monotonic, sleep, time
+from typing import TYPE_CHECKING, Any, Hashable, Optional, Sequence, Union
 
+from qbraid._logging import logger
+
+from ._async import run_blocking
 from .enums import JobStatus
 from .exceptions import ResourceNotFoundError
+from .polling import PollingStrategy, QueueHints, device_avg_queue_time, resolve_strategy
 
 if TYPE_CHECKING:
     import qbraid.runtime
@@ -40,6 +46,9 @@ class QuantumJob(ABC):
         self._job_id = job_id
         self._device = device
         self._cache_metadata = {"job_id": job_id, **kwargs}
+        self._job_data_cache: Optional[tuple[Any, float, bool]] = None
+        self._job_data_request: Optional[Future] = None
+        self._job_data_lock = threading.Lock()
 
     @property
     def id(self) -> str | int:  # pylint: disable=invalid-name
@@ -62,36 +71,163 @@ class QuantumJob(ABC):
         status = self.status()
         return status in terminal_states
 
+    async def async_is_terminal_state(self) -> bool:
+        """Asynchronously return True if job is in final state. False otherwise."""
+        terminal_states = JobStatus.terminal_states()
+        if self._cache_metadata.get("status", None) in terminal_states:
+            return True
+
+        return await run_blocking(self.is_terminal_state)
+
     @abstractmethod
     def status(self) -> JobStatus:
         """Return the status of the job / task , among the values of ``JobStatus``."""
 
+    async def async_status(self) -> JobStatus:
+        """Asynchronously return the status of the job.
+
+        The status request runs on the executor shared by the asynchronous runtime APIs,
+        so that it does not block the event loop.
+        """
+        return await run_blocking(self.status)
+
     def metadata(self) -> dict[str, Any]:
         """Return the metadata regarding the job."""
         status = self.status()
         self._cache_metadata["status"] = status
         return self._cache_metadata
 
-    def wait_for_final_state(self, timeout: Optional[int] = None, poll_interval: int = 5) -> None:
+    def _fetch_job_data(self) -> Any:
+        """Request the job data (status, timestamps, etc.) from the provider.
+
+        Job classes that implement this, together with :meth:`_job_data_status`, read
+        their job data through :meth:`_job_data`.
+        """
+        raise NotImplementedError
+
+    def _job_data_status(self, job_data: Any) -> JobStatus:
+        """Return the status of the job described by the given job data."""
+        raise NotImplementedError
+
+    def _set_job_data(self, job_data: Any) -> None:
+        """Cache job data, e.g. as returned by a bulk status request."""
+        terminal = self._job_data_status(job_data) in JobStatus.terminal_states()
+        with self._job_data_lock:
+            self._job_data_cache = (job_data, monotonic(), terminal)
+
+    def _job_data(self, max_age: float = 0.0) -> Any:
+        """Return the job data, requesting it from the provider if needed.
+
+        Once the job has reached a terminal state, its data is never requested again.
+        Concurrent calls share a single in-flight request.
+
+        Args:
+            max_age (float): Seconds for which cached data of a job that has not reached
+                a terminal state is reused.
+        """
+        with self._job_data_lock:
+            cached = self._job_data_cache
+            if cached is not None and (cached[2] or monotonic() - cached[1] < max_age):
+                return cached[0]
+
+            request = self._job_data_request
+            owner = request is None
+            if owner:
+                request = self._job_data_request = Future()
+
+        if not owner:
+            return request.result()
+
+        try:
+            job_data = self._fetch_job_data()
+            self._set_job_data(job_data)
+        except BaseException as err:
+            request.set_exception(err)
+            raise
+        finally:
+            with self._job_data_lock:
+                self._job_data_request = None
+
+        request.set_result(job_data)
+        return job_data
+
+    def _poll_group(self) -> Hashable:
+        """Return the key of the group of jobs whose statuses can be polled together,
+        e.g. jobs of the same provider sharing a session."""
+        return type(self)
+
+    @classmethod
+    def _poll_statuses(cls, jobs: Sequence[QuantumJob]) -> list[Union[JobStatus, Exception]]:
+        """Return the statuses of jobs sharing a poll group, with the error raised in place
+        of the status of each job that could not be polled.
+
+        Providers with a bulk status endpoint override this to query many jobs per request.
+        """
+        statuses: list[Union[JobStatus, Exception]] = []
+        for job in jobs:
+            try:
+                statuses.append(job.status())
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                statuses.append(err)
+        return statuses
+
+    def _queue_hints(self) -> QueueHints:
+        """Return hints on how long the job may stay queued, used to space out status
+        requests while waiting for the job. Fetched once per wait, since it may cost
+        extra requests."""
+        position = None
+        queue_position = getattr(self, "queue_position", None)
+        if callable(queue_position):
+            try:
+                position = queue_position()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                logger.debug("Queue position unavailable for job %s: %s", self.id, err)
+
+        return QueueHints(
+            queue_position=position, avg_queue_time=device_avg_queue_time(self._device)
+        )
+
+    def wait_for_final_state(
+        self,
+        timeout: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        strategy: Optional[PollingStrategy] = None,
+    ) -> None:
         """Poll the job status until it progresses to a final state.
 
         Args:
             timeout: Seconds to wait for the job. If ``None``, wait indefinitely.
-            poll_interval: Seconds between queries. Defaults to 5 seconds.
+            poll_interval: Constant seconds between queries. If ``None``, the intervals
+                are chosen by ``strategy``.
+            strategy: Polling strategy spacing out the queries. Defaults to exponential
+                backoff from 5 seconds, guided by the queue hints fetched at the start of
+                the wait. Cannot be combined with ``poll_interval``.
 
         Raises:
-            JobStateError: If the job does not reach a final state before the specified timeout.
+            TimeoutError: If the job does not reach a final state before the specified timeout.
 
         """
+        strategy = resolve_strategy(poll_interval, strategy)
         start_time = time()
+        attempt = 0
+        hints = None
         while not self.is_terminal_state():
             elapsed_time = time() - start_time
             if timeout is not None and elapsed_time >= timeout:
                 raise TimeoutError(f"Timeout while waiting for job {self.id}.")
-            sleep(poll_interval)
+            if attempt == 0 and strategy.use_hints:
+                hints = self._queue_hints()
+            interval = strategy.interval(attempt, elapsed_time, hints)
+            if timeout is not None:
+                interval = min(interval, timeout - elapsed_time)
+            sleep(interval)
+            attempt += 1
 
     async def _wait_for_final_state(
-        self, timeout: Optional[int] = None, poll_interval: int = 5
+        self,
+        timeout: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        strategy: Optional[PollingStrategy] = None,
     ) -> None:
         """Asynchronously wait for the job to reach a terminal state (e.g., COMPLETED, FAILED).
 
@@ -102,20 +238,35 @@ class QuantumJob(ABC):
         Args:
             timeout (Optional[int]): Maximum number of seconds to wait for the job.
                 If None, waits indefinitely.
-            poll_interval (int): Seconds between queries. Defaults to 5.
+            poll_interval (Optional[float]): Constant seconds between queries. If None,
+                the intervals are chosen by ``strategy``.
+            strategy (Optional[PollingStrategy]): Polling strategy spacing out the queries.
+                Cannot be combined with ``poll_interval``.
 
         Raises:
             TimeoutError: If the job does not reach a terminal state before the specified timeout.
         """
+        strategy = resolve_strategy(poll_interval, strategy)
         start_time = time()
-        while not self.is_terminal_state():
+        attempt = 0
+        hints = None
+        while not await self.async_is_terminal_state():
             elapsed_time = time() - start_time
             if timeout is not None and elapsed_time >= timeout:
                 raise TimeoutError(f"Timeout while waiting for job {self.id}.")
-            await asyncio.sleep(poll_interval)
+            if attempt == 0 and strategy.use_hints:
+                hints = await run_blocking(self._queue_hints)
+            interval = strategy.interval(attempt, elapsed_time, hints)
+            if timeout is not None:
+                interval = min(interval, timeout - elapsed_time)
+            await asyncio.sleep(interval)
+            attempt += 1
 
     async def async_result(
-        self, timeout: Optional[int] = None, poll_interval: int = 5
+        self,
+        timeout: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        strategy: Optional[PollingStrategy] = None,
     ) -> qbraid.runtime.Result[ResultDataType]:
         """Asynchronously wait for the job to reach a final state and return the result.
 
@@ -126,7 +277,10 @@ class QuantumJob(ABC):
         Args:
             timeout (Optional[int]): Maximum number of seconds to wait for the job.
                 If None, waits indefinitely.
-            poll_interval (int): Seconds between status checks. Defaults to 5.
+            poll_interval (Optional[float]): Constant seconds between status checks. If None,
+                the intervals are chosen by ``strategy``.
+            strategy (Optional[PollingStrategy]): Polling strategy spacing out the status
+                checks. Cannot be combined with ``poll_interval``.
 
         Returns:
             Result[ResultDataType]: The result object associated with the job,
@@ -135,8 +289,8 @@ class QuantumJob(ABC):
         Raises:
             TimeoutError: If the job does not reach a terminal state before the timeout expires.
         """
-        await self._wait_for_final_state(timeout, poll_interval)
-        return self.result()
+        await self._wait_for_final_state(timeout, poll_interval, strategy)
+        return await run_blocking(self.result)
 
     @abstractmethod
     def result(self) -> qbraid.runtime.Result[ResultDataType]:
@@ -146,6 +300,10 @@ class QuantumJob(ABC):
     def cancel(self) -> None:
         """Attempt to cancel the job."""
 
+    async def async_cancel(self) -> None:
+        """Asynchronously attempt to cancel the job."""
+        await run_blocking(self.cancel)
+
     def __repr__(self) -> str:
         """String representation of a QuantumJob object."""
         return f"<{self.__class__.__name__}(id:'{self.id}')>"
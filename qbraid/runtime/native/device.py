@@ -20,12 +20,18 @@ Module defining QbraidDevice class
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Optional
 
+import requests
 from qbraid_core.services.runtime import QuantumRuntimeClient
 from qbraid_core.services.runtime.schemas import JobRequest, Program
 
+from qbraid._logging import logger
 from qbraid.runtime.device import QuantumDevice
+from qbraid.runtime.exceptions import BatchSubmissionError
 from qbraid.runtime.noise import NoiseModel
 
 from .job import QbraidJob
@@ -36,6 +42,23 @@ if TYPE_CHECKING:
     import qbraid.runtime
 
 
+# HTTP status codes for which the job was not created, so the request can be retried.
+# Connection errors and the 5xx codes of qbraid_core.retry.STATUS_FORCELIST are already
+# retried by the client session's retry adapter, so they are not retried again here.
+TRANSIENT_STATUS_CODES = frozenset({429})
+
+
+def _is_transient_error(err: Optional[BaseException]) -> bool:
+    """Return True if a request was rejected before the server could act on it, e.g. due
+    to rate limiting, so that it is safe to retry."""
+    while err is not None:
+        if isinstance(err, requests.HTTPError):
+            response = err.response
+            return response is not None and response.status_code in TRANSIENT_STATUS_CODES
+        err = err.__cause__
+    return False
+
+
 class QbraidDevice(QuantumDevice):
     """Class to represent a qBraid device."""
 
@@ -58,14 +81,17 @@ class QbraidDevice(QuantumDevice):
         """String representation of the QbraidDevice object."""
         return f"{self.__class__.__name__}('{self.id}')"
 
+    def _fetch_device_data(self) -> qbraid_core.services.runtime.schemas.RuntimeDevice:
+        return self.client.get_device(self.id)
+
     def status(self) -> qbraid.runtime.DeviceStatus:
         """Return device status."""
-        device_data = self.client.get_device(self.id)
+        device_data = self._device_data()
         return device_data.status
 
     def queue_depth(self) -> int:
         """Return the number of jobs in the queue for the backend"""
-        device_data = self.client.get_device(self.id)
+        device_data = self._device_data()
         return device_data.queueDepth or 0
 
     def _resolve_noise_model(self, noise_model: NoiseModel | str) -> str:
@@ -85,6 +111,22 @@ class QbraidDevice(QuantumDevice):
 
         return self.profile.noise_models.get(noise_model).name
 
+    def _create_job(self, job_request: JobRequest, max_retries: int, backoff: float) -> QbraidJob:
+        """Create a job, retrying with exponential backoff and jitter on transient errors
+        that the client session does not retry itself."""
+        attempt = 0
+        while True:
+            try:
+                job_data = self.client.create_job(job_request)
+                return QbraidJob(job_id=job_data.jobQrn, device=self, client=self.client)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                if attempt >= max_retries or not _is_transient_error(err):
+                    raise
+                delay = backoff * 2**attempt * random.uniform(0.5, 1.5)
+                logger.info("Job creation failed (%s), retrying in %.2f s", err, delay)
+                time.sleep(delay)
+                attempt += 1
+
     # pylint: disable-next=too-many-arguments
     def submit(
         self,
@@ -93,8 +135,37 @@ class QbraidDevice(QuantumDevice):
         name: str | None = None,
         tags: dict[str, str | int | bool] | None = None,
         runtime_options: dict[str, Any] | None = None,
-    ) -> QbraidJob | list[QbraidJob]:
-        """Submit a program to the device."""
+        max_concurrency: int = 1,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        return_exceptions: bool = False,
+    ) -> QbraidJob | list[QbraidJob | Exception]:
+        """Submit a program or a batch of programs to the device.
+
+        Args:
+            run_input: The program or programs to submit.
+            shots: Number of shots to run each program with.
+            name: Name of the jobs.
+            tags: Tags to attach to the jobs.
+            runtime_options: Runtime options passed to the device, e.g. ``noise_model``.
+            max_concurrency: Maximum number of jobs created concurrently for a batch.
+                Defaults to creating the jobs one at a time.
+            max_retries: Number of times a job creation request is retried if it is rate
+                limited (HTTP 429). Connection errors and 5xx responses are retried by
+                the client session.
+            backoff: Delay in seconds before the first retry, doubled for each further retry.
+            return_exceptions: If True, the error raised for each job of a batch that could
+                not be created is returned in its place, instead of raising a
+                :class:`~qbraid.runtime.BatchSubmissionError`.
+
+        Returns:
+            The job, or the list of jobs in input order.
+
+        Raises:
+            BatchSubmissionError: If some of the jobs in a batch could not be created and
+                ``return_exceptions`` is False. The jobs that were created are available
+                from its ``jobs`` attribute.
+        """
         tags = tags or {}
         runtime_options = runtime_options or {}
         noise_model: NoiseModel | str | None = runtime_options.pop("noise_model", None)
@@ -105,10 +176,8 @@ class QbraidDevice(QuantumDevice):
         is_single_input = not isinstance(run_input, list)
         run_input = [run_input] if is_single_input else run_input
 
-        jobs = []
-
-        for program in run_input:
-            job_request = JobRequest(
+        job_requests = [
+            JobRequest(
                 deviceQrn=self.id,
                 program=program,
                 shots=shots,
@@ -116,7 +185,26 @@ class QbraidDevice(QuantumDevice):
                 tags=tags,
                 runtimeOptions=runtime_options,
             )
-            job_data = self.client.create_job(job_request)
-            jobs.append(QbraidJob(job_id=job_data.jobQrn, device=self, client=self.client))
-
-        return jobs[0] if is_single_input else jobs
+            for program in run_input
+        ]
+
+        if is_single_input:
+            return self._create_job(job_requests[0], max_retries, backoff)
+
+        def create(job_request: JobRequest) -> QbraidJob | Exception:
+            try:
+                return self._create_job(job_request, max_retries, backoff)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                return err
+
+        if max_concurrency > 1 and len(job_requests) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(job_requests))) as pool:
+                results = list(pool.map(create, job_requests))
+        else:
+            results = [create(job_request) for job_request in job_requests]
+
+        errors = {i: result for i, result in enumerate(results) if isinstance(result, Exception)}
+        if errors and not return_exceptions:
+            jobs = [None if isinstance(result, Exception) else result for result in results]
+            raise BatchSubmissionError(jobs, errors) from next(iter(errors.values()))
+        return results
@@ -18,7 +18,7 @@ Module defining QbraidJob class
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Hashable, Optional, Sequence, Union
 
 from qbraid_core.services.runtime import QuantumRuntimeClient
 
@@ -26,6 +26,7 @@ from qbraid._logging import logger
 from qbraid.runtime.enums import JobStatus
 from qbraid.runtime.exceptions import JobStateError, QbraidRuntimeError
 from qbraid.runtime.job import QuantumJob
+from qbraid.runtime.polling import QueueHints, device_avg_queue_time
 from qbraid.runtime.result import Result, ResultDataType
 from qbraid.runtime.result_data import ResultData
 
@@ -34,6 +35,9 @@ if TYPE_CHECKING:
 
     import qbraid.runtime
 
+BULK_PAGE_SIZE = 100
+BULK_MAX_PAGES = 10
+
 
 class QbraidJob(QuantumJob):
     """Class representing a qBraid job."""
@@ -67,18 +71,81 @@ class QbraidJob(QuantumJob):
         """Return the position of the job in the queue."""
         return self.metadata()["queuePosition"]
 
+    def _queue_hints(self) -> QueueHints:
+        """Return queue hints from the job data cached by the last status request."""
+        return QueueHints(
+            queue_position=self._cache_metadata.get("queuePosition"),
+            avg_queue_time=device_avg_queue_time(self._device),
+        )
+
+    def _update_cache(self, job_model: qbraid_core.services.runtime.schemas.RuntimeJob) -> None:
+        """Cache the job data returned by the runtime service."""
+        status = job_model.status
+        job_data = job_model.model_dump(exclude={"statusMsg"})
+        if job_model.statusMsg is not None:
+            status.set_status_message(job_model.statusMsg)
+        self._cache_metadata.update({**job_data, "status": status})
+
+    def _fetch_job_data(self) -> qbraid_core.services.runtime.schemas.RuntimeJob:
+        """Request the job data from the runtime service."""
+        return self.client.get_job(self.id)
+
+    def _job_data_status(
+        self, job_data: qbraid_core.services.runtime.schemas.RuntimeJob
+    ) -> JobStatus:
+        """Return the status of the job described by the given job data."""
+        return job_data.status
+
     def status(self) -> JobStatus:
         """Return the status of the job / task , among the values of ``JobStatus``."""
         terminal_states = JobStatus.terminal_states()
         if self._cache_metadata.get("status") not in terminal_states:
-            job_model = self.client.get_job(self.id)
-            status = job_model.status
-            job_data = job_model.model_dump(exclude={"statusMsg"})
-            if job_model.statusMsg is not None:
-                status.set_status_message(job_model.statusMsg)
-            self._cache_metadata.update({**job_data, "status": status})
+            self._update_cache(self._job_data())
         return self._cache_metadata["status"]
 
+    def _poll_group(self) -> Hashable:
+        """Group qBraid jobs by client."""
+        return (QbraidJob, id(self.client))
+
+    @classmethod
+    def _poll_statuses(cls, jobs: Sequence[QuantumJob]) -> list[Union[JobStatus, Exception]]:
+        """Return the statuses of jobs sharing a client.
+
+        Pending jobs are listed in pages of up to ``BULK_PAGE_SIZE`` jobs. Only the jobs
+        that are no longer pending are fetched individually, to read their final status.
+        If the listing fails, every job is fetched individually.
+        """
+        terminal_states = JobStatus.terminal_states()
+        polled = [job for job in jobs if job._cache_metadata.get("status") not in terminal_states]
+        if len(polled) < 2:
+            return super()._poll_statuses(jobs)
+
+        client = polled[0].client
+        pending = {}
+        try:
+            for page in range(1, BULK_MAX_PAGES + 1):
+                job_models = client.list_jobs(
+                    status_group="pending", page=page, limit=BULK_PAGE_SIZE
+                )
+                pending.update({job_model.jobQrn: job_model for job_model in job_models})
+                if len(job_models) < BULK_PAGE_SIZE:
+                    break
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logger.info("Listing pending jobs failed, polling jobs individually: %s", err)
+            return super()._poll_statuses(jobs)
+
+        statuses: dict[int, Union[JobStatus, Exception]] = {}
+        for job in polled:
+            job_model = pending.get(job.id)
+            if job_model is not None and job_model.status not in terminal_states:
+                job._set_job_data(job_model)  # pylint: disable=protected-access
+                job._update_cache(job_model)  # pylint: disable=protected-access
+                statuses[id(job)] = job._cache_metadata["status"]
+
+        unlisted = [job for job in jobs if id(job) not in statuses]
+        statuses.update(zip(map(id, unlisted), super()._poll_statuses(unlisted)))
+        return [statuses[id(job)] for job in jobs]
+
     def metadata(self) -> dict[str, Any]:
         """Return the metadata regarding the job."""
         self._cache_metadata.pop("job_id", None)
@@ -109,7 +176,7 @@ class QbraidJob(QuantumJob):
     def result(self, timeout: Optional[int] = None) -> Result[ResultDataType]:
         """Return the results of the job."""
         self.wait_for_final_state(timeout=timeout)
-        job_data = self.client.get_job(self.id)
+        job_data = self._job_data()
         cost = job_data.cost
         time_stamps = job_data.timeStamps
         success = job_data.status == JobStatus.COMPLETED
@@ -29,8 +29,9 @@ from qbraid_core.services.runtime import QuantumRuntimeClient, QuantumRuntimeSer
 from qbraid_core.services.runtime.schemas import Program, RuntimeDevice
 
 from qbraid._caching import cached_method
-from qbraid.programs import QPROGRAM_REGISTRY, ProgramSpec, load_program
+from qbraid.programs import QPROGRAM_REGISTRY, ProgramSpec
 from qbraid.programs.typer import Qasm2StringType, Qasm3StringType
+from qbraid.runtime._pipeline import load_pipeline_program
 from qbraid.runtime.exceptions import ResourceNotFoundError
 from qbraid.runtime.ionq.provider import IonQProvider
 from qbraid.runtime.noise import NoiseModelSet
@@ -46,7 +47,7 @@ if TYPE_CHECKING:
 
 
 def _serialize_program(program) -> Program:
-    qbraid_program = load_program(program)
+    qbraid_program = load_pipeline_program(program)
     return qbraid_program.serialize()
 
 
@@ -67,6 +67,17 @@ OPTIMIZATIONS = {
     16384: "simplify_measured",
 }
 
+OQC_TASK_STATUS_MAP = {
+    "CREATED": JobStatus.INITIALIZING,
+    "SUBMITTED": JobStatus.INITIALIZING,
+    "RUNNING": JobStatus.RUNNING,
+    "FAILED": JobStatus.FAILED,
+    "CANCELLED": JobStatus.CANCELLED,
+    "COMPLETED": JobStatus.COMPLETED,
+    "UNKNOWN": JobStatus.UNKNOWN,
+    "EXPIRED": JobStatus.FAILED,
+}
+
 
 class OQCJob(QuantumJob):
     """Oxford Quantum Circuit job class."""
@@ -75,7 +86,6 @@ class OQCJob(QuantumJob):
         super().__init__(job_id=job_id, **kwargs)
         self._client = client or qbraid_rt_oqc.OQCProvider().client
         self._qpu_id: Optional[str] = None
-        self._terminal_status: Optional[JobStatus] = None
 
     @property
     def qpu_id(self) -> str:
@@ -91,35 +101,24 @@ class OQCJob(QuantumJob):
 
         return self._qpu_id
 
-    def status(self) -> JobStatus:
-        """Get the status of the task."""
-        if self._terminal_status is not None:
-            return self._terminal_status
-
+    def _fetch_job_data(self) -> dict[str, Any]:
         task_status = self._client.get_task_status(task_id=self.id, qpu_id=self.qpu_id)
+        job_data = {"status": task_status}
+        if OQC_TASK_STATUS_MAP.get(task_status) == JobStatus.FAILED:
+            job_data["errors"] = self.get_errors() or {}
+        return job_data
 
-        status_map = {
-            "CREATED": JobStatus.INITIALIZING,
-            "SUBMITTED": JobStatus.INITIALIZING,
-            "RUNNING": JobStatus.RUNNING,
-            "FAILED": JobStatus.FAILED,
-            "CANCELLED": JobStatus.CANCELLED,
-            "COMPLETED": JobStatus.COMPLETED,
-            "UNKNOWN": JobStatus.UNKNOWN,
-            "EXPIRED": JobStatus.FAILED,
-        }
-
-        status = status_map.get(task_status, JobStatus.UNKNOWN)
-
-        if status in JobStatus.terminal_states():
-            if status == JobStatus.FAILED:
-                errors = self.get_errors() or {}
-                error_message = errors.get("message")
+    def _job_data_status(self, job_data: dict[str, Any]) -> JobStatus:
+        return OQC_TASK_STATUS_MAP.get(job_data["status"], JobStatus.UNKNOWN)
 
-                if error_message is not None:
-                    status.set_status_message(error_message)
+    def status(self) -> JobStatus:
+        """Get the status of the task."""
+        job_data = self._job_data()
+        status = self._job_data_status(job_data)
 
-            self._terminal_status = status
+        error_message = job_data.get("errors", {}).get("message")
+        if error_message is not None:
+            status.set_status_message(error_message)
 
         return status
 
@@ -0,0 +1,171 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module defining the strategy used to space out job status requests while waiting
+for a job to reach a final state.
+
+Example usage:
+
+.. code-block:: python
+
+    from qbraid.runtime import PollingStrategy
+
+    job.wait_for_final_state(strategy=PollingStrategy(max_interval=30))
+
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from qbraid._logging import logger
+
+if TYPE_CHECKING:
+    import qbraid.runtime
+
+
+@dataclass(frozen=True)
+class QueueHints:
+    """Server-side hints on how long a job may stay queued.
+
+    Attributes:
+        queue_position (Optional[int]): Position of the job in the device queue.
+        avg_queue_time (Optional[float]): Average time a job spends in the device
+            queue, in seconds.
+    """
+
+    queue_position: Optional[int] = None
+    avg_queue_time: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class PollingStrategy:
+    """Intervals between job status requests.
+
+    Intervals grow exponentially from ``initial_interval``, so that long queues are not
+    flooded with requests. The default first interval matches the previous fixed 5 second
+    poll; pass a smaller ``initial_interval`` to pick up short jobs sooner. When queue hints are
+    available, the interval is stretched to a fraction of the estimated remaining queue
+    time. Intervals are clamped to ``[min_interval, max_interval]``.
+
+    Attributes:
+        initial_interval (float): Seconds before the second status request.
+        max_interval (float): Upper bound on the interval, in seconds.
+        min_interval (float): Lower bound on the interval, in seconds.
+        multiplier (float): Factor by which the interval grows after each request.
+        jitter (float): Relative random spread applied to each interval, so that jobs
+            submitted together do not poll in lockstep.
+        use_hints (bool): Whether to use queue positions and average queue times.
+        hint_fraction (float): Fraction of the estimated remaining queue time to wait.
+        seconds_per_queued_job (float): Assumed queue time per job ahead in the queue.
+    """
+
+    initial_interval: float = 5.0
+    max_interval: float = 120.0
+    min_interval: float = 0.1
+    multiplier: float = 2.0
+    jitter: float = 0.1
+    use_hints: bool = True
+    hint_fraction: float = 0.25
+    seconds_per_queued_job: float = 10.0
+
+    def __post_init__(self):
+        if not 0 <= self.min_interval <= self.max_interval:
+            raise ValueError("Intervals must satisfy 0 <= min_interval <= max_interval.")
+        if self.multiplier < 1:
+            raise ValueError("multiplier must be at least 1.")
+        if not 0 <= self.jitter < 1:
+            raise ValueError("jitter must be in the range [0, 1).")
+
+    @classmethod
+    def fixed(cls, interval: float) -> PollingStrategy:
+        """Return a strategy that polls at a constant interval, without hints."""
+        return cls(
+            initial_interval=interval,
+            max_interval=interval,
+            min_interval=interval,
+            multiplier=1.0,
+            jitter=0.0,
+            use_hints=False,
+        )
+
+    def estimated_wait(self, hints: Optional[QueueHints], elapsed: float) -> Optional[float]:
+        """Return the estimated seconds until the job leaves the queue, if known."""
+        if hints is None or hints.queue_position == 0:
+            return None
+
+        estimates = []
+        if hints.queue_position is not None:
+            estimates.append(hints.queue_position * self.seconds_per_queued_job)
+        if hints.avg_queue_time is not None:
+            estimates.append(hints.avg_queue_time - elapsed)
+
+        estimate = max(estimates, default=0.0)
+        return estimate if estimate > 0 else None
+
+    def interval(
+        self, attempt: int, elapsed: float = 0.0, hints: Optional[QueueHints] = None
+    ) -> float:
+        """Return the seconds to wait after the given number of status requests.
+
+        Args:
+            attempt (int): Number of status requests made so far, minus one.
+            elapsed (float): Seconds since the wait started.
+            hints (Optional[QueueHints]): Queue hints for the job, if available.
+        """
+        interval = self.initial_interval * self.multiplier**attempt
+        estimate = self.estimated_wait(hints, elapsed) if self.use_hints else None
+        if estimate is not None:
+            interval = max(interval, estimate * self.hint_fraction)
+
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        if self.jitter:
+            interval *= random.uniform(1 - self.jitter, 1 + self.jitter)
+            interval = min(max(interval, self.min_interval), self.max_interval)
+        return interval
+
+
+DEFAULT_POLLING_STRATEGY = PollingStrategy()
+
+
+def resolve_strategy(
+    poll_interval: Optional[float] = None, strategy: Optional[PollingStrategy] = None
+) -> PollingStrategy:
+    """Return the polling strategy for a wait given a fixed interval or a strategy."""
+    if poll_interval is not None and strategy is not None:
+        raise ValueError("Specify either poll_interval or strategy, not both.")
+    if strategy is not None:
+        return strategy
+    if poll_interval is not None:
+        return PollingStrategy.fixed(poll_interval)
+    return DEFAULT_POLLING_STRATEGY
+
+
+def device_avg_queue_time(device: Optional[qbraid.runtime.QuantumDevice]) -> Optional[float]:
+    """Return the average queue time of a device in seconds, or None if it is not known.
+
+    Provider devices report :meth:`~qbraid.runtime.QuantumDevice.avg_queue_time` in minutes.
+    """
+    if device is None:
+        return None
+
+    try:
+        minutes = device.avg_queue_time()
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        logger.debug("Average queue time unavailable for %s: %s", device.id, err)
+        return None
+
+    return None if minutes is None else float(minutes) * 60
@@ -0,0 +1,443 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Module defining the JobWatcher class, which tracks many jobs until they reach a
+final state using one polling scheduler.
+
+Example usage:
+
+.. code-block:: python
+
+    from qbraid.runtime import JobWatcher
+
+    watcher = JobWatcher(jobs, callback=lambda job, status: print(job.id, status))
+
+    for job in watcher.as_completed(timeout=3600):
+        print(job.result())
+
+    # or wait for the jobs and download their results concurrently
+    results = gather_results(jobs, max_concurrency=16, timeout=3600)
+
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, Iterator, Optional, Union
+
+from qbraid._logging import logger
+
+from .enums import JobStatus
+from .polling import PollingStrategy
+
+if TYPE_CHECKING:
+    import qbraid.runtime
+    from qbraid.runtime.result_data import ResultDataType
+
+Callback = Callable[["qbraid.runtime.QuantumJob", JobStatus], None]
+
+DEFAULT_WATCHER_STRATEGY = PollingStrategy(initial_interval=1.0, max_interval=60.0)
+
+
+class _PollGroup:
+    """Jobs whose statuses are polled together, and their backoff state."""
+
+    def __init__(self, job_class: type[qbraid.runtime.QuantumJob]):
+        self.job_class = job_class
+        self.jobs: list[qbraid.runtime.QuantumJob] = []
+        self.attempt = 0
+        self.next_poll = 0.0
+        self.in_flight = False
+        self.added = False
+        # Consecutive failed status requests of each job, keyed by job identity.
+        self.errors: dict[int, int] = {}
+        # Time at which each job was first polled, keyed by job identity.
+        self.first_polled: dict[int, float] = {}
+
+
+class JobWatcher:
+    """Tracks many jobs, possibly from different providers, until they reach a final state.
+
+    Jobs are grouped by provider and session. A single scheduler thread polls each group
+    on its own backoff, using the provider's bulk status endpoint where one is available,
+    so polling costs one request per group rather than one loop per job.
+
+    A job whose status request fails is polled again with its group. After
+    ``max_poll_errors`` consecutive failures, it is reported as completed with status
+    :attr:`~qbraid.runtime.JobStatus.UNKNOWN`, and the last error is available from
+    :meth:`poll_error`. The other jobs of the group are not affected. Likewise, a job that
+    has not reached a final state ``job_timeout`` seconds after it was first polled is
+    reported with status :attr:`~qbraid.runtime.JobStatus.UNKNOWN` and a
+    :class:`TimeoutError`.
+
+    Args:
+        jobs (Iterable[QuantumJob]): Jobs to watch. More can be added with :meth:`add`.
+        strategy (Optional[PollingStrategy]): Intervals between polls of a group. Queue
+            hints are not used, since they are specific to each job.
+        callback (Optional[Callable[[QuantumJob, JobStatus], None]]): Called with each job
+            and its final status when the job completes.
+        max_workers (int): Maximum number of groups polled at once.
+        max_poll_errors (int): Number of consecutive failed status requests after which
+            a job is no longer polled.
+        job_timeout (Optional[float]): Seconds after its first poll after which a job is no
+            longer polled. If None, jobs are polled until they reach a final state.
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        jobs: Iterable[qbraid.runtime.QuantumJob] = (),
+        *,
+        strategy: Optional[PollingStrategy] = None,
+        callback: Optional[Callback] = None,
+        max_workers: int = 8,
+        max_poll_errors: int = 3,
+        job_timeout: Optional[float] = None,
+    ):
+        self._strategy = strategy or DEFAULT_WATCHER_STRATEGY
+        self._max_poll_errors = max_poll_errors
+        self._job_timeout = job_timeout
+        self._poll_errors: dict[int, BaseException] = {}
+        self._callbacks: list[Callback] = [callback] if callback is not None else []
+        self._max_workers = max_workers
+        self._groups: dict[Hashable, _PollGroup] = {}
+        self._completed: list[qbraid.runtime.QuantumJob] = []
+        self._num_jobs = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[Executor] = None
+        self._stopped = False
+
+        for job in jobs:
+            self.add(job)
+
+    def add(self, job: qbraid.runtime.QuantumJob) -> None:
+        """Start watching a job."""
+        key = job._poll_group()  # pylint: disable=protected-access
+        with self._condition:
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = _PollGroup(type(job))
+            group.jobs.append(job)
+            group.attempt = 0
+            group.next_poll = time.monotonic()
+            group.added = True
+            self._num_jobs += 1
+            self._condition.notify_all()
+
+    def add_callback(self, callback: Callback) -> None:
+        """Register a callback called with each job and its final status on completion."""
+        with self._condition:
+            self._callbacks.append(callback)
+
+    @property
+    def completed(self) -> list[qbraid.runtime.QuantumJob]:
+        """Jobs that reached a final state, in order of completion."""
+        with self._condition:
+            return list(self._completed)
+
+    def poll_error(self, job: qbraid.runtime.QuantumJob) -> Optional[BaseException]:
+        """Return the last error raised while polling a job that is no longer polled
+        because its status requests kept failing, a :class:`TimeoutError` if it exceeded
+        ``job_timeout``, or None."""
+        with self._condition:
+            return self._poll_errors.get(id(job))
+
+    @property
+    def pending(self) -> list[qbraid.runtime.QuantumJob]:
+        """Jobs that have not reached a final state yet."""
+        with self._condition:
+            return [job for group in self._groups.values() for job in group.jobs]
+
+    def start(self) -> None:
+        """Start the polling scheduler, if it is not already running."""
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="qbraid-job-watcher"
+            )
+            self._thread = threading.Thread(
+                target=self._schedule,
+                args=(self._executor,),
+                name="qbraid-job-watcher",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the polling scheduler, waiting for polls in progress to finish."""
+        with self._condition:
+            if self._thread is None:
+                return
+            self._stopped = True
+            self._condition.notify_all()
+            thread, executor = self._thread, self._executor
+            self._thread = self._executor = None
+
+        thread.join()
+        executor.shutdown(wait=True)
+
+    def __enter__(self) -> JobWatcher:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.stop()
+
+    def as_completed(self, timeout: Optional[float] = None) -> Iterator[qbraid.runtime.QuantumJob]:
+        """Yield the watched jobs as they reach a final state.
+
+        Starts the scheduler if it is not running, and stops it again once the iteration
+        ends. Jobs added while iterating are yielded too.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for all jobs. If None, wait indefinitely.
+
+        Raises:
+            TimeoutError: If not all jobs reach a final state before the timeout.
+        """
+        started = self._thread is None
+        self.start()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        index = 0
+        try:
+            while True:
+                with self._condition:
+                    while index == len(self._completed) < self._num_jobs:
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            raise TimeoutError(
+                                f"{self._num_jobs - index} jobs did not reach a final state "
+                                f"within {timeout} seconds."
+                            )
+                        self._condition.wait(remaining)
+                    if index == len(self._completed):
+                        return
+                    job = self._completed[index]
+                index += 1
+                yield job
+        finally:
+            if started:
+                self.stop()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Wait for all watched jobs to reach a final state.
+
+        Raises:
+            TimeoutError: If not all jobs reach a final state before the timeout.
+        """
+        for _ in self.as_completed(timeout=timeout):
+            pass
+
+    def _schedule(self, executor: Executor) -> None:
+        """Submit the polls of groups that are due, until the watcher is stopped."""
+        with self._condition:
+            while not self._stopped:
+                now = time.monotonic()
+                next_poll = None
+                for group in self._groups.values():
+                    if group.in_flight or not group.jobs:
+                        continue
+                    if group.next_poll <= now:
+                        group.in_flight = True
+                        group.added = False
+                        for job in group.jobs:
+                            group.first_polled.setdefault(id(job), now)
+                        executor.submit(self._poll, group, list(group.jobs))
+                    elif next_poll is None or group.next_poll < next_poll:
+                        next_poll = group.next_poll
+                self._condition.wait(None if next_poll is None else next_poll - now)
+
+    def _deadline(self, group: _PollGroup, job: qbraid.runtime.QuantumJob) -> Optional[float]:
+        """Return the time after which a job exceeds ``job_timeout``, if it has one."""
+        first_polled = group.first_polled.get(id(job))
+        if self._job_timeout is None or first_polled is None:
+            return None
+        return first_polled + self._job_timeout
+
+    def _poll(self, group: _PollGroup, jobs: list[qbraid.runtime.QuantumJob]) -> None:
+        """Poll the statuses of a group of jobs and record the completed ones."""
+        try:
+            # pylint: disable-next=protected-access
+            statuses = group.job_class._poll_statuses(jobs)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logger.warning("Failed to poll the status of %d jobs: %s", len(jobs), err)
+            statuses = [err] * len(jobs)
+
+        terminal_states = JobStatus.terminal_states()
+        done = []
+        with self._condition:
+            now = time.monotonic()
+            for job, status in zip(jobs, statuses):
+                if not isinstance(status, BaseException):
+                    group.errors.pop(id(job), None)
+                    if status in terminal_states:
+                        done.append((job, status))
+                        continue
+                else:
+                    logger.warning("Failed to poll the status of job %s: %s", job.id, status)
+                    group.errors[id(job)] = group.errors.get(id(job), 0) + 1
+                    if group.errors[id(job)] >= self._max_poll_errors:
+                        self._poll_errors[id(job)] = status
+                        done.append((job, JobStatus.UNKNOWN))
+                        continue
+                deadline = self._deadline(group, job)
+                if deadline is not None and now >= deadline:
+                    self._poll_errors[id(job)] = TimeoutError(
+                        f"Job {job.id} did not reach a final state "
+                        f"within {self._job_timeout} seconds."
+                    )
+                    done.append((job, JobStatus.UNKNOWN))
+
+            for job, _ in done:
+                group.errors.pop(id(job), None)
+                group.first_polled.pop(id(job), None)
+            done_ids = {id(job) for job, _ in done}
+            group.jobs = [job for job in group.jobs if id(job) not in done_ids]
+            self._completed.extend(job for job, _ in done)
+            if group.added:
+                group.next_poll = now
+            else:
+                group.next_poll = now + self._strategy.interval(group.attempt)
+                group.attempt += 1
+                # Poll once more when the earliest job timeout expires.
+                deadlines = [self._deadline(group, job) for job in group.jobs]
+                group.next_poll = min([group.next_poll] + [d for d in deadlines if d is not None])
+            group.in_flight = False
+            callbacks = list(self._callbacks)
+            self._condition.notify_all()
+
+        for job, status in done:
+            for callback in callbacks:
+                try:
+                    callback(job, status)
+                except Exception as err:  # pylint: disable=broad-exception-caught
+                    logger.warning("Job watcher callback %r failed: %s", callback, err)
+
+
+# pylint: disable-next=too-many-arguments
+def as_completed(
+    jobs: Iterable[qbraid.runtime.QuantumJob],
+    *,
+    max_concurrency: int = 8,
+    timeout: Optional[float] = None,
+    job_timeout: Optional[float] = None,
+    return_exceptions: bool = False,
+    strategy: Optional[PollingStrategy] = None,
+) -> Iterator[tuple[qbraid.runtime.QuantumJob, Any]]:
+    """Yield the results of many jobs as they become available.
+
+    The jobs are waited on together by a :class:`JobWatcher`, and the result of each job
+    is downloaded on a thread pool as soon as the job reaches a final state, so that
+    waiting and downloads overlap across jobs.
+
+    Args:
+        jobs (Iterable[QuantumJob]): The jobs.
+        max_concurrency (int): Maximum number of results downloaded at once.
+        timeout (Optional[float]): Seconds to wait for all results. If None, wait indefinitely.
+        job_timeout (Optional[float]): Seconds to wait for each job to reach a final state,
+            counted from when the job is first polled. Jobs that are not done in time fail
+            with a :class:`TimeoutError`.
+        return_exceptions (bool): Whether to yield the exception raised for a job in place
+            of its result, instead of raising it.
+        strategy (Optional[PollingStrategy]): Intervals between status polls.
+
+    Yields:
+        tuple[QuantumJob, Result]: Each job and its result, in order of completion.
+
+    Raises:
+        TimeoutError: If not all results are available before ``timeout``, or if a job
+            does not reach a final state before ``job_timeout`` and ``return_exceptions``
+            is False.
+    """
+    jobs = list(jobs)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    done: queue.Queue[tuple[qbraid.runtime.QuantumJob, Union[Future, BaseException]]] = (
+        queue.Queue()
+    )
+    executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="qbraid-results")
+
+    def fetch_result(job: qbraid.runtime.QuantumJob, _status: JobStatus) -> None:
+        error = watcher.poll_error(job)
+        if error is not None:
+            done.put((job, error))
+            return
+        future = executor.submit(job.result)
+        future.add_done_callback(lambda future: done.put((job, future)))
+
+    watcher = JobWatcher(jobs, strategy=strategy, callback=fetch_result, job_timeout=job_timeout)
+    watcher.start()
+    try:
+        for _ in range(len(jobs)):
+            try:
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                job, outcome = done.get(timeout=remaining)
+            except queue.Empty as err:
+                raise TimeoutError(
+                    f"Results of {len(jobs)} jobs not available within {timeout} seconds."
+                ) from err
+
+            if isinstance(outcome, Future):
+                error = outcome.exception()
+                outcome = outcome.result() if error is None else error
+            if isinstance(outcome, BaseException) and not return_exceptions:
+                raise outcome
+            yield job, outcome
+    finally:
+        watcher.stop()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# pylint: disable-next=too-many-arguments
+def gather_results(
+    jobs: Iterable[qbraid.runtime.QuantumJob],
+    *,
+    max_concurrency: int = 8,
+    timeout: Optional[float] = None,
+    job_timeout: Optional[float] = None,
+    return_exceptions: bool = False,
+    strategy: Optional[PollingStrategy] = None,
+) -> list[Union[qbraid.runtime.Result[ResultDataType], BaseException]]:
+    """Wait for many jobs and return their results, in the order of the given jobs.
+
+    Takes the same arguments as :func:`as_completed`.
+
+    Raises:
+        TimeoutError: If not all results are available before ``timeout``, or if a job
+            does not reach a final state before ``job_timeout`` and ``return_exceptions``
+            is False.
+    """
+    jobs = list(jobs)
+    positions: dict[int, list[int]] = {}
+    for index, job in enumerate(jobs):
+        positions.setdefault(id(job), []).append(index)
+
+    results: list[Any] = [None] * len(jobs)
+    unique_jobs = [jobs[indices[0]] for indices in positions.values()]
+    for job, result in as_completed(
+        unique_jobs,
+        max_concurrency=max_concurrency,
+        timeout=timeout,
+        job_timeout=job_timeout,
+        return_exceptions=return_exceptions,
+        strategy=strategy,
+    ):
+        for index in positions[id(job)]:
+            results[index] = result
+    return results
@@ -23,9 +23,10 @@ Module defining qBraid Cirq QuilOutput.
 """
 from __future__ import annotations
 
+import io
 import string
 from fractions import Fraction
-from typing import Any, Callable, Optional, Union, cast
+from typing import Any, Callable, Optional, TextIO, Union, cast
 
 import cirq
 import numpy as np
@@ -80,6 +81,20 @@ class QuilFormatter(string.Formatter):
         self.qubit_id_map = {} if qubit_id_map is None else qubit_id_map
         self.measurement_id_map = {} if measurement_id_map is None else measurement_id_map
 
+    def format(self, format_string: str, /, *args: Any, **kwargs: Any) -> str:
+        """Formats a QUIL template, replacing qubits with their QUIL output strings.
+
+        Templates without a ``meas`` field are formatted with :meth:`str.format`, which
+        parses the template in C, instead of field by field through :meth:`format_field`.
+        """
+        if ":meas" in format_string:
+            return super().format(format_string, *args, **kwargs)
+        qubit_id_map = self.qubit_id_map
+        return format_string.format(
+            *(qubit_id_map[arg] if isinstance(arg, cirq.ops.Qid) else arg for arg in args),
+            **kwargs,
+        )
+
     def format_field(  # pylint: disable=arguments-renamed
         self, value: Any, spec: str  # pylint: disable=redefined-outer-name
     ) -> str:
@@ -423,6 +438,30 @@ SUPPORTED_GATES = {
 }
 
 
+# Converters resolved per gate type, including subclasses of the supported gate types.
+_GATE_DISPATCH: dict[type, Optional[Callable[[cirq.Operation, QuilFormatter], Optional[str]]]] = {}
+
+_DEFGATE_TYPES = (QuilOneQubitGate, QuilTwoQubitGate)
+
+
+def _gate_converter(
+    gate_type: type,
+) -> Optional[Callable[[cirq.Operation, QuilFormatter], Optional[str]]]:
+    """Returns the QUIL converter of a gate type, resolving it once per type."""
+    try:
+        return _GATE_DISPATCH[gate_type]
+    except KeyError:
+        pass
+    converter = SUPPORTED_GATES.get(gate_type)
+    if converter is None:
+        converter = next(
+            (fn for supported, fn in SUPPORTED_GATES.items() if issubclass(gate_type, supported)),
+            None,
+        )
+    _GATE_DISPATCH[gate_type] = converter
+    return converter
+
+
 class QuilOutput:
     """An object for passing operations and qubits then outputting them to
     QUIL format. The string representation returns the QUIL output for the
@@ -476,12 +515,23 @@ class QuilOutput:
     def save_to_file(self, path: Union[str, bytes, int]) -> None:
         """Write QUIL output to a file specified by path."""
         with open(path, "w", encoding="utf-8") as f:
-            f.write(str(self))
+            self.write(f)
+
+    def write(self, sink: TextIO) -> None:
+        """Write the QUIL output to a text stream, one operation at a time.
+
+        DEFGATE names are numbered as the gates are written, so the output does not
+        need a second renaming pass (see :meth:`rename_defgates`).
+
+        Args:
+            sink: Text stream to write to, e.g. an open file or :class:`io.StringIO`.
+        """
+        self._write_quil(sink.write)
 
     def __str__(self) -> str:
-        output = []
-        self._write_quil(lambda s: output.append(s))  # pylint: disable=unnecessary-lambda
-        return self.rename_defgates("".join(output))
+        output = io.StringIO()
+        self.write(output)
+        return output.getvalue()
 
     def _op_to_maybe_quil(self, op: cirq.Operation) -> Optional[str]:
         # Measurements need special handling to apply the global bit offset
@@ -489,11 +539,10 @@ class QuilOutput:
         if isinstance(op.gate, ops.MeasurementGate):
             return self._measurement_gate_with_offset(op)
 
-        for gate_type, supported_gate in SUPPORTED_GATES.items():
-            if isinstance(op.gate, gate_type):
-                quil_fn: Callable[[cirq.Operation, QuilFormatter], Optional[str]] = supported_gate
-                return quil_fn(op, self.formatter)
-        return None
+        quil_fn = _gate_converter(type(op.gate))
+        if quil_fn is None:
+            return None
+        return quil_fn(op, self.formatter)
 
     def _measurement_gate_with_offset(self, op: cirq.Operation) -> str:
         """Render a MeasurementGate using the pre-computed global bit offset."""
@@ -534,12 +583,15 @@ class QuilOutput:
                 output_func(f"DECLARE {self.measurement_id_map[key]} BIT[{total_bits}]\n")
             output_func("\n")
 
+        # QUIL of the operations accepted by keep, so that they are only converted once.
+        converted: dict[int, str] = {}
+
         def keep(op: "cirq.Operation") -> bool:
-            if isinstance(op.gate, tuple(SUPPORTED_GATES.keys())):
-                if not self._op_to_maybe_quil(op):
-                    return False
-                return True
-            return False
+            quil_str = self._op_to_maybe_quil(op)
+            if not quil_str:
+                return False
+            converted[id(op)] = quil_str
+            return True
 
         def fallback(op):
             if len(op.qubits) not in [1, 2]:
@@ -561,14 +613,27 @@ class QuilOutput:
                 return ValueError(f"Cannot output operation as QUIL: {bad_op!r}")
             return None
 
+        num_defgates = 0
         for main_op in self.operations:
-            decomposed = protocols.decompose(
-                main_op, keep=keep, fallback_decomposer=fallback, on_stuck_raise=on_stuck
-            )
+            # Most operations convert directly, without a decomposition.
+            if keep(main_op):
+                decomposed = [main_op]
+            else:
+                decomposed = protocols.decompose(
+                    main_op, keep=keep, fallback_decomposer=fallback, on_stuck_raise=on_stuck
+                )
 
             for decomposed_op in decomposed:
-                if not repr(decomposed_op).startswith("cirq.global_phase_operation"):
-                    output_func(self._op_to_quil(decomposed_op))
+                quil_str = converted.get(id(decomposed_op))
+                if quil_str is None:
+                    if repr(decomposed_op).startswith("cirq.global_phase_operation"):
+                        continue
+                    quil_str = self._op_to_quil(decomposed_op)
+                if isinstance(decomposed_op.gate, _DEFGATE_TYPES):
+                    num_defgates += 1
+                    quil_str = quil_str.replace("USERGATE", f"USERGATE{num_defgates}")
+                output_func(quil_str)
+            converted.clear()
 
     def rename_defgates(self, output: str) -> str:
         """A function for renaming the DEFGATEs within the QUIL output. This
@@ -21,8 +21,8 @@ Module for converting Braket circuits to Cirq circuits
 """
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import TYPE_CHECKING, Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Hashable, Optional, Sequence, Union
 
 import numpy as np
 
@@ -59,6 +59,15 @@ except ImportError:  # pragma: no cover
 if TYPE_CHECKING:
     import braket.circuits
 
+# An instruction sequence with qubits replaced by positions in the operation's qubit list,
+# stored as ``(operator, positions)`` pairs and instantiated on concrete qubits.
+InstructionTemplate = tuple[tuple[Any, tuple[int, ...]], ...]
+
+TEMPLATE_CACHE_SIZE = 1024
+
+# Number of decimals to which unitaries are rounded to form decomposition cache keys.
+UNITARY_KEY_DECIMALS = 12
+
 
 @weight(0.85)
 def cirq_to_braket(circuit: Circuit) -> braket.circuits.Circuit:
@@ -70,12 +79,10 @@ def cirq_to_braket(circuit: Circuit) -> braket.circuits.Circuit:
     Returns:
         Braket circuit equivalent to the input Cirq circuit.
     """
-    cirq_qubits = list(circuit.all_qubits())
-    cirq_int_qubits = [
-        qbraid.programs.gate_model.cirq.CirqCircuit._int_from_qubit(q) for q in cirq_qubits
-    ]
-    braket_int_qubits = deepcopy(cirq_int_qubits)
-    qubit_mapping = {q: braket_int_qubits[i] for i, q in enumerate(cirq_int_qubits)}
+    qubit_mapping = {
+        qubit: qbraid.programs.gate_model.cirq.CirqCircuit._int_from_qubit(qubit)
+        for qubit in circuit.all_qubits()
+    }
     return BKCircuit(
         _to_braket_instruction(operation, qubit_mapping) for operation in circuit.all_operations()
     )
@@ -83,13 +90,13 @@ def cirq_to_braket(circuit: Circuit) -> braket.circuits.Circuit:
 
 def _to_braket_instruction(
     operation: cirq_ops.Operation,
-    qubit_mapping: dict[int, int],
+    qubit_mapping: dict[cirq_ops.Qid, int],
 ) -> list[braket.circuits.Instruction]:
     """Converts Cirq operation to equivalent Braket instruction(s).
 
     Args:
         operation: Cirq operation to convert.
-        qubit_mapping: Mappings of input / output qubit indicies
+        qubit_mapping: Mapping of Cirq qubits to Braket qubit indices
 
     Raises:
         ProgramConversionError: If the operation cannot be converted to Braket.
@@ -100,11 +107,7 @@ def _to_braket_instruction(
         return []
 
     nqubits = protocols.num_qubits(operation)
-    cirq_qubits = operation.qubits
-    cirq_qubits = [
-        qbraid.programs.gate_model.cirq.CirqCircuit._int_from_qubit(q) for q in operation.qubits
-    ]
-    qubits = [qubit_mapping[x] for x in cirq_qubits]
+    qubits = [qubit_mapping[qubit] for qubit in operation.qubits]
 
     if nqubits == 1:
         target = qubits[0]
@@ -140,117 +143,150 @@ def _to_braket_instruction(
     raise ProgramConversionError(f"Unable to convert {operation} to Braket")
 
 
-def _to_one_qubit_braket_instruction(
-    operation: Union[np.ndarray, cirq_ops.Gate, cirq_ops.Operation],
-    target: int,
-    gate_name: Optional[str] = None,
+def _template(instructions: list[braket.circuits.Instruction]) -> InstructionTemplate:
+    """Converts instructions built on qubits ``0, 1, ...`` to a reusable template."""
+    return tuple(
+        (instr.operator, tuple(int(qubit) for qubit in instr.target)) for instr in instructions
+    )
+
+
+def _instantiate(
+    template: InstructionTemplate, qubits: Sequence[int]
 ) -> list[braket.circuits.Instruction]:
-    """Converts one-qubit Cirq operation or NumPy array to equivalent Braket instruction(s)
+    """Builds the instructions of a template on the given qubits."""
+    return [
+        BKInstruction(operator, [qubits[position] for position in positions])
+        for operator, positions in template
+    ]
 
-    Args:
-        operation: One-qubit Cirq operation or numpy unitary to translate.
-        target: Qubit index for the operation to act on. Must be specified and if only
-            if `operation` is given as a numpy array.
-        gate_name: Optional unitary gate display name for `operation` of type `np.ndarray`
 
-    Raises:
-        ValueError: If the operation cannot be converted to Braket.
-    """
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
 
-    def instruction_from_matrix(matrix, target, name):
-        display_name = "U" if name is None or "QasmUGate" in name else name
-        return [BKInstruction(braket_gates.Unitary(matrix, display_name=display_name), target)]
 
-    def convert_one_qubit_gate(gate, target):
-        if isinstance(gate, cirq_ops.XPowGate):
-            exponent = gate.exponent
+def _instruction_from_matrix(
+    matrix: np.ndarray, target: int, name: Optional[str]
+) -> list[braket.circuits.Instruction]:
+    display_name = "U" if name is None or "QasmUGate" in name else name
+    return [BKInstruction(braket_gates.Unitary(matrix, display_name=display_name), target)]
+
+
+# pylint: disable-next=too-many-return-statements,too-many-branches
+def _convert_one_qubit_gate(gate: cirq_ops.Gate, target: int) -> list[braket.circuits.Instruction]:
+    """Converts a one-qubit Cirq gate to equivalent Braket instruction(s)."""
+    if isinstance(gate, cirq_ops.XPowGate):
+        exponent = gate.exponent
+        if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
+            return [BKInstruction(braket_gates.X(), target)]
+        if np.isclose(exponent, 0.5):
+            return [BKInstruction(braket_gates.V(), target)]
+        if np.isclose(exponent, -0.5):
+            return [BKInstruction(braket_gates.Vi(), target)]
+
+        return [BKInstruction(braket_gates.Rx(exponent * np.pi), target)]
+
+    if isinstance(gate, cirq_ops.YPowGate):
+        exponent = gate.exponent
+
+        if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
+            return [BKInstruction(braket_gates.Y(), target)]
+
+        return [BKInstruction(braket_gates.Ry(exponent * np.pi), target)]
+
+    if isinstance(gate, cirq_ops.ZPowGate):
+        global_shift = gate.global_shift
+        exponent = gate.exponent
+
+        if np.isclose(global_shift, 0.0):
             if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
-                return [BKInstruction(braket_gates.X(), target)]
+                return [BKInstruction(braket_gates.Z(), target)]
             if np.isclose(exponent, 0.5):
-                return [BKInstruction(braket_gates.V(), target)]
+                return [BKInstruction(braket_gates.S(), target)]
             if np.isclose(exponent, -0.5):
-                return [BKInstruction(braket_gates.Vi(), target)]
+                return [BKInstruction(braket_gates.Si(), target)]
+            if np.isclose(exponent, 0.25):
+                return [BKInstruction(braket_gates.T(), target)]
+            if np.isclose(exponent, -0.25):
+                return [BKInstruction(braket_gates.Ti(), target)]
+            return [BKInstruction(braket_gates.PhaseShift(exponent * np.pi), target)]
+        if np.isclose(global_shift, -0.5):
+            return [BKInstruction(braket_gates.Rz(exponent * np.pi), target)]
 
-            return [BKInstruction(braket_gates.Rx(exponent * np.pi), target)]
+    if isinstance(gate, cirq_ops.HPowGate) and np.isclose(abs(gate.exponent), 1.0):
+        return [BKInstruction(braket_gates.H(), target)]
 
-        if isinstance(gate, cirq_ops.YPowGate):
-            exponent = gate.exponent
+    if isinstance(gate, cirq_ops.IdentityGate):
+        return [BKInstruction(braket_gates.I(), target)]
 
-            if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
-                return [BKInstruction(braket_gates.Y(), target)]
+    if isinstance(gate, cirq_ops.BitFlipChannel):
+        return [BKInstruction(braket_noise_gate.BitFlip(gate._p), target)]
 
-            return [BKInstruction(braket_gates.Ry(exponent * np.pi), target)]
+    if isinstance(gate, cirq_ops.PhaseFlipChannel):
+        return [BKInstruction(braket_noise_gate.PhaseFlip(gate._p), target)]
 
-        if isinstance(gate, cirq_ops.ZPowGate):
-            global_shift = gate.global_shift
-            exponent = gate.exponent
+    if isinstance(gate, cirq_ops.DepolarizingChannel):
+        return [BKInstruction(braket_noise_gate.Depolarizing(gate._p), target)]
 
-            if np.isclose(global_shift, 0.0):
-                if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
-                    return [BKInstruction(braket_gates.Z(), target)]
-                if np.isclose(exponent, 0.5):
-                    return [BKInstruction(braket_gates.S(), target)]
-                if np.isclose(exponent, -0.5):
-                    return [BKInstruction(braket_gates.Si(), target)]
-                if np.isclose(exponent, 0.25):
-                    return [BKInstruction(braket_gates.T(), target)]
-                if np.isclose(exponent, -0.25):
-                    return [BKInstruction(braket_gates.Ti(), target)]
-                return [BKInstruction(braket_gates.PhaseShift(exponent * np.pi), target)]
-            if np.isclose(global_shift, -0.5):
-                return [BKInstruction(braket_gates.Rz(exponent * np.pi), target)]
+    if isinstance(gate, cirq_ops.AmplitudeDampingChannel):
+        return [BKInstruction(braket_noise_gate.AmplitudeDamping(gate._gamma), target)]
 
-        if isinstance(gate, cirq_ops.HPowGate) and np.isclose(abs(gate.exponent), 1.0):
-            return [BKInstruction(braket_gates.H(), target)]
+    if isinstance(gate, cirq_ops.GeneralizedAmplitudeDampingChannel):
+        return [
+            BKInstruction(
+                braket_noise_gate.GeneralizedAmplitudeDamping(
+                    gamma=gate._gamma, probability=gate._p
+                ),
+                target,
+            )
+        ]
 
-        if isinstance(gate, cirq_ops.IdentityGate):
-            return [BKInstruction(braket_gates.I(), target)]
+    if isinstance(gate, cirq_ops.PhaseDampingChannel):
+        return [BKInstruction(braket_noise_gate.PhaseDamping(gate._gamma), target)]
 
-        if isinstance(gate, cirq_ops.BitFlipChannel):
-            return [BKInstruction(braket_noise_gate.BitFlip(operation.gate._p), target)]
+    if cirq_ionq_ops and isinstance(
+        gate, (cirq_ionq_ops.GPIGate, cirq_ionq_ops.GPI2Gate, cirq_ionq_ops.MSGate)
+    ):
+        if isinstance(gate, cirq_ionq_ops.GPIGate):
+            return [BKInstruction(braket_gates.GPi(angle=gate.phi * 2 * np.pi), target)]
+        if isinstance(gate, cirq_ionq_ops.GPI2Gate):
+            return [BKInstruction(braket_gates.GPi2(angle=gate.phi * 2 * np.pi), target)]
 
-        if isinstance(gate, cirq_ops.PhaseFlipChannel):
-            return [BKInstruction(braket_noise_gate.PhaseFlip(operation.gate._p), target)]
+    matrix = protocols.unitary(gate)
+    gate_name = "U" if isinstance(gate, cirq_ops.MatrixGate) else str(gate)
+    return _to_one_qubit_braket_instruction(matrix, target, gate_name=gate_name)
 
-        if isinstance(gate, cirq_ops.DepolarizingChannel):
-            return [BKInstruction(braket_noise_gate.Depolarizing(operation.gate._p), target)]
 
-        if isinstance(gate, cirq_ops.AmplitudeDampingChannel):
-            return [
-                BKInstruction(braket_noise_gate.AmplitudeDamping(operation.gate._gamma), target)
-            ]
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _one_qubit_template(gate: Hashable) -> InstructionTemplate:
+    """Returns the cached Braket instruction template of a one-qubit Cirq gate."""
+    return _template(_convert_one_qubit_gate(gate, 0))
 
-        if isinstance(gate, cirq_ops.GeneralizedAmplitudeDampingChannel):
-            return [
-                BKInstruction(
-                    braket_noise_gate.GeneralizedAmplitudeDamping(
-                        gamma=operation.gate._gamma, probability=operation.gate._p
-                    ),
-                    target,
-                )
-            ]
 
-        if isinstance(gate, cirq_ops.PhaseDampingChannel):
-            return [BKInstruction(braket_noise_gate.PhaseDamping(operation.gate._gamma), target)]
-
-        if cirq_ionq_ops and isinstance(
-            gate, (cirq_ionq_ops.GPIGate, cirq_ionq_ops.GPI2Gate, cirq_ionq_ops.MSGate)
-        ):
-            if isinstance(gate, cirq_ionq_ops.GPIGate):
-                return [
-                    BKInstruction(braket_gates.GPi(angle=operation.gate.phi * 2 * np.pi), target)
-                ]
-            if isinstance(gate, cirq_ionq_ops.GPI2Gate):
-                return [
-                    BKInstruction(braket_gates.GPi2(angle=operation.gate.phi * 2 * np.pi), target)
-                ]
-
-        matrix = protocols.unitary(gate)
-        gate_name = "U" if isinstance(gate, cirq_ops.MatrixGate) else str(gate)
-        return _to_one_qubit_braket_instruction(matrix, target, gate_name=gate_name)
+def _to_one_qubit_braket_instruction(
+    operation: Union[np.ndarray, cirq_ops.Gate, cirq_ops.Operation],
+    target: int,
+    gate_name: Optional[str] = None,
+) -> list[braket.circuits.Instruction]:
+    """Converts one-qubit Cirq operation or NumPy array to equivalent Braket instruction(s)
+
+    Conversions of hashable gates are cached as instruction templates, so repeated gates
+    are only decomposed once.
+
+    Args:
+        operation: One-qubit Cirq operation or numpy unitary to translate.
+        target: Qubit index for the operation to act on. Must be specified and if only
+            if `operation` is given as a numpy array.
+        gate_name: Optional unitary gate display name for `operation` of type `np.ndarray`
 
+    Raises:
+        ValueError: If the operation cannot be converted to Braket.
+    """
     if isinstance(operation, np.ndarray):
-        return instruction_from_matrix(operation, target, gate_name)
+        return _instruction_from_matrix(operation, target, gate_name)
 
     if isinstance(operation, cirq_ops.Operation):
         gate = operation.gate
@@ -259,7 +295,10 @@ def _to_one_qubit_braket_instruction(
     else:
         raise ValueError(f"Unable to convert {operation} to braket")
 
-    return convert_one_qubit_gate(gate, target)
+    if not _is_hashable(gate):
+        return _convert_one_qubit_gate(gate, target)
+
+    return _instantiate(_one_qubit_template(gate), [target])
 
 
 def _to_two_qubit_braket_instruction(
@@ -328,16 +367,10 @@ def _to_two_qubit_braket_instruction(
     return _kak_decomposition_to_braket_instruction(unitary, q1, q2)
 
 
-def _kak_decomposition_to_braket_instruction(
-    matrix: np.ndarray, q1: int, q2: int
-) -> list[braket.circuits.Instruction]:
-    """Converts 4x4 Numpy array to equivalent Braket instruction(s) via kak decomposition
-
-    Args:
-        matrix: Unitary 4x4 numpy array representing 2-qubit gate.
-        q1: Index of first qubit to act on
-        q2: Index of second qubit to act on
-    """
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _kak_template(key: bytes) -> InstructionTemplate:
+    """Returns the cached KAK decomposition template of a rounded 4x4 unitary."""
+    matrix = np.frombuffer(key, dtype=np.complex128).reshape(4, 4)
     kak = kak_decomposition(matrix)
     A1, A2 = kak.single_qubit_operations_before
 
@@ -348,17 +381,37 @@ def _kak_decomposition_to_braket_instruction(
 
     B1, B2 = kak.single_qubit_operations_after
 
-    return [
-        *_to_one_qubit_braket_instruction(A1, q1),
-        *_to_one_qubit_braket_instruction(A2, q2),
-        BKInstruction(braket_gates.Rx(0.5 * np.pi), q1),
-        BKInstruction(braket_gates.CNot(), [q1, q2]),
-        BKInstruction(braket_gates.Rx(a * np.pi), q1),
-        BKInstruction(braket_gates.Ry(b * np.pi), q2),
-        BKInstruction(braket_gates.CNot(), [q2, q1]),
-        BKInstruction(braket_gates.Rx(-0.5 * np.pi), q2),
-        BKInstruction(braket_gates.Rz(c * np.pi), q2),
-        BKInstruction(braket_gates.CNot(), [q1, q2]),
-        *_to_one_qubit_braket_instruction(B1, q1),
-        *_to_one_qubit_braket_instruction(B2, q2),
-    ]
+    return _template(
+        [
+            *_to_one_qubit_braket_instruction(A1, 0),
+            *_to_one_qubit_braket_instruction(A2, 1),
+            BKInstruction(braket_gates.Rx(0.5 * np.pi), 0),
+            BKInstruction(braket_gates.CNot(), [0, 1]),
+            BKInstruction(braket_gates.Rx(a * np.pi), 0),
+            BKInstruction(braket_gates.Ry(b * np.pi), 1),
+            BKInstruction(braket_gates.CNot(), [1, 0]),
+            BKInstruction(braket_gates.Rx(-0.5 * np.pi), 1),
+            BKInstruction(braket_gates.Rz(c * np.pi), 1),
+            BKInstruction(braket_gates.CNot(), [0, 1]),
+            *_to_one_qubit_braket_instruction(B1, 0),
+            *_to_one_qubit_braket_instruction(B2, 1),
+        ]
+    )
+
+
+def _kak_decomposition_to_braket_instruction(
+    matrix: np.ndarray, q1: int, q2: int
+) -> list[braket.circuits.Instruction]:
+    """Converts 4x4 Numpy array to equivalent Braket instruction(s) via kak decomposition
+
+    Decompositions are cached by the unitary rounded to ``UNITARY_KEY_DECIMALS`` decimals,
+    so repeated two-qubit unitaries are only decomposed once.
+
+    Args:
+        matrix: Unitary 4x4 numpy array representing 2-qubit gate.
+        q1: Index of first qubit to act on
+        q2: Index of second qubit to act on
+    """
+    # Adding 0.0 turns negative zeros into positive zeros, so equal unitaries share a key.
+    key = (np.round(np.asarray(matrix, dtype=np.complex128), UNITARY_KEY_DECIMALS) + 0.0).tobytes()
+    return _instantiate(_kak_template(key), [q1, q2])
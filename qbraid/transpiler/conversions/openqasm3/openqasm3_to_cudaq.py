@@ -18,7 +18,9 @@ Module defining OpenQASM 3 to CUDA-Q conversion function.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Optional
 
 import pyqasm
 from openqasm3 import ast
@@ -77,7 +79,45 @@ def make_gate_kernel(name: str, targs: tuple[type]) -> PyKernel:
     return kernel
 
 
-@weight(0.95)  # pylint: disable-next=too-many-statements
+# Gate kernels shared by all conversions in the process, keyed by gate name and
+# parameter type signature. Building a kernel is expensive, so each is built once.
+_gate_kernels: dict[tuple[str, tuple[type, ...]], PyKernel] = {}
+
+# The CUDA-Q kernel builder is not thread-safe, so all builder calls (and the gate
+# kernel cache, whose entries are built on demand) are serialized on this lock.
+_builder_lock = threading.RLock()
+
+
+def get_gate_kernel(name: str, targs: tuple[type, ...]) -> PyKernel:
+    """Returns the cached CUDA-Q kernel for a standard gate, building it on first use.
+
+    Kernels are cached process-wide, keyed by ``(name, targs)``, and shared between
+    conversions. The cache is thread-safe, and kernels are built under the builder lock.
+
+    Args:
+        name (str): The gate name.
+        targs (tuple[type, ...]): The types of the gate parameters.
+
+    Returns:
+        PyKernel: The gate kernel.
+    """
+    key = (name, tuple(targs))
+    kernel = _gate_kernels.get(key)
+    if kernel is None:
+        with _builder_lock:
+            kernel = _gate_kernels.get(key)
+            if kernel is None:
+                kernel = _gate_kernels[key] = make_gate_kernel(name, key[1])
+    return kernel
+
+
+def clear_gate_kernel_cache() -> None:
+    """Clears the process-wide cache of CUDA-Q gate kernels."""
+    with _builder_lock:
+        _gate_kernels.clear()
+
+
+@weight(0.95)
 def openqasm3_to_cudaq(program: QasmStringType | ast.Program) -> PyKernel:
     """Returns a CUDA-Q kernel representing the input OpenQASM program.
 
@@ -94,18 +134,19 @@ def openqasm3_to_cudaq(program: QasmStringType | ast.Program) -> PyKernel:
         raise ProgramConversionError("QASM program is not well-formed.") from e
 
     module.unroll()
-    program = module.unrolled_ast
 
-    kernel: PyKernel = cudaq.make_kernel()
-    ctx: dict[str, Optional[QuakeValue]] = {}
-    gate_kernels: dict[str, PyKernel] = {}
+    with _builder_lock:
+        return _build_kernel(module.unrolled_ast)
 
-    def get_gate(name: str, targs: tuple[type]) -> PyKernel:
-        if name in gate_kernels:
-            return gate_kernels[name]
 
-        gate_kernels[name] = make_gate_kernel(name, targs)
-        return gate_kernels[name]
+# pylint: disable-next=too-many-statements
+def _build_kernel(program: ast.Program) -> PyKernel:
+    """Builds the CUDA-Q kernel for an unrolled OpenQASM program.
+
+    Must be called with the builder lock held.
+    """
+    kernel: PyKernel = cudaq.make_kernel()
+    ctx: dict[str, Optional[QuakeValue]] = {}
 
     def qubit_lookup(qubit: ast.IndexedIdentifier | ast.Identifier) -> QuakeValue:
         assert isinstance(
@@ -152,7 +193,7 @@ def openqasm3_to_cudaq(program: QasmStringType | ast.Program) -> PyKernel:
             for arg in statement.arguments:
                 assert arg.value is not None, f"gate arguments should've been literals: {arg}"
                 args.append(arg.value)
-            targs = [type(a) for a in args]
+            targs = tuple(type(a) for a in args)
 
             qubit_refs = [qubit_lookup(q) for q in qubits]
 
@@ -166,7 +207,7 @@ def openqasm3_to_cudaq(program: QasmStringType | ast.Program) -> PyKernel:
                     mod.modifier == ast.GateModifierName.ctrl
                 ), f"non-ctrl modifiers should've be unrolled: {mod}"
 
-                gate = get_gate(name, targs)
+                gate = get_gate_kernel(name, targs)
                 kernel.control(gate, qubit_refs[0], *qubit_refs[1:])
             else:
                 if (namel := name.lower())[0] == "c" and namel[1:] in [
@@ -178,13 +219,47 @@ def openqasm3_to_cudaq(program: QasmStringType | ast.Program) -> PyKernel:
                     "rz",
                 ]:
                     # pyqasm doesn't unroll C{X,Y,Z} -> ctrl @ x. the below also handles this.
-                    gate = get_gate(namel[1:], targs)
+                    gate = get_gate_kernel(namel[1:], targs)
                     kernel.control(gate, qubit_refs[0], *qubit_refs[1:], *args)
                 else:
-                    gate = get_gate(name, targs)
+                    gate = get_gate_kernel(name, targs)
                     kernel.apply_call(gate, *qubit_refs, *args)
 
         else:
             raise ProgramConversionError(f"Unsupported statement: {statement}")
 
     return kernel
+
+
+def openqasm3_to_cudaq_batch(
+    programs: Iterable[QasmStringType | ast.Program],
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> list[PyKernel]:
+    """Returns CUDA-Q kernels for several OpenQASM programs.
+
+    The programs share the process-wide gate kernel cache, so each standard gate kernel
+    is built at most once for the whole batch. When converted on a worker pool, the
+    programs are parsed and unrolled concurrently, but kernels are built one at a time,
+    since the CUDA-Q kernel builder is not thread-safe.
+
+    Args:
+        programs (Iterable[str | ast.Program]): OpenQASM programs to convert.
+        max_workers (Optional[int]): If given, convert the programs on a thread pool
+            with this many workers. Defaults to converting them sequentially.
+        executor (Optional[Executor]): Executor on which to convert the programs.
+            Takes precedence over ``max_workers``.
+
+    Returns:
+        list[PyKernel]: The CUDA-Q kernels, in input order.
+
+    Raises:
+        ProgramConversionError: If any program cannot be converted.
+    """
+    programs = list(programs)
+    if executor is not None:
+        return list(executor.map(openqasm3_to_cudaq, programs))
+    if max_workers is not None and max_workers > 1 and len(programs) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(openqasm3_to_cudaq, programs))
+    return [openqasm3_to_cudaq(program) for program in programs]
@@ -18,14 +18,22 @@ Module containing OpenQASM to IonQ JSON conversion function
 """
 from __future__ import annotations
 
+import json
 import re
 import warnings
-from typing import TYPE_CHECKING, Any, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 import openqasm3.ast
 
-from qbraid.passes.qasm.compat import convert_qasm_pi_to_decimal
+from qbraid.passes.qasm.analysis import (
+    RegisterLayout,
+    _broadcast,
+    register_layout,
+    resolve_operand,
+)
+from qbraid.passes.qasm.expressions import evaluate, evaluate_expression
 from qbraid.programs import load_program
+from qbraid.programs.gate_model import GateArray, GateArrayBuilder
 from qbraid.programs.gate_model.ionq import IONQ_NATIVE_GATES, IonQProgram
 from qbraid.programs.gate_model.qasm2 import OpenQasm2Program
 from qbraid.programs.gate_model.qasm3 import OpenQasm3Program
@@ -102,56 +110,89 @@ IONQ_THREE_QUBIT_GATE_ALIASES = {
 }
 
 
-def extract_params(statement: openqasm3.ast.QuantumGate) -> list[str]:
-    """Extracts the parameter(s) from a QuantumGate statement.
+Param = Union[str, openqasm3.ast.Expression]
 
-    Args:
-        statement (openqasm3.ast.QuantumGate): QuantumGate statement to extract parameter(s) from.
 
-    Returns:
-        Union[str, list[str]]: Parameter(s) extracted from the QuantumGate statement.
-    """
-    try:
-        params: str = re.findall(r"\((.+)\)", openqasm3.dumps(statement))[0]
-    except IndexError:
-        return []
+def _param_value(value: Param) -> Optional[Union[int, float]]:
+    """Evaluate a gate parameter, given as source text or as an argument expression."""
+    if isinstance(value, str):
+        return evaluate_expression(value)
+    return evaluate(value)
 
-    return [p.strip(" ") for p in params.split(",")]
+
+def _param_text(value: Param) -> str:
+    """Return the source text of a gate parameter, for error messages."""
+    return value if isinstance(value, str) else openqasm3.dumps(value)
 
 
 def _parse_float_in_range(
-    value: str, gate_name: str, param_name: str, bounds: tuple[float, float]
+    value: Param, gate_name: str, param_name: str, bounds: tuple[float, float]
 ) -> float:
 
     min_val, max_val = bounds
 
-    err_msg = (
-        f"Invalid {param_name} value '{value}' for the '{gate_name}' gate. "
-        f"{param_name.capitalize()} must be a float between {min_val} and {max_val}."
-    )
-    try:
-        value = float(value)
-    except ValueError as err:
-        raise ValueError(err_msg) from err
-
-    if not min_val <= value <= max_val:
-        raise ValueError(err_msg)
+    number = _param_value(value)
+    if number is None or not min_val <= number <= max_val:
+        raise ValueError(
+            f"Invalid {param_name} value '{_param_text(value)}' for the '{gate_name}' gate. "
+            f"{param_name.capitalize()} must be a float between {min_val} and {max_val}."
+        )
 
-    return value
+    return float(number)
 
 
-def _parse_phase(phase: str, gate_name: str) -> float:
+def _parse_phase(phase: Param, gate_name: str) -> float:
     return _parse_float_in_range(phase, gate_name, "phase", (-1, 1))
 
 
-def _parse_angle(angle: str, gate_name: str) -> float:
+def _parse_angle(angle: Param, gate_name: str) -> float:
     return _parse_float_in_range(angle, gate_name, "angle", (0, 0.25))
 
 
-# pylint: disable-next=too-many-statements
-def _parse_gates(program: Union[OpenQasm2Program, OpenQasm3Program]) -> list[dict[str, Any]]:
-    program_qubits = program.module._qubit_registers.items()
+def _parse_rotation(rotation: Param, gate_name: str) -> float:
+    value = _param_value(rotation)
+    if value is None:
+        raise ValueError(
+            f"Invalid rotation value '{_param_text(rotation)}' for the '{gate_name}' gate. "
+            "Rotation must be a constant numeric expression."
+        )
+    return float(value)
+
+
+def _qubit_layout(
+    program: Union[OpenQasm2Program, OpenQasm3Program], ast_program: openqasm3.ast.Program
+) -> RegisterLayout:
+    """Map each qubit register to its ``(offset, size)`` in the flat qubit index space.
 
+    Uses the register sizes recorded by pyqasm when the module has been validated or
+    unrolled, and otherwise the literal register declarations of the AST.
+    """
+    registers = program.module._qubit_registers
+    if not registers:
+        return register_layout(ast_program)[0]
+    layout: RegisterLayout = {}
+    offset = 0
+    for name, size in registers.items():
+        layout[name] = (offset, size)
+        offset += size
+    return layout
+
+
+def _resolve_qubits(
+    operand: Union[openqasm3.ast.Identifier, openqasm3.ast.IndexedIdentifier],
+    layout: RegisterLayout,
+) -> list[int]:
+    """Resolve a gate operand to flat qubit indices."""
+    indices = resolve_operand(operand, layout)
+    if indices is not None:
+        return indices
+    if isinstance(operand, openqasm3.ast.Identifier) and re.fullmatch(r"\$\d+", operand.name):
+        return [int(operand.name[1:])]  # physical qubit, e.g. '$0'
+    raise ValueError(f"Unable to resolve qubit operand '{openqasm3.dumps(operand)}'.")
+
+
+# pylint: disable-next=too-many-statements
+def _parse_gates(program: Union[OpenQasm2Program, OpenQasm3Program]) -> GateArray:
     original = program.module.original_program
 
     # Use the original AST when it contains top-level gate operations (the common case).
@@ -167,7 +208,8 @@ def _parse_gates(program: Union[OpenQasm2Program, OpenQasm3Program]) -> list[dic
         else:
             ast_program = original
 
-    gates: list[dict[str, Any]] = []
+    layout = _qubit_layout(program, ast_program)
+    gates = GateArrayBuilder()
 
     contains_native = False
     non_zz_native_gates = set(IONQ_NATIVE_GATES) - {"zz"}
@@ -186,239 +228,173 @@ def _parse_gates(program: Union[OpenQasm2Program, OpenQasm3Program]) -> list[dic
                 or (name.startswith("c") and name[1:] in non_zz_native_gates)
             )
 
-            qubits = statement.qubits
-            qubit_values = []
+            operands = [_resolve_qubits(qubit, layout) for qubit in statement.qubits]
+            arguments = statement.arguments
 
-            if len(qubits) == 1 and isinstance(qubits[0], openqasm3.ast.Identifier):
-                reg_name = qubits[0].name
-                for qreg_name, reg_size in program_qubits:
-                    if qreg_name == reg_name:
-                        qubit_values = list(range(reg_size))
-                        break
+            if name in IONQ_ONE_QUBIT_GATE_MAP:
+                groups = [[qubit for operand in operands for qubit in operand]]
             else:
-                for qubit in qubits:
-                    indices = qubit.indices
-                    for index in indices:
-                        qubit_values.extend(literal.value for literal in index)
+                groups = _broadcast(operands) or [sum(operands, [])]
 
-            if name in IONQ_ONE_QUBIT_GATE_MAP:
-                ionq_name = IONQ_ONE_QUBIT_GATE_MAP[name]
-                if ionq_name in ONE_QUBIT_PARAM_ROT:
-                    try:
-                        angle: str = extract_params(statement)[0]
-                    except IndexError as err:
-                        raise ValueError(
-                            f"Rotation parameter is required for the '{name}' "
-                            "gate but was not provided."
-                        ) from err
-                    angle_decimal = float(convert_qasm_pi_to_decimal(angle))
-                    for qubit in qubit_values:
-                        gates.append(
-                            {
-                                "gate": ionq_name,
-                                "target": qubit,
-                                "rotation": angle_decimal,
-                            }
-                        )
-                elif ionq_name in ONE_QUBIT_PARAM_PHASE:
-                    try:
-                        phase: str = extract_params(statement)[0]
-                    except IndexError as err:
-                        raise ValueError(
-                            f"Phase parameter is required for the '{name}' "
-                            "gate but was not provided."
-                        ) from err
-                    phase = _parse_phase(phase, ionq_name)
+            for qubit_values in groups:
+                if name in IONQ_ONE_QUBIT_GATE_MAP:
+                    ionq_name = IONQ_ONE_QUBIT_GATE_MAP[name]
+                    if ionq_name in ONE_QUBIT_PARAM_ROT:
+                        try:
+                            angle: Param = arguments[0]
+                        except IndexError as err:
+                            raise ValueError(
+                                f"Rotation parameter is required for the '{name}' "
+                                "gate but was not provided."
+                            ) from err
+                        angle_decimal = _parse_rotation(angle, name)
+                        for qubit in qubit_values:
+                            gates.append(ionq_name, qubit, params={"rotation": angle_decimal})
+                    elif ionq_name in ONE_QUBIT_PARAM_PHASE:
+                        try:
+                            phase: Param = arguments[0]
+                        except IndexError as err:
+                            raise ValueError(
+                                f"Phase parameter is required for the '{name}' "
+                                "gate but was not provided."
+                            ) from err
+                        phase = _parse_phase(phase, ionq_name)
+
+                        for qubit in qubit_values:
+                            gates.append(ionq_name, qubit, params={"phase": phase})
+                    else:
+                        for qubit in qubit_values:
+                            gates.append(ionq_name, qubit)
 
-                    for qubit in qubit_values:
-                        gates.append(
-                            {
-                                "gate": ionq_name,
-                                "target": qubit,
-                                "phase": phase,
-                            }
-                        )
-                else:
-                    for qubit in qubit_values:
-                        gates.append({"gate": ionq_name, "target": qubit})
-
-            elif name in IONQ_TWO_QUBIT_GATE_MAP:
-                ionq_name = IONQ_TWO_QUBIT_GATE_MAP[name]
-
-                if len(qubit_values) != 2:
-                    raise ValueError(
-                        f"Invalid number of qubits for the '{name}' gate. "
-                        f"Expected 2, got {len(qubit_values)}"
-                    )
-
-                if ionq_name in TWO_QUBIT_PARAM_ANGLE:
-                    try:
-                        angle = extract_params(statement)[0]
-                    except IndexError as err:
+                elif name in IONQ_TWO_QUBIT_GATE_MAP:
+                    ionq_name = IONQ_TWO_QUBIT_GATE_MAP[name]
+
+                    if len(qubit_values) != 2:
                         raise ValueError(
-                            f"Angle parameter is required for the '{name}' "
-                            "gate but was not provided."
-                        ) from err
-
-                    # Treat zz as 'qis' gate if all other gates are 'qis' gates
-                    if name == "rzz" or (
-                        ionq_name == "zz" and len(gates) > 0 and contains_native is False
-                    ):
-                        angle = float(convert_qasm_pi_to_decimal(angle))
-                        gates.append(
-                            {
-                                "gate": ionq_name,
-                                "rotation": angle,
-                                "targets": qubit_values,
-                            }
+                            f"Invalid number of qubits for the '{name}' gate. "
+                            f"Expected 2, got {len(qubit_values)}"
                         )
 
-                    else:
-                        key = "angle"
-
+                    if ionq_name in TWO_QUBIT_PARAM_ANGLE:
                         try:
-                            angle = _parse_angle(angle, ionq_name)
-                        except ValueError as err:
-                            #  Treat zz with angle not in [0, 0.25] as 'qis'
-                            if ionq_name == "zz" and contains_native is False:
-                                key = "rotation"
-
-                                try:
-                                    angle = float(convert_qasm_pi_to_decimal(angle))
-                                except ValueError:  # pylint: disable=raise-missing-from
+                            angle = arguments[0]
+                        except IndexError as err:
+                            raise ValueError(
+                                f"Angle parameter is required for the '{name}' "
+                                "gate but was not provided."
+                            ) from err
+
+                        # Treat zz as 'qis' gate if all other gates are 'qis' gates
+                        if name == "rzz" or (
+                            ionq_name == "zz" and len(gates) > 0 and contains_native is False
+                        ):
+                            angle = _parse_rotation(angle, name)
+                            gates.append(ionq_name, qubit_values, params={"rotation": angle})
+
+                        else:
+                            key = "angle"
+
+                            try:
+                                angle = _parse_angle(angle, ionq_name)
+                            except ValueError as err:
+                                #  Treat zz with angle not in [0, 0.25] as 'qis'
+                                if ionq_name == "zz" and contains_native is False:
+                                    key = "rotation"
+
+                                    try:
+                                        angle = _parse_rotation(angle, name)
+                                    except ValueError:  # pylint: disable=raise-missing-from
+                                        raise err
+                                else:
                                     raise err
                             else:
-                                raise err
-                        else:
-                            if ionq_name == "zz":
-                                contains_native = True
+                                if ionq_name == "zz":
+                                    contains_native = True
 
-                        gates.append(
-                            {
-                                "gate": ionq_name,
-                                key: angle,
-                                "targets": qubit_values,
-                            }
-                        )
+                            gates.append(ionq_name, qubit_values, params={key: angle})
 
-                elif ionq_name in TWO_QUBIT_PARAM_ANGLE_PHASE:
-                    params = extract_params(statement)
-                    if len(params) not in {2, 3}:  # pragma: no cover
-                        raise ValueError(
-                            f"Invalid number of parameters for the '{name}' gate. "
-                            f"Expected 2 or 3, got {len(params)}"
+                    elif ionq_name in TWO_QUBIT_PARAM_ANGLE_PHASE:
+                        if len(arguments) not in {2, 3}:  # pragma: no cover
+                            raise ValueError(
+                                f"Invalid number of parameters for the '{name}' gate. "
+                                f"Expected 2 or 3, got {len(arguments)}"
+                            )
+
+                        phases = [_parse_phase(param, ionq_name) for param in arguments[:2]]
+                        angle = (
+                            _parse_angle(arguments[2], ionq_name) if len(arguments) == 3 else None
                         )
 
-                    phases = [
-                        _parse_phase(param, ionq_name) if i < 2 else _parse_phase(param, ionq_name)
-                        for i, param in enumerate(params[:2])
-                    ]
-                    angle = _parse_angle(params[2], ionq_name) if len(params) == 3 else None
-
-                    gate_data = {
-                        "gate": ionq_name,
-                        "phases": phases,
-                        "targets": qubit_values,
-                        **({"angle": angle} if angle is not None else {}),
-                    }
-                    gates.append(gate_data)
-
-                elif ionq_name.startswith("c"):
-                    gates.append(
-                        {
-                            "gate": ionq_name,
-                            "control": qubit_values[0],
-                            "target": qubit_values[1],
+                        gate_params = {
+                            "phases": phases,
+                            **({"angle": angle} if angle is not None else {}),
                         }
-                    )
-                else:
-                    gates.append({"gate": ionq_name, "targets": qubit_values})
+                        gates.append(ionq_name, qubit_values, params=gate_params)
 
-            elif name.startswith("c") and name[1:] in IONQ_ONE_QUBIT_GATE_MAP:
-                ionq_name = IONQ_ONE_QUBIT_GATE_MAP[name[1:]]
+                    elif ionq_name.startswith("c"):
+                        gates.append(ionq_name, qubit_values[1], qubit_values[0])
+                    else:
+                        gates.append(ionq_name, qubit_values)
 
-                if len(qubit_values) != 2:
-                    raise ValueError(
-                        f"Invalid number of qubits for the '{name}' gate. "
-                        f"Expected 2, got {len(qubit_values)}"
-                    )
+                elif name.startswith("c") and name[1:] in IONQ_ONE_QUBIT_GATE_MAP:
+                    ionq_name = IONQ_ONE_QUBIT_GATE_MAP[name[1:]]
 
-                if ionq_name in ONE_QUBIT_PARAM_ROT:
-                    try:
-                        angle: str = extract_params(statement)[0]
-                    except IndexError as err:
-                        raise ValueError(
-                            f"Rotation parameter is required for the '{name}' "
-                            "gate but was not provided."
-                        ) from err
-                    angle_decimal = float(convert_qasm_pi_to_decimal(angle))
-
-                    gates.append(
-                        {
-                            "gate": ionq_name,
-                            "control": qubit_values[0],
-                            "target": qubit_values[1],
-                            "rotation": angle_decimal,
-                        }
-                    )
-                elif ionq_name in ONE_QUBIT_PARAM_PHASE:
-                    try:
-                        phase: str = extract_params(statement)[0]
-                    except IndexError as err:
+                    if len(qubit_values) != 2:
                         raise ValueError(
-                            f"Phase parameter is required for the '{name}' "
-                            "gate but was not provided."
-                        ) from err
-                    phase = _parse_phase(phase, ionq_name)
-
-                    gates.append(
-                        {
-                            "gate": ionq_name,
-                            "control": qubit_values[0],
-                            "target": qubit_values[1],
-                            "phase": phase,
-                        }
-                    )
-                else:
-                    gates.append(
-                        {"gate": ionq_name, "control": qubit_values[0], "target": qubit_values[1]}
-                    )
-
-            elif name in IONQ_THREE_QUBIT_GATE_MAP:
-                ionq_name = IONQ_THREE_QUBIT_GATE_MAP[name]
-
-                if len(qubit_values) != 3:
-                    raise ValueError(
-                        f"Invalid number of qubits for the '{name}' gate. "
-                        f"Expected 3, got {len(qubit_values)}"
-                    )
-                gates.append(
-                    {
-                        "gate": ionq_name,
-                        "controls": qubit_values[:2],
-                        "target": qubit_values[2],
-                    }
-                )
+                            f"Invalid number of qubits for the '{name}' gate. "
+                            f"Expected 2, got {len(qubit_values)}"
+                        )
 
-            else:
-                raise ValueError(f"Gate '{name}' not supported by IonQ")
+                    if ionq_name in ONE_QUBIT_PARAM_ROT:
+                        try:
+                            angle: Param = arguments[0]
+                        except IndexError as err:
+                            raise ValueError(
+                                f"Rotation parameter is required for the '{name}' "
+                                "gate but was not provided."
+                            ) from err
+                        angle_decimal = _parse_rotation(angle, name)
 
-    return gates
+                        gates.append(
+                            ionq_name,
+                            qubit_values[1],
+                            qubit_values[0],
+                            params={"rotation": angle_decimal},
+                        )
+                    elif ionq_name in ONE_QUBIT_PARAM_PHASE:
+                        try:
+                            phase: Param = arguments[0]
+                        except IndexError as err:
+                            raise ValueError(
+                                f"Phase parameter is required for the '{name}' "
+                                "gate but was not provided."
+                            ) from err
+                        phase = _parse_phase(phase, ionq_name)
 
+                        gates.append(
+                            ionq_name, qubit_values[1], qubit_values[0], params={"phase": phase}
+                        )
+                    else:
+                        gates.append(ionq_name, qubit_values[1], qubit_values[0])
 
-@weight(1)
-def openqasm3_to_ionq(qasm: Union[QasmStringType, openqasm3.ast.Program]) -> IonQDictType:
-    """Returns an IonQ JSON format representation the input OpenQASM program.
+                elif name in IONQ_THREE_QUBIT_GATE_MAP:
+                    ionq_name = IONQ_THREE_QUBIT_GATE_MAP[name]
 
-    Args:
-        qasm (str or openqasm3.ast.Program): OpenQASM program to convert to IonQDict type.
+                    if len(qubit_values) != 3:
+                        raise ValueError(
+                            f"Invalid number of qubits for the '{name}' gate. "
+                            f"Expected 3, got {len(qubit_values)}"
+                        )
+                    gates.append(ionq_name, qubit_values[2], qubit_values[:2])
 
-    Returns:
-        dict: IonQ JSON format equivalent to input OpenQASM string.
+                else:
+                    raise ValueError(f"Gate '{name}' not supported by IonQ")
 
-    Raises:
-        ProgramConversionError: For failure to parse gate data from OpenQASM string.
-    """
+    return gates.build()
+
+
+def _convert(qasm: Union[QasmStringType, openqasm3.ast.Program]) -> tuple[int, GateArray, str]:
+    """Parse an OpenQASM program into its qubit count, gate array and IonQ gate set."""
     program: Union[OpenQasm2Program, OpenQasm3Program] = load_program(qasm)
 
     # Unroll compound statements (for-loops, custom gates, etc.) so that
@@ -445,9 +421,57 @@ def openqasm3_to_ionq(qasm: Union[QasmStringType, openqasm3.ast.Program]) -> Ion
 
     gateset = IonQProgram.determine_gateset(gates)
 
+    return program.num_qubits, gates, gateset.value
+
+
+@weight(1)
+def openqasm3_to_ionq(qasm: Union[QasmStringType, openqasm3.ast.Program]) -> IonQDictType:
+    """Returns an IonQ JSON format representation the input OpenQASM program.
+
+    Args:
+        qasm (str or openqasm3.ast.Program): OpenQASM program to convert to IonQDict type.
+
+    Returns:
+        dict: IonQ JSON format equivalent to input OpenQASM string.
+
+    Raises:
+        ProgramConversionError: For failure to parse gate data from OpenQASM string.
+    """
+    num_qubits, gates, gateset = _convert(qasm)
+
     return {
-        "qubits": program.num_qubits,
-        "circuit": gates,
-        "gateset": gateset.value,
+        "qubits": num_qubits,
+        "circuit": gates.to_ionq(),
+        "gateset": gateset,
         "format": "ionq.circuit.v0",
     }
+
+
+def openqasm3_to_ionq_json(qasm: Union[QasmStringType, openqasm3.ast.Program]) -> bytes:
+    """Returns the IonQ JSON format representation of the input OpenQASM program,
+    serialized to bytes.
+
+    The gate list is emitted in bulk from the parsed gate array with
+    :meth:`~qbraid.programs.gate_model.GateArray.to_ionq_json`, so the result can be
+    passed directly to :meth:`~qbraid.runtime.IonQDevice.submit` without building
+    and re-encoding a dictionary per gate.
+
+    Args:
+        qasm (str or openqasm3.ast.Program): OpenQASM program to convert.
+
+    Returns:
+        bytes: UTF-8 encoded IonQ JSON document, equal to ``json.dumps`` of the
+            output of :func:`openqasm3_to_ionq`.
+
+    Raises:
+        ProgramConversionError: For failure to parse gate data from OpenQASM string.
+    """
+    num_qubits, gates, gateset = _convert(qasm)
+
+    return b"".join(
+        [
+            b'{"qubits": %d, "circuit": ' % num_qubits,
+            gates.to_ionq_json(),
+            b', "gateset": %s, "format": "ionq.circuit.v0"}' % json.dumps(gateset).encode(),
+        ]
+    )
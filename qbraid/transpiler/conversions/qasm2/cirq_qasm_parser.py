@@ -27,6 +27,8 @@ Module defining qBraid Cirq QASM parser.
 """
 import functools
 import operator
+import threading
+import types
 from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Union, cast
 
 import numpy as np
@@ -58,6 +60,12 @@ QasmLexer.tokens = [
 if TYPE_CHECKING:
     import cirq
 
+# LALR parse tables generated from the QasmParser grammar, shared by all parser instances.
+_parse_tables: Optional[types.ModuleType] = None
+_parse_tables_lock = threading.Lock()
+
+_thread_local = threading.local()
+
 
 class Qasm:
     """Qasm stores the final result of the Qasm parsing."""
@@ -168,15 +176,9 @@ class QasmParser:
     """
 
     def __init__(self):
-        self.parser = yacc.yacc(module=self, debug=False, write_tables=False)
-        self.circuit = Circuit()
-        self.qregs: dict[str, int] = {}
-        self.cregs: dict[str, int] = {}
-        self.qelibinc = False
+        self.parser = self._build_parser()
         self.lexer = QasmLexer()
-        self.supported_format = False
-        self.parsedQasm: Optional[Qasm] = None
-        self.qubits: dict[str, ops.Qid] = {}
+        self.reset()
         self.functions = {
             'sin': np.sin,
             'cos': np.cos,
@@ -197,6 +199,48 @@ class QasmParser:
             '^': operator.pow,
         }
 
+    def _build_parser(self) -> 'yacc.LRParser':
+        """Create an LALR parser bound to this instance.
+
+        The parse tables are generated from the grammar once per process and
+        reused by subsequent instances, which only bind their grammar rule methods.
+        """
+        global _parse_tables
+
+        with _parse_tables_lock:
+            if _parse_tables is None:
+                parser = yacc.yacc(module=self, debug=False, write_tables=False)
+                tables = types.ModuleType('qasm2_parsetab')
+                tables._tabversion = yacc.__tabversion__
+                tables._lr_method = 'LALR'
+                tables._lr_signature = None
+                tables._lr_action = parser.action
+                tables._lr_goto = parser.goto
+                tables._lr_productions = [
+                    (str(prod), prod.name, prod.len, prod.func, prod.file, prod.line)
+                    for prod in parser.productions
+                ]
+                _parse_tables = tables
+                return parser
+
+        table = yacc.LRTable()
+        table.read_table(_parse_tables)
+        table.bind_callables(
+            {prod.func: getattr(self, prod.func) for prod in table.lr_productions if prod.func}
+        )
+        return yacc.LRParser(table, self.p_error)
+
+    def reset(self) -> None:
+        """Clear the state of the previous parse, so that the parser can be reused."""
+        self.circuit = Circuit()
+        self.qregs: dict[str, int] = {}
+        self.cregs: dict[str, int] = {}
+        self.qelibinc = False
+        self.supported_format = False
+        self.parsedQasm: Optional[Qasm] = None
+        self.qubits: dict[str, ops.Qid] = {}
+        self.lexer.lex.lineno = 1
+
     basic_gates: dict[str, QasmGateStatement] = {
         'CX': QasmGateStatement(qasm_gate='CX', cirq_gate=CX, num_params=0, num_args=2),
         'U': QasmGateStatement(
@@ -642,6 +686,21 @@ at line {p.lineno}, column {self.find_column(p)}"""
             self.parsedQasm = self.parser.parse(lexer=self.lexer)
         return self.parsedQasm
 
+    @classmethod
+    def for_thread(cls) -> 'QasmParser':
+        """Return a reset parser instance owned by the calling thread.
+
+        Reusing one instance per thread avoids binding a new parser and lexer for every
+        parse. The result of the previous parse on the same thread remains valid, since
+        resetting replaces the parser state rather than mutating it.
+        """
+        parser = getattr(_thread_local, 'parser', None)
+        if parser is None:
+            parser = _thread_local.parser = cls()
+        else:
+            parser.reset()
+        return parser
+
     def debug_context(self, p):
         debug_start = max(self.qasm.rfind('\n', 0, p.lexpos) + 1, p.lexpos - 5)
         debug_end = min(self.qasm.find('\n', p.lexpos, p.lexpos + 5), p.lexpos + 5)
@@ -58,7 +58,7 @@ def qasm2_to_cirq(qasm: Qasm2StringType) -> cirq.Circuit:
                 "and will be removed during program conversion."
             )
             qasm_module.remove_barriers()
-        parser: QasmParser = cirq_qasm_parser.QasmParser()
+        parser: QasmParser = cirq_qasm_parser.QasmParser.for_thread()
         qasm_compat = pyqasm.dumps(qasm_module)
         qasm_parsed = parser.parse(qasm_compat)
         return qasm_parsed.circuit
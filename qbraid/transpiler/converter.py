@@ -20,6 +20,7 @@ Module for transpiling quantum programs between different quantum programming la
 from __future__ import annotations
 
 import warnings
+from contextvars import ContextVar
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
@@ -42,6 +43,19 @@ from .graph import ConversionGraph, _get_path_from_bound_methods
 if TYPE_CHECKING:
     import qbraid.programs
 
+# Callback receiving the conversion path of each successful transpile call in the current
+# context, used by qbraid.runtime.instrumentation.
+conversion_observer: ContextVar[Optional[Callable[[str], None]]] = ContextVar(
+    "conversion_observer", default=None
+)
+
+
+def _notify_conversion(path_details: str) -> None:
+    """Report a successful conversion path to the observer of the current context, if any."""
+    observer = conversion_observer.get()
+    if observer is not None:
+        observer(path_details)
+
 
 def _warn_if_unsupported(program_type, program_direction):
     if program_type not in QPROGRAM_ALIASES:
@@ -157,6 +171,7 @@ def transpile(
                         raise
 
             logger.info("Successfully transpiled using conversions: %s", path_details)
+            _notify_conversion(path_details)
             return temp_program
         except Exception as err:  # pylint: disable=broad-exception-caught
             logger.info("Failed to transpile using conversions: %s", path_details)
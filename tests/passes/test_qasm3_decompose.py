@@ -19,7 +19,7 @@ Unit tests for QASM transform to basic gates
 
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from openqasm3 import ast
@@ -27,7 +27,8 @@ from openqasm3.parser import parse
 
 from qbraid.passes.exceptions import CompilationError, QasmDecompositionError
 from qbraid.passes.qasm.compat import normalize_qasm_gate_params
-from qbraid.passes.qasm.decompose import assert_gates_in_basis, rebase
+from qbraid.passes.qasm.decompose import _expand, assert_gates_in_basis, decompose, rebase
+from qbraid.passes.qasm.expressions import parse_expression
 from qbraid.programs.gate_model.qasm3 import OpenQasm3Program
 
 
@@ -256,4 +257,112 @@ def test_transform_from_device_gateset(qasm_crx_program: str, qasm_crx_decompose
     program = OpenQasm3Program(qasm_crx_program)
     program.transform(device=device)
     expected = normalize_qasm_gate_params(qasm_crx_decomposed).strip()
-    assert program.program == expected
+    assert program.program.strip() == expected
+
+
+def test_rebase_searches_alternative_rules():
+    """Test that rebase picks the decomposition rule that reaches the basis gate set"""
+    qasm = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+cz q[0], q[1];
+cy q[0], q[1];
+swap q[0], q[1];
+"""
+    expected = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+h q[1];
+cx q[0], q[1];
+h q[1];
+sdg q[1];
+cx q[0], q[1];
+s q[1];
+cx q[0], q[1];
+cx q[1], q[0];
+cx q[0], q[1];
+"""
+    assert rebase(qasm, {"h", "cx", "s", "sdg"}) == expected
+
+
+def test_decompose_without_basis_keeps_new_rule_gates():
+    """Test that gates only covered by the newer rules are not expanded without a basis"""
+    qasm = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+swap q[0], q[1];
+cp(0.5) q[0], q[1];
+rzz(0.5) q[0], q[1];
+cz q[0], q[1];
+"""
+    names = [
+        statement.name.name
+        for statement in decompose(parse(qasm)).statements
+        if isinstance(statement, ast.QuantumGate)
+    ]
+    assert names == ["swap", "cp", "rzz", "rz", "cx", "rz", "cx", "s"]
+    rebased = rebase(qasm, "any")
+    assert "swap q[0], q[1];" in rebased
+    assert "cp(0.5) q[0], q[1];" in rebased
+    assert "rzz(0.5) q[0], q[1];" in rebased
+
+
+def test_rebase_descends_into_compound_statements():
+    """Test that gates in gate definitions, loops and branches are decomposed"""
+    qasm = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+gate g(t) a, b { crz(t) a, b; }
+for int i in [0:1] { rzz(0.5) q[0], q[1]; }
+if (true) { cz q[0], q[1]; }
+"""
+    expected = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+gate g(t) a, b {
+  rz(t / 2) b;
+  cx a, b;
+  rz(-(t / 2)) b;
+  cx a, b;
+}
+for int i in [0:1] {
+  cx q[0], q[1];
+  rz(0.5) q[1];
+  cx q[0], q[1];
+}
+if (true) {
+  h q[1];
+  cx q[0], q[1];
+  h q[1];
+}
+"""
+    assert rebase(qasm, {"h", "cx", "rz"}) == expected
+
+
+def test_assert_gates_in_basis_checks_nested_gates():
+    """Test that the basis check covers gates nested in control flow"""
+    program = parse("qubit[1] q; for int i in [0:1] { h q[0]; }")
+    with pytest.raises(ValueError, match="uses gate 'h'"):
+        assert_gates_in_basis(program, {"x"})
+
+
+def test_decompose_leaves_modified_gates_unchanged():
+    """Test that gates with modifiers are not decomposed"""
+    program = parse("qubit[3] q; ctrl @ cz q[0], q[1], q[2];")
+    assert decompose(program, {"h", "cx"}).statements == program.statements
+
+
+def test_decompose_memoizes_expansions():
+    """Test that each gate is only resolved against the rule table once per basis"""
+    qasm = "qubit[2] q;\n" + "crx(0.1) q[0], q[1];\n" * 10
+    _expand.cache_clear()
+    with patch(
+        "qbraid.passes.qasm.decompose.parse_expression", wraps=parse_expression
+    ) as mock_parse:
+        program = decompose(parse(qasm), {"rz", "ry", "cx"})
+        decompose(parse(qasm), {"rz", "ry", "cx"})
+    assert len(program.statements) == 61
+    assert mock_parse.call_count == 4
@@ -0,0 +1,142 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the constant OpenQASM arithmetic expression evaluator
+
+"""
+import math
+from unittest.mock import patch
+
+import pytest
+from openqasm3 import ast
+
+from qbraid.passes.qasm.compat import convert_qasm_pi_to_decimal, simplify_arithmetic_expressions
+from qbraid.passes.qasm.expressions import evaluate, evaluate_expression, parse_expression
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "1",
+        "1.",
+        ".5",
+        "1e-3",
+        "2.5E2",
+        "-2**2",
+        "2**-1",
+        "2**3**2",
+        "-(1 + 2) * 3",
+        "7 % 3",
+        "7 / 2",
+        "+4 - -2",
+        "1 - 2 - 3",
+        "12 / 4 / 3",
+    ],
+)
+def test_evaluate_expression_matches_python(text):
+    """Test that arithmetic follows Python semantics and operator precedence"""
+    assert evaluate_expression(text) == eval(text)  # pylint: disable=eval-used
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("pi", math.pi),
+        ("-pi / 4", -math.pi / 4),
+        ("3 * pi / 4", 3 * math.pi / 4),
+        ("tau / 2", math.tau / 2),
+        ("euler", math.e),
+        ("π", math.pi),
+    ],
+)
+def test_evaluate_expression_constants(text, expected):
+    """Test evaluating expressions with the built-in constants"""
+    assert evaluate_expression(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "theta",
+        "2 * theta",
+        "1 / 0",
+        "(1 + 2",
+        "1 2",
+        "2pi",
+        "007",
+        "1 *",
+        "(-1) ** 0.5",
+        "9**9**9",
+    ],
+)
+def test_evaluate_expression_not_constant(text):
+    """Test that invalid, symbolic or undefined expressions evaluate to None"""
+    assert evaluate_expression(text) is None
+
+
+def test_evaluate_expression_does_not_eval():
+    """Test that expressions are never executed as Python code"""
+    with patch("builtins.eval") as mock_eval:
+        assert evaluate_expression("__import__('os')") is None
+        assert simplify_arithmetic_expressions("rz((1 + 2)) q[0];") == "rz((3)) q[0];"
+    mock_eval.assert_not_called()
+
+
+def test_parse_expression_builds_qasm_ast():
+    """Test that expressions are parsed into OpenQASM AST nodes"""
+    node = parse_expression("-pi / 2")
+    assert isinstance(node, ast.BinaryExpression)
+    assert node.op == ast.BinaryOperator["/"]
+    assert isinstance(node.lhs, ast.UnaryExpression)
+    assert node.lhs.expression == ast.Identifier("pi")
+    assert node.rhs == ast.IntegerLiteral(2)
+    assert evaluate(node) == -math.pi / 2
+
+
+def test_evaluate_expression_cached():
+    """Test that repeated expressions are only parsed once"""
+    evaluate_expression.cache_clear()
+    with patch(
+        "qbraid.passes.qasm.expressions.parse_expression", wraps=parse_expression
+    ) as mock_parse:
+        for _ in range(3):
+            evaluate_expression("pi / 3")
+    assert mock_parse.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("x + pi", "x + 3.141592653589793"),
+        ("x - pi", "x - 3.141592653589793"),
+        ("x/2*pi", "x/2*3.141592653589793"),
+        ("2+pi*x", "2+3.141592653589793*x"),
+        ("x*pi/4", "x*0.7853981633974483"),
+        ("x - 2*pi", "x - 6.283185307179586"),
+        ("-2*pi", "-6.283185307179586"),
+        ("pi**2", "3.141592653589793**2"),
+        ("q[0]*pi", "q[0]*3.141592653589793"),
+    ],
+)
+def test_convert_qasm_pi_to_decimal_preserves_precedence(expression, expected):
+    """Test that pi arithmetic is only folded where it does not change the expression value"""
+    assert convert_qasm_pi_to_decimal(f"rz({expression}) q[0];") == f"rz({expected}) q[0];"
+
+
+def test_convert_qasm_pi_to_decimal_skips_identifiers():
+    """Test that identifiers containing 'pi' and gates named 'pi' are left unchanged"""
+    qasm = "pi_gate q[0];\npi q[0];\nrz(my_pi + pi2) q[0];"
+    assert convert_qasm_pi_to_decimal(qasm) == qasm
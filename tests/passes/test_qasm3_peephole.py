@@ -0,0 +1,101 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the OpenQASM peephole optimization pass
+
+"""
+import pytest
+from openqasm3.parser import parse
+
+from qbraid.passes.qasm import optimize, peephole_optimize
+
+HEADER = 'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[3] q;\nbit[3] c;\n'
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ("h q[0];\nh q[0];\n", ""),
+        ("cx q[0], q[1];\ncx q[0], q[1];\n", ""),
+        ("cx q[0], q[1];\ncx q[1], q[0];\n", "cx q[0], q[1];\ncx q[1], q[0];\n"),
+        ("s q[1];\nsdg q[1];\nt q[2];\ntdg q[2];\n", ""),
+        ("h q[0];\nx q[0];\nx q[0];\nh q[0];\n", ""),
+        ("h q[0];\nx q[1];\nh q[0];\n", "x q[1];\n"),
+        ("h q[0];\ncx q[0], q[1];\nh q[0];\n", "h q[0];\ncx q[0], q[1];\nh q[0];\n"),
+        ("rz(0.25) q[0];\nrz(0.5) q[0];\n", "rz(0.75) q[0];\n"),
+        ("rz(a) q[0];\nrz(pi) q[0];\n", "rz(a + pi) q[0];\n"),
+        ("rx(0.5) q[0];\nrx(-0.5) q[0];\n", ""),
+        ("crz(0.1) q[0], q[1];\ncrz(0.2) q[0], q[1];\n", "crz(0.30000000000000004) q[0], q[1];\n"),
+        ("rx(0.5) q[0];\nry(0.5) q[0];\n", "rx(0.5) q[0];\nry(0.5) q[0];\n"),
+        ("id q[0];\nrz(0) q[1];\nrx(pi - pi) q[2];\n", ""),
+        ("h q[0];\nbarrier q[0];\nh q[0];\n", "h q[0];\nbarrier q[0];\nh q[0];\n"),
+        ("h q[0];\nbarrier q[1];\nh q[0];\n", "barrier q[1];\n"),
+        ("x q[0];\nc[0] = measure q[0];\nx q[0];\n", "x q[0];\nc[0] = measure q[0];\nx q[0];\n"),
+        ("h q;\nh q;\n", "h q;\nh q;\n"),
+    ],
+)
+def test_optimize(body, expected):
+    """Test cancelling inverse pairs, merging rotations and removing identity gates"""
+    assert optimize(HEADER + body) == HEADER + expected
+
+
+def test_optimize_blocks_on_bare_barrier():
+    """Test that a barrier without operands blocks optimization on all qubits"""
+    body = "h q[0];\nbarrier;\nh q[0];\n"
+    assert optimize(HEADER + body) == HEADER + body
+
+
+def test_optimize_blocks_on_control_flow():
+    """Test that gates are not combined across control flow or classical assignments"""
+    body = "h q[0];\nif (c[0]) {\n  x q[1];\n}\nh q[0];\n"
+    assert optimize(HEADER + body) == HEADER + body
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "h q[0];\nbit b = measure q[0];\nh q[0];\n",
+        "x q[1];\nbit[3] d = measure q;\nx q[1];\n",
+        "x q[0];\nbit[2] d = measure q[0:1];\nx q[0];\n",
+    ],
+)
+def test_optimize_blocks_on_measurement_declaration(body):
+    """Test that a declaration initialized by a measurement blocks the measured qubits"""
+    assert optimize(HEADER + body) == HEADER + body
+
+
+def test_optimize_ignores_classical_declaration():
+    """Test that a plain classical declaration does not block optimization"""
+    body = "h q[0];\nbit b = measure q[1];\nint[32] n = 3;\nh q[0];\n"
+    assert optimize(HEADER + body) == HEADER + "bit b = measure q[1];\nint[32] n = 3;\n"
+
+
+def test_optimize_skips_modified_gates():
+    """Test that gates with modifiers are not cancelled"""
+    body = "ctrl @ x q[0], q[1];\nctrl @ x q[0], q[1];\n"
+    assert optimize(HEADER + body) == HEADER + body
+
+
+def test_optimize_qasm2():
+    """Test optimizing an OpenQASM 2 program"""
+    qasm = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\nu1(0.5) q[0];\nu1(0.5) q[0];\n'
+    assert optimize(qasm) == 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\nu1(1.0) q[0];\n'
+
+
+def test_peephole_optimize_ast():
+    """Test the AST pass directly"""
+    program = parse(HEADER + "h q[2];\ncx q[0], q[1];\nh q[2];\n")
+    optimized = peephole_optimize(program)
+    assert [statement.name.name for statement in optimized.statements[3:]] == ["cx"]
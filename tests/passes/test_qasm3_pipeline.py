@@ -0,0 +1,140 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for OpenQASM AST pass pipeline
+
+"""
+from unittest.mock import patch
+
+import pytest
+from openqasm3.parser import parse
+
+from qbraid.passes.exceptions import CompilationError
+from qbraid.passes.qasm import normalize_qasm_gate_params, rebase
+from qbraid.passes.qasm.pipeline import dumps_program, fold_constants, run_pipeline
+
+
+def _fold(qasm: str) -> str:
+    return dumps_program(fold_constants(parse(qasm))).strip()
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("pi", "3.141592653589793"),
+        ("pi / 2", "1.5707963267948966"),
+        ("-pi / 4", "-0.7853981633974483"),
+        ("3 * pi / 4", "2.356194490192345"),
+        ("-(0.5)", "-0.5"),
+        ("2 * 3", "6"),
+        ("1 / 2", "0.5"),
+        ("tau", "6.283185307179586"),
+        ("euler", "2.718281828459045"),
+        ("theta / 2", "theta / 2"),
+        ("pi / 2 * theta", "1.5707963267948966 * theta"),
+    ],
+)
+def test_fold_constants_gate_params(expression, expected):
+    """Test folding constant gate parameter expressions into decimal values"""
+    qasm = f"OPENQASM 3.0;\nqubit[1] q;\nrz({expression}) q[0];"
+    assert _fold(qasm).splitlines()[-1] == f"rz({expected}) q[0];"
+
+
+def test_fold_constants_in_gate_definition():
+    """Test that constant expressions inside gate definition bodies are folded"""
+    qasm = """
+    OPENQASM 3.0;
+    gate g(theta) a {
+      rz(pi / 4) a;
+      rx(theta + pi) a;
+    }
+    qubit[1] q;
+    g(pi) q[0];
+    """
+    folded = _fold(qasm)
+    assert "rz(0.7853981633974483) a;" in folded
+    assert "rx(theta + 3.141592653589793) a;" in folded
+    assert "g(3.141592653589793) q[0];" in folded
+
+
+def test_fold_constants_skips_division_by_zero():
+    """Test that expressions that cannot be evaluated are left unchanged"""
+    qasm = "OPENQASM 3.0;\nqubit[1] q;\nrz(1 / 0) q[0];"
+    assert _fold(qasm).splitlines()[-1] == "rz(1 / 0) q[0];"
+
+
+def test_fold_constants_keeps_integer_division():
+    """Test that integer division is only folded in real-valued contexts"""
+    qasm = """
+    OPENQASM 3.0;
+    int[32] n = 7 / 2;
+    float[64] f = 7 / 2;
+    const angle a = 3 / 2;
+    qubit[4] q;
+    rx(1 / 2) q[4 / 2];
+    gphase(1 / 4);
+    """
+    folded = _fold(qasm)
+    assert "int[32] n = 7 / 2;" in folded
+    assert "float[64] f = 3.5;" in folded
+    assert "const angle a = 1.5;" in folded
+    assert "rx(0.5) q[4 / 2];" in folded
+    assert "gphase(0.25);" in folded
+
+
+def test_run_pipeline_parses_and_dumps_once():
+    """Test that a pipeline of passes parses and dumps the program a single time"""
+    qasm = "OPENQASM 3.0;\nqubit[1] q;\nrz(pi / 2) q[0];"
+    with (
+        patch("qbraid.passes.qasm.pipeline.parse", wraps=parse) as mock_parse,
+        patch("qbraid.passes.qasm.pipeline.dumps_program", wraps=dumps_program) as mock_dumps,
+    ):
+        output = run_pipeline(qasm, [fold_constants, fold_constants])
+
+    assert mock_parse.call_count == 1
+    assert mock_dumps.call_count == 1
+    assert "rz(1.5707963267948966) q[0];" in output
+
+
+def test_run_pipeline_invalid_program():
+    """Test that run_pipeline raises a ValueError for unparsable programs"""
+    with pytest.raises(ValueError, match="Invalid OpenQASM program."):
+        run_pipeline("OPENQASM 3.0; qubit[1 q;", [])
+
+
+def test_rebase_normalize_params_matches_string_passes():
+    """Test that rebasing with normalize_params matches the string-based normalization"""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[2] q;
+    h q[0];
+    cry(pi/4) q[0], q[1];
+    crx(0.5) q[0], q[1];
+    """
+    gateset = {"h", "rz", "ry", "cx"}
+    expected = normalize_qasm_gate_params(rebase(qasm, gateset))
+    actual = rebase(qasm, gateset, normalize_params=True)
+    assert actual.strip() == expected.strip()
+
+
+def test_rebase_normalize_params_unsatisfied_predicates():
+    """Test that the original program is normalized when predicates are not required"""
+    qasm = "OPENQASM 3.0;\nqubit[1] q;\nrz(pi / 2) q[0];"
+    with pytest.raises(CompilationError):
+        rebase(qasm, {"h"}, normalize_params=True)
+
+    output = rebase(qasm, {"h"}, require_predicates=False, normalize_params=True)
+    assert "rz(1.5707963267948966) q[0];" in output
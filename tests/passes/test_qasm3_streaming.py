@@ -0,0 +1,120 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for streaming rebase of flat OpenQASM programs
+
+"""
+import io
+from unittest.mock import patch
+
+import pytest
+
+from qbraid.passes.exceptions import CompilationError
+from qbraid.passes.qasm import is_flat_program, rebase, rebase_stream
+from qbraid.passes.qasm.streaming import _parse_statement
+
+FLAT_PROGRAM = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[3] q;
+bit[3] c;
+h q[0];
+cz q[0], q[1];
+crx(pi / 4) q[1], q[2];
+rz(sin(0.5)) q[2];
+h q;
+c = measure q;
+"""
+
+
+def _rebase_stream(source, *args, **kwargs) -> str:
+    sink = io.StringIO()
+    rebase_stream(source, sink, *args, **kwargs)
+    return sink.getvalue()
+
+
+@pytest.mark.parametrize("normalize_params", [False, True])
+def test_rebase_stream_matches_rebase(normalize_params):
+    """Test that streaming and AST rebase produce the same program"""
+    basis = {"h", "cx", "rz", "ry", "s"}
+    expected = rebase(FLAT_PROGRAM, basis, normalize_params=normalize_params)
+    assert _rebase_stream(FLAT_PROGRAM, basis, normalize_params=normalize_params) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64])
+def test_rebase_stream_chunked_source_with_comments(chunk_size):
+    """Test statements and comments split across chunk boundaries of a text stream"""
+    qasm = (
+        "OPENQASM 3.0; // header; comment\nqubit[2] q;\n/* block ; comment */ cz q[0],\n"
+        "q[1]; // trailing comment"
+    )
+    expected = "OPENQASM 3.0;\nqubit[2] q;\nh q[1];\ncx q[0], q[1];\nh q[1];\n"
+    with patch("qbraid.passes.qasm.streaming.CHUNK_SIZE", chunk_size):
+        assert _rebase_stream(io.StringIO(qasm), {"h", "cx"}) == expected
+    chunks = [qasm[i : i + chunk_size] for i in range(0, len(qasm), chunk_size)]
+    assert _rebase_stream(chunks, {"h", "cx"}) == expected
+
+
+def test_rebase_stream_gate_mappings():
+    """Test renaming gates while streaming"""
+    qasm = "OPENQASM 3.0;\nqubit[2] q;\ncx q[0], q[1];\n"
+    assert _rebase_stream(qasm, {"h", "cx"}, gate_mappings={"cx": "cnot"}) == (
+        "OPENQASM 3.0;\nqubit[2] q;\ncnot q[0], q[1];\n"
+    )
+
+
+def test_rebase_stream_caches_repeated_statements():
+    """Test that repeated statements are only rebased once"""
+    qasm = "OPENQASM 3.0;\nqubit[2] q;\n" + "cz q[0], q[1];\n" * 5
+
+    with patch(
+        "qbraid.passes.qasm.streaming._parse_statement", wraps=_parse_statement
+    ) as mock_parse:
+        output = _rebase_stream(qasm, {"h", "cx"})
+    assert output.count("cx q[0], q[1];") == 5
+    assert mock_parse.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "qasm",
+    [
+        "OPENQASM 3.0;\nqubit[1] q;\ngate g a { h a; }\n",
+        "OPENQASM 3.0;\nqubit[1] q;\nbit c;\nif (c) x q[0];\n",
+        "OPENQASM 3.0;\nqubit[1] q;\nfor int i in [0:1] { x q[0]; }\n",
+    ],
+)
+def test_rebase_stream_rejects_nested_scopes(qasm):
+    """Test that programs with definitions or control flow are rejected"""
+    assert not is_flat_program(qasm)
+    with pytest.raises(ValueError, match="only supports flat programs"):
+        _rebase_stream(qasm, {"x"})
+
+
+def test_is_flat_program():
+    """Test detecting flat programs"""
+    assert is_flat_program(FLAT_PROGRAM)
+    assert is_flat_program(io.StringIO(FLAT_PROGRAM))
+
+
+@pytest.mark.parametrize("qasm", ["OPENQASM 3.0;\nqubit q;\nh q", "OPENQASM 3.0;\n/* comment"])
+def test_rebase_stream_unterminated_input(qasm):
+    """Test that unterminated statements and comments raise an error"""
+    with pytest.raises(ValueError, match="unterminated statement or comment"):
+        _rebase_stream(qasm, {"h"})
+
+
+def test_rebase_stream_unsatisfied_predicates():
+    """Test that a gate outside of the basis raises a compilation error"""
+    with pytest.raises(CompilationError):
+        _rebase_stream("OPENQASM 3.0;\nqubit[2] q;\nswap q[0], q[1];\n", {"h"})
@@ -257,6 +257,22 @@ def test_align_measurements_for_partial_measurement():
     ), "The circuit should remain unchanged as not all qubits are measured"
 
 
+def test_align_final_measurements_wide_moments():
+    """Test aligning measurements that are spread across wide moments."""
+    qubits = cirq.LineQubit.range(6)
+    circuit = cirq.Circuit(
+        cirq.Moment(cirq.H.on_each(*qubits)),
+        cirq.Moment([cirq.measure(q) for q in qubits[:3]] + [cirq.X.on_each(*qubits[3:])]),
+        cirq.Moment(cirq.measure(q) for q in qubits[3:]),
+    )
+    expected_circuit = cirq.Circuit(
+        cirq.Moment(cirq.H.on_each(*qubits)),
+        cirq.Moment(cirq.X.on_each(*qubits[3:])),
+        cirq.Moment(cirq.measure(q) for q in qubits),
+    )
+    assert CirqCircuit.align_final_measurements(circuit) == expected_circuit
+
+
 def test_raise_program_type_error():
     """Test raising ProgramTypeError"""
     with pytest.raises(ProgramTypeError):
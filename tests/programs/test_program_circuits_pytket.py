@@ -93,6 +93,24 @@ def test_remove_measurements():
         assert command.op.type != OpType.Measure
 
 
+def test_remove_measurements_keeps_registers_and_ops():
+    """Test that removing measurements keeps named registers and gate parameters"""
+    circuit = Circuit()
+    qreg = circuit.add_q_register("a", 2)
+    creg = circuit.add_c_register("c", 2)
+    circuit.Rz(0.25, qreg[1])
+    circuit.CX(qreg[0], qreg[1])
+    circuit.Measure(qreg[0], creg[0])
+    circuit.Measure(qreg[1], creg[1])
+    new_circuit = PytketCircuit.remove_measurements(circuit)
+
+    assert new_circuit.qubits == circuit.qubits
+    assert new_circuit.bits == circuit.bits
+    assert [(cmd.op, cmd.args) for cmd in new_circuit.get_commands()] == [
+        (cmd.op, cmd.args) for cmd in circuit.get_commands() if cmd.op.type != OpType.Measure
+    ]
+
+
 @pytest.mark.parametrize("flat", [True, False])
 @pytest.mark.parametrize("list_type", [True, False])
 def test_gate_to_matrix_pytket(flat, list_type):
@@ -16,6 +16,8 @@
 Unit tests for qbraid.programs.qasm.OpenQasm3Program
 
 """
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 from qiskit.qasm3 import dumps, loads
@@ -238,3 +240,60 @@ def test_raise_program_type_error():
             OpenQasm3Program(42)
     finally:
         unregister_program_type("int")
+
+
+def test_batch_defers_reparse_until_exit():
+    """Test that mutations inside a batch context are reparsed once on exit"""
+    qasm_str = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[4] q;
+    h q[1];
+    cx q[1], q[3];
+    """
+    program = OpenQasm3Program(qasm_str)
+    original = program.program
+
+    with patch.object(program, "_reparse", wraps=program._reparse) as mock_reparse:
+        with program.batch():
+            program.remove_idle_qubits()
+            program.reverse_qubit_order()
+            assert program.program == original
+            mock_reparse.assert_not_called()
+
+        mock_reparse.assert_called_once()
+
+    expected = OpenQasm3Program(qasm_str)
+    expected.remove_idle_qubits()
+    expected.reverse_qubit_order()
+    assert program.program == expected.program
+    assert program.num_qubits == 2
+
+
+def test_nested_batch_reparses_on_outermost_exit():
+    """Test that nested batch contexts only reparse when the outermost context exits"""
+    program = OpenQasm3Program(qasm3_bell())
+
+    with patch.object(program, "_reparse", wraps=program._reparse) as mock_reparse:
+        with program.batch():
+            with program.batch():
+                program.reverse_qubit_order()
+            mock_reparse.assert_not_called()
+        mock_reparse.assert_called_once()
+
+
+def test_batch_reparses_on_error():
+    """Test that the program stays consistent with the module if an error is raised
+    inside the batch"""
+    program = OpenQasm3Program(qasm3_bell())
+    expected = OpenQasm3Program(qasm3_bell())
+    expected.reverse_qubit_order()
+
+    with pytest.raises(RuntimeError):
+        with program.batch():
+            program.reverse_qubit_order()
+            raise RuntimeError("boom")
+
+    assert program.program == expected.program == str(program.module)
+    assert not program._reparse_pending
+    assert program._batch_depth == 0
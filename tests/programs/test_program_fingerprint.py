@@ -0,0 +1,230 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for QuantumProgram structural fingerprints
+
+"""
+from unittest.mock import patch
+
+import braket.circuits
+import cirq
+import numpy as np
+import pytest
+import qiskit
+from pytket.circuit import Circuit as TKCircuit
+
+from qbraid.programs import load_program
+from qbraid.programs.gate_model.ionq import IonQProgram
+from qbraid.programs.gate_model.qasm2 import OpenQasm2Program
+from qbraid.programs.gate_model.qasm3 import OpenQasm3Program
+
+
+def _cirq(theta: float = 0.5) -> cirq.Circuit:
+    q0, q1 = cirq.LineQubit.range(2)
+    return cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.rz(theta).on(q1))
+
+
+def _qiskit(theta: float = 0.5) -> qiskit.QuantumCircuit:
+    circuit = qiskit.QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.rz(theta, 1)
+    return circuit
+
+
+def _braket(theta: float = 0.5) -> braket.circuits.Circuit:
+    return braket.circuits.Circuit().h(0).cnot(0, 1).rz(1, theta)
+
+
+def _pytket(theta: float = 0.5) -> TKCircuit:
+    return TKCircuit(2).H(0).CX(0, 1).Rz(theta, 1)
+
+
+def _qasm2(theta: float = 0.5) -> str:
+    return f"""
+    OPENQASM 2.0;
+    include "qelib1.inc";
+    qreg q[2];
+    h q[0];
+    cx q[0],q[1];
+    rz({theta}) q[1];
+    """
+
+
+def _qasm3(theta: float = 0.5) -> str:
+    return f"""
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[2] q;
+    h q[0];
+    cx q[0], q[1];
+    rz({theta}) q[1];
+    """
+
+
+def _ionq(theta: float = 0.5) -> dict:
+    return {
+        "qubits": 2,
+        "circuit": [
+            {"gate": "h", "target": 0},
+            {"gate": "cnot", "control": 0, "target": 1},
+            {"gate": "rz", "target": 1, "rotation": theta},
+        ],
+    }
+
+
+CIRCUIT_BUILDERS = {
+    "cirq": _cirq,
+    "qiskit": _qiskit,
+    "braket": _braket,
+    "pytket": _pytket,
+    "qasm2": _qasm2,
+    "qasm3": _qasm3,
+    "ionq": _ionq,
+}
+
+
+def _load(alias: str, theta: float = 0.5):
+    program = CIRCUIT_BUILDERS[alias](theta)
+    if alias == "ionq":
+        return IonQProgram(program)
+    return load_program(program)
+
+
+@pytest.mark.parametrize("alias", CIRCUIT_BUILDERS)
+def test_fingerprint_equal_for_identical_structure(alias):
+    """Test that separately constructed, structurally identical programs hash equal"""
+    fingerprint = _load(alias).fingerprint()
+    assert isinstance(fingerprint, str)
+    assert len(fingerprint) == 64
+    assert fingerprint == _load(alias).fingerprint()
+
+
+@pytest.mark.parametrize("alias", CIRCUIT_BUILDERS)
+def test_fingerprint_differs_for_different_params(alias):
+    """Test that changing a gate parameter changes the fingerprint"""
+    assert _load(alias, 0.5).fingerprint() != _load(alias, 0.25).fingerprint()
+
+
+@pytest.mark.parametrize("alias", CIRCUIT_BUILDERS)
+def test_fingerprint_ignores_float_noise(alias):
+    """Test that parameters equal up to floating point noise hash equal"""
+    assert _load(alias, 0.5).fingerprint() == _load(alias, 0.5 + 1e-14).fingerprint()
+
+
+def test_fingerprint_differs_across_program_types():
+    """Test that the program type is part of the fingerprint"""
+    assert _load("qasm2").fingerprint() != _load("qasm3").fingerprint()
+
+
+def test_fingerprint_differs_for_different_qubits():
+    """Test that acting on different qubits changes the fingerprint"""
+    circuit1 = qiskit.QuantumCircuit(2)
+    circuit1.cx(0, 1)
+    circuit2 = qiskit.QuantumCircuit(2)
+    circuit2.cx(1, 0)
+    assert load_program(circuit1).fingerprint() != load_program(circuit2).fingerprint()
+
+
+def test_fingerprint_includes_measurements():
+    """Test that measurements are part of the fingerprint"""
+    circuit = _cirq()
+    measured = circuit + cirq.Circuit(cirq.measure(*cirq.LineQubit.range(2), key="m"))
+    assert load_program(circuit).fingerprint() != load_program(measured).fingerprint()
+
+
+def test_fingerprint_cirq_moment_order_independent():
+    """Test that the order of operations within a cirq moment does not matter"""
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit1 = cirq.Circuit(cirq.Moment([cirq.X(q0), cirq.Y(q1)]))
+    circuit2 = cirq.Circuit(cirq.Moment([cirq.Y(q1), cirq.X(q0)]))
+    assert load_program(circuit1).fingerprint() == load_program(circuit2).fingerprint()
+
+
+def test_fingerprint_cirq_matrix_gate():
+    """Test fingerprinting cirq gates that are defined by their unitary"""
+    q0 = cirq.LineQubit(0)
+    circuit1 = cirq.Circuit(cirq.MatrixGate(np.eye(2)).on(q0))
+    circuit2 = cirq.Circuit(cirq.MatrixGate(np.array([[0, 1], [1, 0]])).on(q0))
+    assert load_program(circuit1).fingerprint() != load_program(circuit2).fingerprint()
+
+
+def test_fingerprint_qasm_broadcast_and_constants():
+    """Test that qasm register broadcasts and constant expressions are normalized"""
+    qasm1 = """
+    OPENQASM 3.0;
+    qubit[2] q;
+    h q;
+    rz(pi / 2) q[1];
+    """
+    qasm2 = """
+    OPENQASM 3.0;
+    qubit[2] q;
+    h q[0];
+    h q[1];
+    rz(1.5707963267948966) q[1];
+    """
+    assert OpenQasm3Program(qasm1).fingerprint() == OpenQasm3Program(qasm2).fingerprint()
+
+
+def test_fingerprint_qasm2_ignores_formatting():
+    """Test that whitespace and comments do not affect qasm fingerprints"""
+    qasm = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\n// bell\nh   q[0];\ncx q[0],q[1];'
+    compact = 'OPENQASM 2.0; include "qelib1.inc"; qreg q[2]; h q[0]; cx q[0], q[1];'
+    assert OpenQasm2Program(qasm).fingerprint() == OpenQasm2Program(compact).fingerprint()
+
+
+def test_fingerprint_cached_until_program_replaced():
+    """Test that the fingerprint of a string program is cached and recomputed when the
+    program is replaced"""
+    program = OpenQasm3Program(_qasm3())
+
+    with patch.object(
+        type(program), "_canonical_gates", autospec=True, side_effect=lambda self: []
+    ) as mock_gates:
+        first = program.fingerprint()
+        assert program.fingerprint() == first
+        assert mock_gates.call_count == 1
+
+        program.remove_idle_qubits()
+        program.fingerprint()
+        assert mock_gates.call_count == 2
+
+
+@pytest.mark.parametrize("alias", ["braket", "cirq", "qiskit", "ionq"])
+def test_fingerprint_reflects_in_place_mutation(alias):
+    """Test that mutating a circuit object in place changes its fingerprint"""
+    program = _load(alias)
+    before = program.fingerprint()
+
+    circuit = program.program
+    if alias == "braket":
+        circuit.measure(0)
+    elif alias == "cirq":
+        circuit.append(cirq.measure(cirq.LineQubit(0)))
+    elif alias == "qiskit":
+        circuit.x(0)
+    else:
+        circuit["circuit"].append({"gate": "x", "target": 0})
+
+    assert program.fingerprint() != before
+
+
+def test_fingerprint_not_implemented():
+    """Test that program types without a canonical form raise NotImplementedError"""
+    program = load_program(_cirq())
+    with patch.object(type(program), "_canonical_gates", side_effect=NotImplementedError):
+        with pytest.raises(NotImplementedError):
+            program.fingerprint()
@@ -0,0 +1,211 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the array-backed GateArray gate sequence representation
+
+"""
+import json
+
+import numpy as np
+import pytest
+
+from qbraid.programs.gate_model import GateArray, GateArrayBuilder
+from qbraid.programs.gate_model.ionq import GateSet, IonQProgram
+from qbraid.programs.gate_model.qasm3 import OpenQasm3Program
+from qbraid.transpiler.conversions.openqasm3.openqasm3_to_ionq import _parse_gates
+
+IONQ_CIRCUIT = [
+    {"gate": "h", "target": 0},
+    {"gate": "cnot", "control": 0, "target": 1},
+    {"gate": "rz", "target": 2, "rotation": 0.5},
+    {"gate": "zz", "targets": [0, 1], "rotation": 0.25},
+    {"gate": "ccnot", "controls": [0, 1], "target": 3},
+    {"gate": "h", "target": 1},
+]
+
+
+def test_gate_array_ionq_round_trip():
+    """Test that IonQ gate lists are losslessly converted to and from a gate array"""
+    gates = GateArray.from_ionq(IONQ_CIRCUIT)
+    assert len(gates) == len(IONQ_CIRCUIT)
+    assert gates.to_ionq() == IONQ_CIRCUIT
+
+
+def test_gate_array_interns_names():
+    """Test that gate names are stored once in the name table"""
+    gates = GateArray.from_ionq(IONQ_CIRCUIT)
+    assert gates.names == ["h", "cnot", "rz", "zz", "ccnot"]
+    assert gates.opcodes.tolist() == [0, 1, 2, 3, 4, 0]
+    assert gates.name(5) == "h"
+
+
+def test_gate_array_columns():
+    """Test the padded qubit columns and CSR parameter layout"""
+    gates = GateArray.from_ionq(IONQ_CIRCUIT)
+    assert gates.targets.tolist() == [[0, -1], [1, -1], [2, -1], [0, 1], [3, -1], [1, -1]]
+    assert gates.controls.tolist() == [[-1, -1], [0, -1], [-1, -1], [-1, -1], [0, 1], [-1, -1]]
+    assert gates.param_offsets.tolist() == [0, 0, 0, 1, 2, 2, 2]
+    assert gates.param_values.tolist() == [0.5, 0.25]
+    assert gates.num_qubits == 4
+
+
+def test_gate_array_masks():
+    """Test vectorized gate name and parameter queries"""
+    gates = GateArray.from_ionq(IONQ_CIRCUIT)
+    np.testing.assert_array_equal(
+        gates.name_mask({"h", "zz"}), [True, False, False, True, False, True]
+    )
+    np.testing.assert_array_equal(
+        gates.has_param("rotation"), [False, False, True, True, False, False]
+    )
+    assert not gates.has_param("angle").any()
+
+
+def test_gate_array_list_and_extra_params():
+    """Test list-valued parameters and parameters that are not numeric"""
+    circuit = [
+        {"gate": "ms", "targets": [0, 1], "phases": [0.0, 0.25], "angle": 0.1},
+        {"gate": "gpi", "target": 0, "phase": 0.5, "label": "a"},
+    ]
+    gates = GateArray.from_ionq(circuit)
+    assert gates.extras == {1: {"label": "a"}}
+    assert gates.has_param("label").tolist() == [False, True]
+    assert gates.to_ionq() == circuit
+
+
+def test_gate_array_keeps_integer_params():
+    """Test that integer parameters are not emitted as floats"""
+    circuit = [
+        {"gate": "rx", "target": 0, "rotation": 1},
+        {"gate": "ms", "targets": [0, 1], "phases": [0, 0.25], "angle": 0},
+    ]
+    gates = GateArray.from_ionq(circuit)
+    assert gates.param_is_int.tolist() == [True, True, False, True]
+    emitted = gates.to_ionq()
+    assert emitted == circuit
+    assert isinstance(emitted[0]["rotation"], int)
+    assert isinstance(emitted[1]["phases"][1], float)
+    assert gates.to_ionq_json() == json.dumps(circuit).encode()
+
+
+def test_gate_array_builder():
+    """Test building a gate array incrementally"""
+    builder = GateArrayBuilder()
+    builder.append("x", 0)
+    builder.append("cnot", 1, 0)
+    assert len(builder) == 2
+    assert builder.build().to_ionq() == [
+        {"gate": "x", "target": 0},
+        {"gate": "cnot", "control": 0, "target": 1},
+    ]
+
+
+def test_gate_array_empty():
+    """Test an empty gate array"""
+    gates = GateArrayBuilder().build()
+    assert len(gates) == 0
+    assert gates.num_qubits == 0
+    assert not gates.to_ionq()
+    assert gates.name_mask({"h"}).tolist() == []
+
+
+@pytest.mark.parametrize(
+    "circuit, expected",
+    [
+        (IONQ_CIRCUIT, GateSet.QIS),
+        ([{"gate": "zz", "targets": [0, 1], "angle": 0.1}], GateSet.NATIVE),
+    ],
+)
+def test_determine_gateset_from_gate_array(circuit, expected):
+    """Test determining the gate set from a gate array"""
+    assert IonQProgram.determine_gateset(GateArray.from_ionq(circuit)) == expected
+
+
+def test_ionq_program_gate_array_reflects_mutation():
+    """Test that the IonQ program gate array reflects changes to the program"""
+    program = IonQProgram({"qubits": 4, "circuit": list(IONQ_CIRCUIT)})
+    num_gates = len(program.gate_array)
+
+    program.program["circuit"].append({"gate": "x", "target": 0})
+    assert len(program.gate_array) == num_gates + 1
+
+    program.program = {"qubits": 1, "circuit": [{"gate": "x", "target": 0}]}
+    assert program.gate_array.names == ["x"]
+
+
+def test_ionq_program_validation_reuses_gate_array(monkeypatch):
+    """Test that repeated validation of a large IonQ program builds its gate array once"""
+    circuit = [{"gate": "h", "target": i % 8} for i in range(100_000)]
+    program = IonQProgram({"qubits": 8, "circuit": circuit})
+
+    builds = []
+    from_ionq = GateArray.from_ionq
+
+    def counting_from_ionq(gates):
+        builds.append(len(gates))
+        return from_ionq(gates)
+
+    monkeypatch.setattr(GateArray, "from_ionq", staticmethod(counting_from_ionq))
+
+    for _ in range(10):
+        program.validate_for_gateset()
+    assert builds == [100_000]
+
+    program.program = {"qubits": 1, "circuit": [{"gate": "x", "target": 0}]}
+    program.validate_for_gateset()
+    assert builds == [100_000, 1]
+
+
+def test_parse_gates_returns_gate_array():
+    """Test that OpenQASM gates are parsed into a gate array"""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[2] q;
+    h q[0];
+    h q[1];
+    cx q[0], q[1];
+    rz(0.5) q[1];
+    """
+    gates = _parse_gates(OpenQasm3Program(qasm))
+    assert isinstance(gates, GateArray)
+    assert gates.to_ionq() == [
+        {"gate": "h", "target": 0},
+        {"gate": "h", "target": 1},
+        {"gate": "cnot", "control": 0, "target": 1},
+        {"gate": "rz", "target": 1, "rotation": 0.5},
+    ]
+
+
+@pytest.mark.parametrize(
+    "circuit",
+    [
+        IONQ_CIRCUIT,
+        [
+            {"gate": "ms", "targets": [0, 1], "phases": [0.0, 0.25], "angle": 0.1},
+            {"gate": "gpi", "target": 0, "phase": 0.5, "label": "a"},
+            {"gate": "rz", "control": 1, "target": 0, "rotation": 1e-20},
+            {"gate": "x", "targets": [2]},
+            {"gate": "100%"},
+        ],
+        [{"gate": "rx", "target": 0, "rotation": float("nan")}],
+        [{"gate": "rx", "target": 0, "rotation": 1}, {"gate": "gpi2", "target": 1, "phase": 0}],
+        [],
+    ],
+)
+def test_gate_array_to_ionq_json(circuit):
+    """Test that the bulk JSON emitter matches encoding the IonQ gate list"""
+    gates = GateArray.from_ionq(circuit)
+    assert gates.to_ionq_json() == json.dumps(gates.to_ionq()).encode()
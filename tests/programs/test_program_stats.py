@@ -0,0 +1,186 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for GateModelProgram circuit resource statistics
+
+"""
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import braket.circuits
+import cirq
+import pytest
+import qiskit
+from pytket.circuit import Circuit as TKCircuit
+
+from qbraid.programs import load_program
+from qbraid.programs.gate_model import CircuitStats, GateModelProgram
+from qbraid.programs.gate_model.ionq import IonQProgram
+from qbraid.programs.gate_model.qasm3 import OpenQasm3Program
+
+
+def test_stats_qiskit():
+    """Test collecting statistics of a qiskit circuit with idle qubits and a barrier"""
+    circuit = qiskit.QuantumCircuit(4, 2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.barrier()
+    circuit.rz(0.1, 1)
+    circuit.measure([0, 1], [0, 1])
+
+    stats = load_program(circuit).stats()
+    assert stats == CircuitStats(
+        num_qubits=4,
+        gate_counts={"h": 1, "cx": 1, "barrier": 1, "rz": 1, "measure": 2},
+        num_two_qubit_gates=1,
+        depth=circuit.depth(),
+        measured_qubits=frozenset({0, 1}),
+        idle_qubits=frozenset({2, 3}),
+    )
+
+
+def test_stats_cirq():
+    """Test collecting statistics of a cirq circuit"""
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H(q0), cirq.CNOT(q0, q2), cirq.CCZ(q0, q1, q2), cirq.measure(q0, q1, key="m")
+    )
+    program = load_program(circuit)
+
+    stats = program.stats()
+    assert stats.gate_counts == {"HPowGate": 1, "CXPowGate": 1, "CCZPowGate": 1, "measure": 1}
+    assert stats.num_two_qubit_gates == 1
+    assert stats.depth == program.depth
+    assert stats.measured_qubits == {0, 1}
+    assert stats.idle_qubits == frozenset()
+
+
+def test_stats_braket_idle_qubits():
+    """Test that idle qubits of a braket circuit are reported by index"""
+    circuit = braket.circuits.Circuit().h(4).cnot(4, 8).measure(4)
+    stats = load_program(circuit).stats()
+    assert stats.num_two_qubit_gates == 1
+    assert stats.depth == 3
+    assert stats.measured_qubits == {4}
+    assert stats.idle_qubits == {0, 1, 2, 3, 5, 6, 7}
+
+
+def test_stats_pytket():
+    """Test collecting statistics of a pytket circuit"""
+    circuit = TKCircuit(3, 1).H(0).CX(0, 1).Measure(1, 0)
+    program = load_program(circuit)
+    stats = program.stats()
+    assert stats.gate_counts == {"H": 1, "CX": 1, "Measure": 1}
+    assert stats.depth == program.depth
+    assert stats.measured_qubits == {1}
+    assert stats.idle_qubits == {2}
+
+
+def test_stats_qasm3_broadcast():
+    """Test that register-level qasm operations are counted per qubit"""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[3] q;
+    bit[3] b;
+    h q;
+    cx q[0], q[1];
+    b = measure q;
+    """
+    stats = OpenQasm3Program(qasm).stats()
+    assert stats.gate_counts == {"h": 3, "cx": 1, "measure": 3}
+    assert stats.num_two_qubit_gates == 1
+    assert stats.depth == 3
+    assert stats.measured_qubits == {0, 1, 2}
+    assert stats.idle_qubits == frozenset()
+
+
+def test_stats_ionq():
+    """Test collecting statistics of an IonQ program"""
+    program = IonQProgram(
+        {
+            "qubits": 3,
+            "circuit": [
+                {"gate": "h", "target": 0},
+                {"gate": "cnot", "control": 0, "target": 1},
+                {"gate": "x", "targets": [0, 1]},
+            ],
+        }
+    )
+    stats = program.stats()
+    assert stats.num_two_qubit_gates == 2
+    assert stats.depth == 3
+    assert stats.idle_qubits == {2}
+
+
+def test_stats_cached_and_shared_with_fingerprint():
+    """Test that stats and fingerprint of a string program share a single cached
+    circuit traversal"""
+    qasm = 'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[2] q;\nh q[0];\ncx q[0], q[1];\n'
+    program = load_program(qasm)
+
+    with patch.object(
+        type(program), "_canonical_gates", autospec=True, side_effect=lambda self: []
+    ) as mock_gates:
+        stats = program.stats()
+        assert program.stats() is stats
+        program.fingerprint()
+        assert mock_gates.call_count == 1
+
+        program.program = qasm + "x q[1];\n"
+        program.stats()
+        assert mock_gates.call_count == 2
+
+
+def test_stats_reflect_in_place_mutation():
+    """Test that stats of a circuit object reflect in-place mutations"""
+    circuit = qiskit.QuantumCircuit(2, 2)
+    circuit.h(0)
+    program = load_program(circuit)
+    assert program.stats().measured_qubits == frozenset()
+
+    circuit.measure(0, 0)
+    stats = program.stats()
+    assert stats.measured_qubits == frozenset({0})
+    assert GateModelProgram.batch_stats([program]) == [stats]
+
+    braket_circuit = braket.circuits.Circuit().h(0).cnot(0, 1)
+    braket_program = load_program(braket_circuit)
+    assert braket_program.stats().measured_qubits == frozenset()
+    braket_circuit.measure(1)
+    assert braket_program.stats().measured_qubits == frozenset({1})
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_batch_stats(use_executor):
+    """Test collecting statistics of native programs and wrappers on a worker pool"""
+    q0, q1 = cirq.LineQubit.range(2)
+    cirq_circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1))
+    qiskit_circuit = qiskit.QuantumCircuit(3)
+    qiskit_circuit.h(0)
+    programs = [cirq_circuit, load_program(qiskit_circuit), "OPENQASM 3.0; qubit[1] q; x q[0];"]
+
+    if use_executor:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = GateModelProgram.batch_stats(programs, executor=executor)
+    else:
+        results = GateModelProgram.batch_stats(programs, max_workers=2)
+
+    assert [stats.gate_counts for stats in results] == [
+        {"HPowGate": 1, "CXPowGate": 1},
+        {"h": 1},
+        {"x": 1},
+    ]
+    assert results[1].idle_qubits == {1, 2}
@@ -40,6 +40,7 @@ from qbraid.runtime import (
     DeviceProgramTypeMismatchError,
     DeviceStatus,
     GateModelResultData,
+    JobStatus,
     TargetProfile,
 )
 from qbraid.runtime.aws.availability import _calculate_future_time
@@ -152,6 +153,9 @@ class TestAwsDevice:
         """Returns the region of a device."""
         return "us-east-1"
 
+    def refresh_metadata(self):
+        """Refreshes the device metadata."""
+
 
 class MockTask:
     """Mock task class."""
@@ -297,6 +301,24 @@ def test_provider_get_device(mock_sv1):
         assert isinstance(device, BraketDevice)
 
 
+@patch("qbraid.runtime.aws.device.AwsDevice")
+def test_device_status_cached(mock_aws_device, sv1_profile, monkeypatch):
+    """Test that device status is not requested again within the status cache TTL"""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    mock_aws_device.return_value = Mock(status="ONLINE", is_available=True)
+    aws_device = mock_aws_device.return_value
+    device = BraketDevice(sv1_profile)
+
+    assert device.status() == DeviceStatus.ONLINE
+    aws_device.status = "OFFLINE"
+    assert device.status() == DeviceStatus.ONLINE
+    assert aws_device.refresh_metadata.call_count == 1
+
+    device.status_cache.invalidate()
+    assert device.status() == DeviceStatus.OFFLINE
+    assert aws_device.refresh_metadata.call_count == 2
+
+
 def test_provider_get_devices(mock_sv1):
     """Test getting list of Braket devices."""
     with (
@@ -817,6 +839,18 @@ def test_braket_result_error():
         braket_task.result()
 
 
+def test_braket_task_status_not_requested_after_terminal_state():
+    """Test that the state of a finished Braket task is requested only once."""
+    task = Mock()
+    task.state.side_effect = ["QUEUED", "COMPLETED"]
+    braket_task = BraketQuantumTask("task1", task)
+
+    assert braket_task.status() == JobStatus.QUEUED
+    assert braket_task.status() == JobStatus.COMPLETED
+    assert braket_task.is_terminal_state()
+    assert task.state.call_count == 2
+
+
 def test_braket_job_cancel():
     """Test Braket job cancel method."""
     task = MockTask("task2")
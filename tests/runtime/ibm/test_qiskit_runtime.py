@@ -36,7 +36,14 @@ from qiskit_ibm_runtime.exceptions import IBMNotAuthorizedError, RuntimeInvalidS
 from qiskit_ibm_runtime.qiskit_runtime_service import QiskitBackendNotFoundError
 
 from qbraid.programs import NATIVE_REGISTRY, ExperimentType, ProgramSpec
-from qbraid.runtime import DeviceStatus, GateModelResultData, JobStateError, Result, TargetProfile
+from qbraid.runtime import (
+    DeviceStatus,
+    GateModelResultData,
+    JobStateError,
+    JobStatus,
+    Result,
+    TargetProfile,
+)
 from qbraid.runtime.exceptions import QbraidRuntimeError
 from qbraid.runtime.ibm import QiskitBackend, QiskitJob, QiskitRuntimeProvider
 from qbraid.runtime.ibm.result_builder import QiskitGateModelResultBuilder
@@ -310,6 +317,18 @@ def test_job_initialize_from_service(mock_service):
     mock_service.job.assert_called_once_with(job_id)
 
 
+def test_job_status_not_requested_after_terminal_state():
+    """Test that the status of a finished job is requested only once."""
+    runtime_job = MagicMock()
+    runtime_job.status.side_effect = ["RUNNING", "DONE"]
+    job = QiskitJob("test_job_id", job=runtime_job)
+
+    assert job.status() == JobStatus.RUNNING
+    assert job.status() == JobStatus.COMPLETED
+    assert job.status() == JobStatus.COMPLETED
+    assert runtime_job.status.call_count == 2
+
+
 def test_job_initialize_service_from_device(mock_service):
     """Test job retrieval when service is provided via the device attribute."""
     mock_device = MagicMock()
@@ -0,0 +1,80 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the requests made by IonQ jobs and devices: job data caching and
+pre-serialized job submission
+
+"""
+import json
+from unittest.mock import Mock, patch
+
+from qbraid.runtime import TargetProfile
+from qbraid.runtime.enums import JobStatus
+from qbraid.runtime.ionq import IonQDevice, IonQJob, IonQSession
+from qbraid.transpiler.conversions.openqasm3.openqasm3_to_ionq import (
+    openqasm3_to_ionq,
+    openqasm3_to_ionq_json,
+)
+
+
+def test_ionq_job_data_fetched_once_when_terminal():
+    """Test that a completed IonQ job's data is requested once across status, metadata
+    and result calls."""
+    session = Mock()
+    session.get_job.return_value = {
+        "id": "fake_job_id",
+        "status": "completed",
+        "backend": "simulator",
+        "shots": 2,
+    }
+    session.get.return_value.json.return_value = {"0": 0.5, "3": 0.5}
+    job = IonQJob("fake_job_id", session)
+
+    assert job.status() == JobStatus.COMPLETED
+    assert job.metadata()["status"] == JobStatus.COMPLETED
+    result = job.result()
+    assert result.data.get_counts() == {"00": 1, "11": 1}
+    assert job.status() == JobStatus.COMPLETED
+
+    session.get_job.assert_called_once_with("fake_job_id")
+    assert "probabilities" not in session.get_job.return_value
+
+
+def test_ionq_submit_serialized_input():
+    """Test that a pre-serialized IonQ program is spliced into the job request body."""
+    circuit = """
+    OPENQASM 3.0;
+    qubit[2] q;
+    h q[0];
+    cx q[0], q[1];
+    """
+    device = IonQDevice(
+        TargetProfile(device_id="simulator", simulator=True),
+        IonQSession("fake_api_key"),
+    )
+    with patch.object(device.session, "create_job", return_value={"id": "job-id"}) as mock_create:
+        job = device.submit(openqasm3_to_ionq_json(circuit), shots=10, name="bell")
+
+    assert job.id == "job-id"
+    data = mock_create.call_args.args[0]
+    assert isinstance(data, bytes)
+    assert json.loads(data) == {
+        "backend": "simulator",
+        "shots": 10,
+        "dry_run": False,
+        "type": "ionq.circuit.v1",
+        "name": "bell",
+        "input": openqasm3_to_ionq(circuit),
+    }
@@ -21,21 +21,37 @@ Unit tests for QbraidDevice and QbraidProvider classes.
 import importlib.util
 import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from unittest.mock import Mock, patch
 
 import cirq
 import numpy as np
 import pytest
+import requests
 from qbraid_core.services.runtime.schemas import Program, RuntimeDevice
 
 from qbraid._caching import cache_disabled
-from qbraid.programs import ExperimentType, ProgramSpec, unregister_program_type
+from qbraid.programs import (
+    ExperimentType,
+    ProgramSpec,
+    get_program_type_alias,
+    load_program,
+    unregister_program_type,
+)
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.typer import IonQDict
-from qbraid.runtime import Result, TargetProfile, ValidationLevel
-from qbraid.runtime.exceptions import ProgramValidationError, ResourceNotFoundError
+from qbraid.runtime import DeviceStatus, Result, TargetProfile, ValidationLevel
+from qbraid.runtime._pipeline import load_pipeline_program, program_cache
+from qbraid.runtime.device import STATUS_CACHE_TTL
+from qbraid.runtime.exceptions import (
+    BatchPreparationError,
+    BatchSubmissionError,
+    ProgramValidationError,
+    ResourceNotFoundError,
+)
 from qbraid.runtime.native import QbraidDevice, QbraidJob, QbraidProvider
 from qbraid.runtime.native.provider import (
     _serialize_sequence,
@@ -476,7 +492,13 @@ def test_get_device_fail():
 
 def test_set_options(mock_qbraid_device: QbraidDevice):
     """Test updating the default runtime options."""
-    default_options = {"transpile": True, "transform": True, "validate": 2, "prepare": True}
+    default_options = {
+        "transpile": True,
+        "transform": True,
+        "validate": 2,
+        "prepare": True,
+        "optimize": False,
+    }
     assert dict(mock_qbraid_device._options) == default_options
 
     mock_qbraid_device.set_options(transform=False)
@@ -999,3 +1021,307 @@ def test_validate_qasm_no_measurements_without_measurements():
     device_id = "quera_device"
     # Should not raise
     validate_qasm_no_measurements(qasm_no_measurements, device_id)
+
+
+@pytest.mark.parametrize("optimize", [False, True])
+def test_apply_runtime_profile_optimize(optimize):
+    """Test that peephole optimization of OpenQASM programs is an opt-in runtime step."""
+    profile = TargetProfile(
+        device_id="mock_device",
+        simulator=True,
+        experiment_type=ExperimentType.GATE_MODEL,
+        num_qubits=2,
+    )
+    device = MockDevice(profile=profile)
+    device.set_options(optimize=optimize)
+    qasm = 'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[2] q;\nh q[0];\nh q[0];\ncx q[0], q[1];\n'
+    run_input = device.apply_runtime_profile(qasm)
+    if optimize:
+        assert run_input == 'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[2] q;\ncx q[0], q[1];\n'
+    else:
+        assert run_input == qasm
+
+    circuit = cirq.Circuit(cirq.H(cirq.LineQubit(0)), cirq.H(cirq.LineQubit(0)))
+    assert device.apply_runtime_profile(circuit) is circuit
+
+
+def _batch_profile() -> TargetProfile:
+    return TargetProfile(
+        device_id="mock_device",
+        simulator=True,
+        experiment_type=ExperimentType.GATE_MODEL,
+        num_qubits=2,
+    )
+
+
+@pytest.mark.parametrize("max_workers, use_executor", [(4, False), (None, True), (1, False)])
+def test_run_prepares_batch_concurrently(max_workers, use_executor):
+    """Test that a batch is prepared on a worker pool and submitted in input order."""
+    device = MockDevice(profile=_batch_profile())
+    programs = [cirq.Circuit(cirq.X(cirq.LineQubit(0)) ** (i / 10)) for i in range(10)]
+
+    with (
+        patch.object(device, "prepare", side_effect=lambda p: (p,)) as mock_prepare,
+        patch.object(device, "submit", side_effect=lambda run_input, **kwargs: run_input),
+        ThreadPoolExecutor(max_workers=2) as executor,
+    ):
+        result = device.run(
+            programs,
+            shots=10,
+            max_workers=max_workers,
+            executor=executor if use_executor else None,
+        )
+
+    assert result == [(p,) for p in programs]
+    assert mock_prepare.call_count == len(programs)
+
+
+@pytest.mark.asyncio
+async def test_async_run_and_submit_off_event_loop():
+    """Test that async run and submit prepare and submit programs off the event loop."""
+    device = MockDevice(profile=_batch_profile())
+    circuit = cirq.Circuit(cirq.X(cirq.LineQubit(0)))
+    loop_thread = threading.get_ident()
+    submit_threads = []
+
+    def submit(run_input, **kwargs):
+        submit_threads.append(threading.get_ident())
+        return run_input, kwargs
+
+    with patch.object(device, "submit", side_effect=submit):
+        run_input, kwargs = await device.async_run(circuit, shots=10)
+        assert await device.async_submit(run_input, shots=5) == (run_input, {"shots": 5})
+
+    assert kwargs == {"shots": 10}
+    assert len(submit_threads) == 2
+    assert loop_thread not in submit_threads
+
+
+def test_run_batch_reports_failures_per_program():
+    """Test that each failed program is reported and nothing is submitted."""
+    device = MockDevice(profile=_batch_profile())
+    programs = [cirq.Circuit(cirq.X(cirq.LineQubit(i))) for i in range(5)]
+
+    def prepare(program):
+        if cirq.LineQubit(2) in program.all_qubits():
+            raise ValueError("bad program")
+        if cirq.LineQubit(4) in program.all_qubits():
+            raise ProgramValidationError("too many qubits")
+        return program
+
+    with (
+        patch.object(device, "prepare", side_effect=prepare),
+        patch.object(device, "submit") as mock_submit,
+        pytest.raises(BatchPreparationError) as excinfo,
+    ):
+        device.run(programs, max_workers=3)
+
+    mock_submit.assert_not_called()
+    assert list(excinfo.value.errors) == [2, 4]
+    assert isinstance(excinfo.value.errors[4], ProgramValidationError)
+    assert "[2] ValueError: bad program" in str(excinfo.value)
+    assert isinstance(excinfo.value.__cause__, ValueError)
+
+
+class _WrappingDevice(MockDevice):
+    """Mock device whose transform goes through the program wrapper."""
+
+    def transform(self, run_input):
+        program = load_pipeline_program(run_input)
+        program.remove_idle_qubits()
+        return program.program
+
+    def submit(self, *args, **kwargs):
+        return args[0]
+
+
+def test_apply_runtime_profile_wraps_program_once():
+    """Test that the pipeline stages share one wrapper and alias lookup per program."""
+    profile = TargetProfile(
+        device_id="mock_device",
+        simulator=True,
+        experiment_type=ExperimentType.GATE_MODEL,
+        num_qubits=5,
+        program_spec=ProgramSpec(cirq.Circuit),
+    )
+    device = _WrappingDevice(profile=profile)
+    qasm = 'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[3] q;\nh q[0];\ncx q[0], q[2];\n'
+
+    with (
+        patch("qbraid.runtime._pipeline.load_program", wraps=load_program) as mock_load,
+        patch(
+            "qbraid.runtime._pipeline.get_program_type_alias", wraps=get_program_type_alias
+        ) as mock_alias,
+    ):
+        circuit = device.apply_runtime_profile(qasm)
+
+    assert isinstance(circuit, cirq.Circuit)
+    assert len(circuit.all_qubits()) == 2
+    assert mock_load.call_count == 1
+    aliased = [call.args[0] for call in mock_alias.call_args_list]
+    assert aliased == [qasm, circuit]
+
+
+def test_program_cache_scope():
+    """Test that wrappers are only shared within a program cache context."""
+    circuit = cirq.Circuit(cirq.H(cirq.LineQubit(0)))
+    assert load_pipeline_program(circuit) is not load_pipeline_program(circuit)
+
+    with program_cache() as cache:
+        program = load_pipeline_program(circuit)
+        with program_cache() as inner:
+            assert inner is cache
+            assert load_pipeline_program(circuit) is program
+        program.program = cirq.Circuit(cirq.X(cirq.LineQubit(0)))
+        assert load_pipeline_program(program.program) is program
+        assert load_pipeline_program(circuit) is not program
+
+
+def test_qbraid_device_status_cache(mock_qbraid_device, monkeypatch):
+    """Test that one device data request feeds status, queue depth and validation."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    device = mock_qbraid_device
+
+    with patch.object(device.client, "get_device", wraps=device.client.get_device) as mock_get:
+        assert device.status() == DeviceStatus.ONLINE
+        assert device.queue_depth() == 0
+        for _ in range(3):
+            device.validate([])
+        assert mock_get.call_count == 1
+
+        device.status_cache.invalidate()
+        device.status()
+        assert mock_get.call_count == 2
+
+        device.status_cache.ttl = 0
+        device.status()
+        with cache_disabled(device):
+            device.status_cache.ttl = 10
+            device.status()
+        assert mock_get.call_count == 4
+
+
+def test_status_cache_defaults(mock_qbraid_device, mock_basic_device, monkeypatch):
+    """Test that device data is cached briefly by default and never served stale."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    device = mock_qbraid_device
+
+    with patch.object(device.client, "get_device", wraps=device.client.get_device) as mock_get:
+        with patch("qbraid._caching.time.monotonic", return_value=1000.0):
+            device.status()
+            device.status()
+        assert mock_get.call_count == 1
+
+        with patch("qbraid._caching.time.monotonic", return_value=1000.0 + STATUS_CACHE_TTL + 1):
+            device.status()
+        assert mock_get.call_count == 2
+
+    assert device.status_cache.ttl == STATUS_CACHE_TTL
+    assert device.status_cache.max_stale == 0
+    assert mock_basic_device._device_data() is None
+
+
+def _http_error(status_code: int) -> Exception:
+    """Build a job creation error caused by an HTTP error response."""
+    response = requests.Response()
+    response.status_code = status_code
+    try:
+        raise requests.HTTPError(response=response)
+    except requests.HTTPError as http_err:
+        try:
+            raise RuntimeError(f"Failed to create job: {status_code}") from http_err
+        except RuntimeError as err:
+            return err
+
+
+def test_qbraid_device_submit_batch_concurrently(mock_qbraid_device):
+    """Test that batch jobs are created concurrently and returned in input order."""
+    device = mock_qbraid_device
+    programs = [Program(format="qasm3", data=f"// {i}") for i in range(20)]
+    barrier = threading.Barrier(4, timeout=5)
+
+    def create_job(request):
+        if request.program.data in {"// 0", "// 1", "// 2", "// 3"}:
+            barrier.wait()  # the first jobs can only finish if they run concurrently
+        return Mock(jobQrn=f"job-{request.program.data[3:]}")
+
+    with patch.object(device.client, "create_job", side_effect=create_job):
+        jobs = device.submit(programs, shots=10, max_concurrency=4)
+
+    assert [job.id for job in jobs] == [f"job-{i}" for i in range(20)]
+
+
+def test_qbraid_device_submit_sequential_by_default(mock_qbraid_device):
+    """Test that batch jobs are created one at a time unless concurrency is requested."""
+    device = mock_qbraid_device
+    programs = [Program(format="qasm3", data=f"// {i}") for i in range(4)]
+    threads = set()
+
+    def create_job(request):
+        threads.add(threading.get_ident())
+        return Mock(jobQrn=f"job-{request.program.data[3:]}")
+
+    with patch.object(device.client, "create_job", side_effect=create_job):
+        jobs = device.submit(programs)
+
+    assert [job.id for job in jobs] == [f"job-{i}" for i in range(4)]
+    assert threads == {threading.get_ident()}
+
+
+def test_qbraid_device_submit_retries_transient_errors(mock_qbraid_device):
+    """Test that only rate-limited job creations are retried, with backoff."""
+    device = mock_qbraid_device
+    program = Program(format="qasm3", data="")
+    outcomes = [_http_error(429), _http_error(429), Mock(jobQrn="job-0")]
+
+    with (
+        patch.object(device.client, "create_job", side_effect=outcomes) as mock_create,
+        patch("qbraid.runtime.native.device.time.sleep") as mock_sleep,
+    ):
+        assert device.submit(program, backoff=1.0).id == "job-0"
+    assert mock_create.call_count == 3
+    first, second = (call.args[0] for call in mock_sleep.call_args_list)
+    assert 0.5 <= first <= 1.5 and 1.0 <= second <= 3.0
+
+    for error in [
+        _http_error(400),
+        _http_error(503),
+        requests.ConnectionError("refused"),
+        ValueError("invalid"),
+    ]:
+        with (
+            patch.object(device.client, "create_job", side_effect=[error]) as mock_create,
+            pytest.raises(type(error)),
+        ):
+            device.submit(program)
+        assert mock_create.call_count == 1
+
+
+def test_qbraid_device_submit_partial_failure(mock_qbraid_device):
+    """Test that failed creations are reported per program along with the created jobs."""
+    device = mock_qbraid_device
+    programs = [Program(format="qasm3", data=str(i)) for i in range(4)]
+
+    def create_job(request):
+        if request.program.data == "2":
+            raise ValueError("bad program")
+        return Mock(jobQrn=f"job-{request.program.data}")
+
+    with (
+        patch.object(device.client, "create_job", side_effect=create_job),
+        patch("qbraid.runtime.native.device.time.sleep"),
+        pytest.raises(BatchSubmissionError) as excinfo,
+    ):
+        device.submit(programs, max_retries=0)
+
+    jobs = excinfo.value.jobs
+    assert [job.id if job else None for job in jobs] == ["job-0", "job-1", None, "job-3"]
+    assert list(excinfo.value.errors) == [2]
+    assert "1 of 4 job(s)" in str(excinfo.value)
+
+    with patch.object(device.client, "create_job", side_effect=create_job):
+        results = device.submit(programs, max_concurrency=2, return_exceptions=True)
+
+    assert [job.id for job in results[:2]] == ["job-0", "job-1"]
+    assert isinstance(results[2], ValueError)
+    assert results[3].id == "job-3"
@@ -0,0 +1,160 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the runtime pipeline instrumentation hooks
+
+"""
+from unittest.mock import MagicMock, patch
+
+import cirq
+import pytest
+
+from qbraid.programs import ExperimentType, ProgramSpec
+from qbraid.runtime import StageRecord, TargetProfile, instrument, instrumentation
+from qbraid.runtime.exceptions import ProgramValidationError
+
+from ._resources import MockDevice
+
+QASM = 'OPENQASM 3.0;\ninclude "stdgates.inc";\nqubit[2] q;\nh q[0];\ncx q[0], q[1];\n'
+
+
+@pytest.fixture
+def device():
+    """Mock device targeting OpenQASM 3 strings."""
+    profile = TargetProfile(
+        device_id="mock_device",
+        simulator=True,
+        experiment_type=ExperimentType.GATE_MODEL,
+        num_qubits=2,
+        program_spec=ProgramSpec(str, alias="qasm3"),
+    )
+    return MockDevice(profile=profile)
+
+
+def test_instrument_records_stages_per_program(device):
+    """Test that every stage of every program in a batch is recorded."""
+    circuits = [cirq.Circuit(cirq.H(cirq.LineQubit(0)), cirq.CNOT(*cirq.LineQubit.range(2)))] * 2
+
+    with (
+        patch.object(device, "submit", return_value=["job0", "job1"]) as mock_submit,
+        instrument() as records,
+    ):
+        assert device.run(circuits) == ["job0", "job1"]
+    submitted = mock_submit.call_args.args[0]
+
+    assert [(r.stage, r.program_index) for r in records] == [
+        ("transpile", 0),
+        ("transform", 0),
+        ("validate", 0),
+        ("prepare", 0),
+        ("transpile", 1),
+        ("transform", 1),
+        ("validate", 1),
+        ("prepare", 1),
+        ("submit", None),
+    ]
+    transpile, prepare = records[0], records[3]
+    assert transpile.conversion_path.startswith("cirq -> ")
+    assert transpile.conversion_path.endswith(" -> qasm3")
+    assert prepare.serialized_bytes == len(submitted[0].encode())
+    assert all(r.device_id == "mock_device" and r.wall_time >= 0 for r in records)
+    assert all(r.error is None and r.allocated_bytes is None for r in records)
+
+
+def test_instrument_records_errors_and_allocations(device):
+    """Test that failing stages are recorded and allocations are tracked on request."""
+    hook = MagicMock()
+    with (
+        patch.object(device, "validate", side_effect=ProgramValidationError("too big")),
+        instrument(hook, track_allocations=True) as records,
+        pytest.raises(ProgramValidationError),
+    ):
+        device.apply_runtime_profile(QASM)
+
+    assert [r.stage for r in records] == ["transpile", "transform", "validate"]
+    assert records[-1].error == "ProgramValidationError"
+    assert records[0].conversion_path is None
+    assert all(isinstance(r.allocated_bytes, int) for r in records)
+    assert [call.args[0] for call in hook.call_args_list] == records
+
+
+def test_overlapping_stages_do_not_record_allocations():
+    """Test that allocations are not attributed to stages that overlap other stages."""
+    with instrument(track_allocations=True) as records:
+        with instrumentation.stage("transpile", "device"):
+            with instrumentation.stage("prepare", "device"):
+                pass
+        with instrumentation.stage("submit", "device"):
+            pass
+
+    assert [r.stage for r in records] == ["prepare", "transpile", "submit"]
+    assert records[0].allocated_bytes is None
+    assert records[1].allocated_bytes is None
+    assert isinstance(records[2].allocated_bytes, int)
+
+
+def test_stage_disabled_without_hooks():
+    """Test that stages are no-ops when no hooks are registered."""
+    assert instrumentation.stage("prepare", "device") is instrumentation.stage("submit", "x")
+    with instrumentation.stage("prepare", "device") as record:
+        assert not record.active
+
+
+def test_failing_hook_does_not_break_pipeline(device):
+    """Test that exceptions raised by a hook are logged and ignored."""
+    with instrument(MagicMock(side_effect=RuntimeError("boom"))) as records:
+        assert device.apply_runtime_profile(QASM) == QASM
+    assert len(records) == 4
+
+
+def test_stage_record_span_export():
+    """Test exporting stage records as OpenTelemetry-style spans."""
+    record = StageRecord(
+        stage="prepare",
+        device_id="mock_device",
+        start_time=1_000,
+        wall_time=2e-6,
+        cpu_time=1e-6,
+        program_index=3,
+        serialized_bytes=42,
+    )
+    assert record.to_span() == {
+        "name": "qbraid.runtime.prepare",
+        "start_time_unix_nano": 1_000,
+        "end_time_unix_nano": 3_000,
+        "attributes": {
+            "qbraid.device_id": "mock_device",
+            "qbraid.cpu_time": 1e-6,
+            "qbraid.program_index": 3,
+            "qbraid.serialized_bytes": 42,
+        },
+        "status": "OK",
+    }
+
+    tracer = MagicMock()
+    instrumentation.OpenTelemetryHook(tracer)(record)
+    tracer.start_span.assert_called_once_with(
+        "qbraid.runtime.prepare", start_time=1_000, attributes=record.attributes()
+    )
+    tracer.start_span.return_value.end.assert_called_once_with(end_time=3_000)
+
+
+@pytest.mark.parametrize(
+    "payload, expected",
+    [(b"abc", 3), ("π", 2), ({"a": 1}, 8), (MagicMock(data="abcd"), 4), (object(), None)],
+)
+def test_payload_size(payload, expected):
+    """Test measuring the size of serialized programs."""
+    assert instrumentation.payload_size(payload) == expected
@@ -18,12 +18,16 @@
 Unit tests for quantum jobs functions and data types
 
 """
-from unittest.mock import patch
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 
 import pytest
+from qbraid_core.services.runtime.schemas import RuntimeJob
 
 from qbraid.programs import ExperimentType
-from qbraid.runtime import QuantumJob
+from qbraid.runtime import PollingStrategy, QuantumJob, _async
 from qbraid.runtime.enums import JobStatus
 from qbraid.runtime.exceptions import (
     DeviceProgramTypeMismatchError,
@@ -32,6 +36,7 @@ from qbraid.runtime.exceptions import (
     ResourceNotFoundError,
 )
 from qbraid.runtime.native.job import QbraidJob
+from qbraid.runtime.polling import QueueHints
 from qbraid.runtime.result_data import ResultData
 
 from ._resources import JOB_DATA_QIR
@@ -238,6 +243,58 @@ async def test_async_result_timeout(quantum_job):
             await quantum_job.async_result(timeout=0.2, poll_interval=0.1)
 
 
+@pytest.mark.asyncio
+async def test_async_status_runs_on_shared_executor(quantum_job):
+    """Test that async status and cancel requests run off the event loop thread."""
+    threads = []
+
+    def record_thread(value=None):
+        threads.append(threading.current_thread().name)
+        return value
+
+    with (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="test-executor") as executor,
+        patch.object(quantum_job, "status", side_effect=lambda: record_thread(JobStatus.RUNNING)),
+        patch.object(quantum_job, "cancel", side_effect=record_thread) as mock_cancel,
+    ):
+        _async.set_executor(executor)
+        try:
+            assert await quantum_job.async_status() == JobStatus.RUNNING
+            await quantum_job.async_cancel()
+        finally:
+            _async.set_executor(None)
+
+    mock_cancel.assert_called_once()
+    assert len(threads) == 2
+    assert all(name.startswith("test-executor") for name in threads)
+
+
+@pytest.mark.asyncio
+async def test_async_status_does_not_block_event_loop():
+    """Test that one event loop can wait on the status requests of many jobs at once."""
+    jobs = [MockQuantumJob(job_id=f"job_{i}") for i in range(4)]
+    barrier = threading.Barrier(len(jobs), timeout=5)
+
+    def blocking_status():
+        barrier.wait()
+        return JobStatus.COMPLETED
+
+    for job in jobs:
+        job.status = blocking_status
+
+    statuses = await asyncio.gather(*(job.async_status() for job in jobs))
+    assert statuses == [JobStatus.COMPLETED] * len(jobs)
+
+
+@pytest.mark.asyncio
+async def test_async_is_terminal_state_uses_cached_status(quantum_job):
+    """Test that a cached terminal status is returned without a status request."""
+    quantum_job._cache_metadata["status"] = JobStatus.COMPLETED
+    with patch.object(quantum_job, "status") as mock_status:
+        assert await quantum_job.async_is_terminal_state()
+    mock_status.assert_not_called()
+
+
 def test_wait_for_final_state_success(quantum_job):
     """Mocking the status to change to a final state after some time"""
     with patch.object(quantum_job, "is_terminal_state", side_effect=[False, False, True]):
@@ -251,6 +308,138 @@ def test_wait_for_final_state_timeout(quantum_job):
             quantum_job.wait_for_final_state(timeout=0.2, poll_interval=0.1)
 
 
+def test_wait_for_final_state_uses_polling_strategy(quantum_job):
+    """Test that the wait backs off between polls and uses the job's queue hints."""
+    strategy = PollingStrategy(initial_interval=0.5, max_interval=8, jitter=0.0)
+    hints = QueueHints(queue_position=2)
+    with (
+        patch.object(quantum_job, "is_terminal_state", side_effect=[False, False, False, True]),
+        patch.object(quantum_job, "_queue_hints", return_value=hints) as mock_hints,
+        patch("qbraid.runtime.job.sleep") as mock_sleep,
+    ):
+        quantum_job.wait_for_final_state(strategy=strategy)
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [5, 5, 5]
+    assert mock_hints.call_count == 1
+
+
+def test_wait_for_final_state_sleep_capped_by_timeout(quantum_job):
+    """Test that the wait does not sleep past the timeout."""
+    with (
+        patch.object(quantum_job, "is_terminal_state", return_value=False),
+        patch("qbraid.runtime.job.sleep") as mock_sleep,
+        patch("qbraid.runtime.job.time", side_effect=[0, 0, 1, 1.5]),
+        pytest.raises(TimeoutError),
+    ):
+        quantum_job.wait_for_final_state(timeout=1.5, poll_interval=60)
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1.5, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_async_wait_for_final_state_uses_polling_strategy(quantum_job):
+    """Test that the async wait backs off between polls."""
+    strategy = PollingStrategy(initial_interval=0.01, multiplier=2, jitter=0.0, use_hints=False)
+    with (
+        patch.object(quantum_job, "is_terminal_state", side_effect=[False, False, True]),
+        patch("qbraid.runtime.job.asyncio.sleep") as mock_sleep,
+    ):
+        await quantum_job._wait_for_final_state(strategy=strategy)
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.1, 0.1]
+
+
+def test_queue_hints_from_queue_position_and_device():
+    """Test collecting queue hints from the job and its device."""
+    device = MagicMock()
+    device.avg_queue_time.return_value = 2
+    job = MockQuantumJob(job_id="test_job_id", device=device)
+    job.queue_position = lambda: 4
+    assert job._queue_hints() == QueueHints(queue_position=4, avg_queue_time=120)
+
+    job = MockQuantumJob(job_id="test_job_id")
+    assert job._queue_hints() == QueueHints()
+
+
+class PayloadJob(MockQuantumJob):
+    """Mock job reading its status from fetched job data."""
+
+    def __init__(self, job_id, payloads, release=None):
+        super().__init__(job_id)
+        self.payloads = list(payloads)
+        self.fetch_count = 0
+        self.release = release
+
+    def _fetch_job_data(self):
+        self.fetch_count += 1
+        if self.release is not None:
+            assert self.release.wait(timeout=5)
+        payload = self.payloads.pop(0)
+        if isinstance(payload, Exception):
+            raise payload
+        return payload
+
+    def _job_data_status(self, job_data):
+        return job_data["status"]
+
+    def status(self):
+        return self._job_data_status(self._job_data())
+
+
+def test_job_data_memoized_once_terminal():
+    """Test that job data is refetched while running and never once terminal."""
+    job = PayloadJob(
+        "job_id", [{"status": JobStatus.RUNNING}, {"status": JobStatus.COMPLETED}, None]
+    )
+    assert job.status() == JobStatus.RUNNING
+    assert job._job_data(max_age=60) == {"status": JobStatus.RUNNING}
+    assert job.fetch_count == 1
+    assert job.status() == JobStatus.COMPLETED
+    assert job.status() == JobStatus.COMPLETED
+    assert job.fetch_count == 2
+
+
+def test_job_data_requests_coalesced():
+    """Test that concurrent calls share one in-flight request, and errors are shared too."""
+    release = threading.Event()
+    job = PayloadJob("job_id", [{"status": JobStatus.QUEUED}], release=release)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(job.status) for _ in range(4)]
+        while job._job_data_request is None:
+            pass
+        release.set()
+        assert [future.result() for future in futures] == [JobStatus.QUEUED] * 4
+    assert job.fetch_count < 4
+
+    release.clear()
+    job.payloads = [RuntimeError("unavailable"), {"status": JobStatus.FAILED}]
+    job.fetch_count = 0
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(job.status) for _ in range(2)]
+        while job._job_data_request is None:
+            pass
+        release.set()
+        errors = [future.exception() for future in futures]
+    assert isinstance(errors[0] or errors[1], RuntimeError)
+    assert job.status() == JobStatus.FAILED
+    assert job.fetch_count == 2
+
+
+def test_qbraid_job_result_reuses_terminal_job_data():
+    """Test that QbraidJob.result does not refetch the job after waiting for it."""
+    client = MagicMock()
+    client.get_job.return_value = RuntimeJob.model_validate({**JOB_DATA_QIR, "status": "FAILED"})
+    job = QbraidJob(JOB_DATA_QIR["jobQrn"], client=client)
+
+    with patch("qbraid.runtime.native.job.ResultData.from_object"):
+        result = job.result()
+
+    assert not result.success
+    assert job.status() == JobStatus.FAILED
+    client.get_job.assert_called_once_with(JOB_DATA_QIR["jobQrn"])
+    client.get_job_result.assert_not_called()
+
+
 def test_invalid_job_status_value():
     """Test that an invalid status value raises a ValueError."""
     with pytest.raises(ValueError, match="Invalid status value: INVALID_STATUS"):
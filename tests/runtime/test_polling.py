@@ -0,0 +1,111 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the job status polling strategy
+
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from qbraid.runtime import PollingStrategy
+from qbraid.runtime.exceptions import ResourceNotFoundError
+from qbraid.runtime.polling import (
+    DEFAULT_POLLING_STRATEGY,
+    QueueHints,
+    device_avg_queue_time,
+    resolve_strategy,
+)
+
+
+def test_interval_backs_off_exponentially_within_bounds():
+    """Test that intervals grow exponentially and are clamped to the maximum."""
+    strategy = PollingStrategy(initial_interval=0.25, max_interval=2.0, jitter=0.0)
+    assert [strategy.interval(attempt) for attempt in range(6)] == [0.25, 0.5, 1, 2, 2, 2]
+
+    strategy = PollingStrategy(initial_interval=0.01, min_interval=0.1, jitter=0.0)
+    assert strategy.interval(0) == 0.1
+
+
+def test_interval_jitter_stays_within_bounds():
+    """Test that jitter spreads intervals without leaving the configured range."""
+    strategy = PollingStrategy(initial_interval=1.0, max_interval=1.5, jitter=0.5)
+    intervals = {strategy.interval(0) for _ in range(50)}
+    assert len(intervals) > 1
+    assert all(0.5 <= interval <= 1.5 for interval in intervals)
+
+    capped = PollingStrategy(initial_interval=4.0, max_interval=4.0, jitter=0.5)
+    assert all(capped.interval(3) <= 4.0 for _ in range(50))
+
+
+@pytest.mark.parametrize(
+    "hints, elapsed, expected",
+    [
+        (None, 0, None),
+        (QueueHints(), 0, None),
+        (QueueHints(queue_position=0, avg_queue_time=600), 0, None),
+        (QueueHints(queue_position=12), 0, 120),
+        (QueueHints(avg_queue_time=600), 200, 400),
+        (QueueHints(avg_queue_time=600), 700, None),
+        (QueueHints(queue_position=3, avg_queue_time=600), 100, 500),
+    ],
+)
+def test_estimated_wait_from_hints(hints, elapsed, expected):
+    """Test estimating the remaining queue time from queue positions and averages."""
+    assert PollingStrategy().estimated_wait(hints, elapsed) == expected
+
+
+def test_hints_stretch_interval():
+    """Test that queue hints lengthen the interval of a deeply queued job."""
+    strategy = PollingStrategy(jitter=0.0, max_interval=60.0)
+    assert strategy.interval(0, hints=QueueHints(queue_position=20)) == 50.0
+    assert strategy.interval(0, hints=QueueHints(queue_position=1000)) == 60.0
+    assert strategy.interval(0, hints=QueueHints(queue_position=0)) == 5.0
+
+    no_hints = PollingStrategy(jitter=0.0, use_hints=False)
+    assert no_hints.interval(0, hints=QueueHints(queue_position=20)) == 5.0
+
+
+def test_fixed_and_resolve_strategy():
+    """Test the fixed interval strategy and resolving wait arguments."""
+    fixed = resolve_strategy(poll_interval=5)
+    assert fixed == PollingStrategy.fixed(5)
+    assert fixed.interval(10, hints=QueueHints(queue_position=100)) == 5
+    assert resolve_strategy() is DEFAULT_POLLING_STRATEGY
+    assert 4.5 <= DEFAULT_POLLING_STRATEGY.interval(0) <= 5.5
+    assert resolve_strategy(strategy=fixed) is fixed
+
+    with pytest.raises(ValueError):
+        resolve_strategy(poll_interval=5, strategy=fixed)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"min_interval": 2, "max_interval": 1}, {"multiplier": 0.5}, {"jitter": 1}]
+)
+def test_invalid_strategy_raises(kwargs):
+    """Test that inconsistent strategy parameters are rejected."""
+    with pytest.raises(ValueError):
+        PollingStrategy(**kwargs)
+
+
+def test_device_avg_queue_time():
+    """Test converting a device's average queue time from minutes to seconds."""
+    device = MagicMock()
+    device.avg_queue_time.return_value = 3
+    assert device_avg_queue_time(device) == 180
+    assert device_avg_queue_time(None) is None
+
+    device.avg_queue_time.side_effect = ResourceNotFoundError("not available")
+    assert device_avg_queue_time(device) is None
@@ -0,0 +1,280 @@
+# Copyright 2025 qBraid
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=redefined-outer-name
+
+"""
+Unit tests for the multi-job status watcher
+
+"""
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from qbraid_core.services.runtime.schemas import RuntimeJob
+
+from qbraid.runtime import (
+    JobStatus,
+    JobWatcher,
+    PollingStrategy,
+    QuantumJob,
+    as_completed,
+    gather_results,
+)
+from qbraid.runtime.native import QbraidJob
+
+from ._resources import JOB_DATA_QIR
+
+FAST = PollingStrategy(initial_interval=0.01, max_interval=0.02, min_interval=0.0, jitter=0.0)
+
+
+class ScriptedJob(QuantumJob):
+    """Job whose status follows a script, polled in groups."""
+
+    polled_groups: list[list[str]] = []
+
+    def __init__(self, job_id, statuses, group="a", result=None):
+        super().__init__(job_id)
+        self._statuses = list(statuses)
+        self._group = group
+        self._result = f"result-{job_id}" if result is None else result
+
+    def _poll_group(self):
+        return (ScriptedJob, self._group)
+
+    @classmethod
+    def _poll_statuses(cls, jobs):
+        cls.polled_groups.append([job.id for job in jobs])
+        return super()._poll_statuses(jobs)
+
+    def status(self):
+        if len(self._statuses) > 1:
+            return self._statuses.pop(0)
+        return self._statuses[0]
+
+    def result(self):
+        if isinstance(self._result, Exception):
+            raise self._result
+        return self._result
+
+    def cancel(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def reset_polled_groups():
+    """Clear the record of polled groups."""
+    ScriptedJob.polled_groups = []
+
+
+def test_as_completed_yields_jobs_in_completion_order():
+    """Test that jobs are yielded as they complete and callbacks receive final statuses."""
+    running, done = JobStatus.RUNNING, JobStatus.COMPLETED
+    jobs = [
+        ScriptedJob("slow", [running, running, running, JobStatus.FAILED]),
+        ScriptedJob("fast", [done]),
+        ScriptedJob("other", [running, done], group="b"),
+    ]
+    callback = MagicMock()
+    watcher = JobWatcher(jobs, strategy=FAST, callback=callback)
+
+    completed = list(watcher.as_completed(timeout=5))
+
+    assert completed[0].id == "fast"
+    assert completed[-1].id == "slow"
+    assert sorted(job.id for job in completed) == ["fast", "other", "slow"]
+    assert watcher.pending == []
+    assert {call.args[0].id: call.args[1] for call in callback.call_args_list} == {
+        "fast": done,
+        "other": done,
+        "slow": JobStatus.FAILED,
+    }
+    assert ["slow", "fast"] in ScriptedJob.polled_groups
+    assert all(
+        group in (["slow", "fast"], ["slow"], ["other"]) for group in ScriptedJob.polled_groups
+    )
+
+
+def test_watcher_timeout_and_failures():
+    """Test that the watcher survives failing polls and callbacks, and times out."""
+    job = ScriptedJob("stuck", [JobStatus.QUEUED])
+    failing = ScriptedJob("error", [JobStatus.COMPLETED], group="b")
+    failing.status = MagicMock(side_effect=[RuntimeError("unavailable"), JobStatus.COMPLETED])
+
+    with JobWatcher([job, failing], strategy=FAST, callback=MagicMock(side_effect=ValueError)) as w:
+        with pytest.raises(TimeoutError):
+            w.wait(timeout=0.2)
+        assert w.completed == [failing]
+        assert w.pending == [job]
+
+
+def test_failing_job_does_not_block_its_group():
+    """Test that a job whose status keeps failing fails alone, without stalling its group."""
+    error = RuntimeError("not found")
+    running, done = JobStatus.RUNNING, JobStatus.COMPLETED
+    jobs = [
+        ScriptedJob("ok", [running, done]),
+        ScriptedJob("bad", [done]),
+        ScriptedJob("late", [running, running, done]),
+    ]
+    jobs[1].status = MagicMock(side_effect=error)
+
+    watcher = JobWatcher(jobs, strategy=FAST, max_poll_errors=2)
+    completed = list(watcher.as_completed(timeout=5))
+
+    assert sorted(job.id for job in completed) == ["bad", "late", "ok"]
+    assert jobs[1].status.call_count == 2
+    assert watcher.poll_error(jobs[1]) is error
+    assert watcher.poll_error(jobs[0]) is None
+
+    jobs[1].status = MagicMock(side_effect=error)
+    outcomes = dict(
+        (job.id, outcome)
+        for job, outcome in as_completed(jobs[:2], timeout=5, return_exceptions=True, strategy=FAST)
+    )
+    assert outcomes == {"ok": "result-ok", "bad": error}
+
+
+def test_watcher_job_timeout_counts_from_first_poll():
+    """Test that each job times out relative to its own first poll."""
+    queued = JobStatus.QUEUED
+    first, second = ScriptedJob("first", [queued]), ScriptedJob("second", [queued], group="b")
+    finished = {}
+    watcher = JobWatcher(strategy=FAST, job_timeout=0.3)
+    watcher.add_callback(lambda job, status: finished.update({job.id: time.monotonic()}))
+
+    start = time.monotonic()
+    with watcher:
+        watcher.add(first)
+        time.sleep(0.2)
+        watcher.add(second)
+        watcher.wait(timeout=5)
+
+    assert finished["first"] - start < finished["second"] - start
+    assert finished["second"] - start >= 0.5
+    assert isinstance(watcher.poll_error(first), TimeoutError)
+    assert isinstance(watcher.poll_error(second), TimeoutError)
+
+
+def test_watcher_add_while_running():
+    """Test that jobs added to a running watcher are polled and yielded."""
+    watcher = JobWatcher(strategy=FAST)
+    watcher.add(ScriptedJob("first", [JobStatus.COMPLETED]))
+    seen = []
+    for job in watcher.as_completed(timeout=5):
+        seen.append(job.id)
+        if job.id == "first":
+            watcher.add(ScriptedJob("second", [JobStatus.RUNNING, JobStatus.CANCELLED]))
+
+    assert seen == ["first", "second"]
+
+
+def _runtime_job(job_id: str, status: str) -> RuntimeJob:
+    return RuntimeJob.model_validate({**JOB_DATA_QIR, "jobQrn": job_id, "status": status})
+
+
+def test_qbraid_jobs_polled_in_bulk():
+    """Test that pending qBraid jobs are listed in bulk and only finished jobs are fetched."""
+    client = MagicMock()
+    client.list_jobs.return_value = [
+        _runtime_job("job-1", "QUEUED"),
+        _runtime_job("job-2", "RUNNING"),
+        _runtime_job("unwatched", "QUEUED"),
+    ]
+    client.get_job.return_value = _runtime_job("job-3", "COMPLETED")
+    jobs = [QbraidJob(f"job-{i}", client=client) for i in range(1, 4)]
+    assert len({job._poll_group() for job in jobs}) == 1
+
+    statuses = QbraidJob._poll_statuses(jobs)
+
+    assert statuses == [JobStatus.QUEUED, JobStatus.RUNNING, JobStatus.COMPLETED]
+    client.list_jobs.assert_called_once_with(status_group="pending", page=1, limit=100)
+    client.get_job.assert_called_once_with("job-3")
+    assert jobs[0]._cache_metadata["queuePosition"] == JOB_DATA_QIR["queuePosition"]
+
+    assert QbraidJob._poll_statuses(jobs[2:]) == [JobStatus.COMPLETED]
+    assert client.get_job.call_count == 1
+
+
+def test_qbraid_jobs_polled_individually_when_listing_fails():
+    """Test that each qBraid job is polled on its own if the bulk listing fails, and
+    that a failing job does not affect the others."""
+    client = MagicMock()
+    client.list_jobs.side_effect = RuntimeError("listing unavailable")
+    error = RuntimeError("job not found")
+
+    def get_job(job_id):
+        if job_id == "job-2":
+            raise error
+        return _runtime_job(job_id, "RUNNING")
+
+    client.get_job.side_effect = get_job
+    jobs = [QbraidJob(f"job-{i}", client=client) for i in range(1, 4)]
+
+    statuses = QbraidJob._poll_statuses(jobs)
+
+    assert statuses == [JobStatus.RUNNING, error, JobStatus.RUNNING]
+
+
+def test_gather_results_in_input_order():
+    """Test that results are gathered in the order of the given jobs."""
+    running, done = JobStatus.RUNNING, JobStatus.COMPLETED
+    jobs = [
+        ScriptedJob("slow", [running, running, done]),
+        ScriptedJob("fast", [done], group="b"),
+        ScriptedJob("medium", [running, done], group="c"),
+    ]
+    results = gather_results(jobs + [jobs[1]], max_concurrency=2, timeout=5, strategy=FAST)
+    assert results == ["result-slow", "result-fast", "result-medium", "result-fast"]
+
+
+def test_as_completed_downloads_results_concurrently():
+    """Test that results of completed jobs are downloaded in parallel."""
+    barrier = threading.Barrier(3, timeout=5)
+    jobs = [ScriptedJob(f"job{i}", [JobStatus.COMPLETED], group=i) for i in range(3)]
+    for job in jobs:
+        job.result = lambda job=job: (barrier.wait(), job.id)[1]
+
+    pairs = list(as_completed(jobs, max_concurrency=3, timeout=5, strategy=FAST))
+    assert sorted((job.id, result) for job, result in pairs) == [
+        ("job0", "job0"),
+        ("job1", "job1"),
+        ("job2", "job2"),
+    ]
+
+
+def test_as_completed_errors_and_job_timeout():
+    """Test reporting failed result downloads and jobs that exceed the job timeout."""
+    error = RuntimeError("download failed")
+    jobs = [
+        ScriptedJob("ok", [JobStatus.COMPLETED]),
+        ScriptedJob("broken", [JobStatus.FAILED], result=error),
+        ScriptedJob("stuck", [JobStatus.QUEUED], group="b"),
+    ]
+    outcomes = dict(
+        (job.id, outcome)
+        for job, outcome in as_completed(
+            jobs, job_timeout=0.2, timeout=5, return_exceptions=True, strategy=FAST
+        )
+    )
+    assert outcomes["ok"] == "result-ok"
+    assert outcomes["broken"] is error
+    assert isinstance(outcomes["stuck"], TimeoutError)
+
+    with pytest.raises(RuntimeError, match="download failed"):
+        gather_results(jobs[:2], strategy=FAST)
+
+    with pytest.raises(TimeoutError):
+        gather_results([jobs[0], jobs[2]], timeout=0.2, strategy=FAST)
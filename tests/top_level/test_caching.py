@@ -17,10 +17,17 @@ Unit tests for caching module.
 
 """
 import math
+import threading
+from unittest.mock import Mock, patch
 
 import pytest
 
-from qbraid._caching import _generate_cache_key, cached_method, clear_cache
+from qbraid._caching import (
+    StaleWhileRevalidateCache,
+    _generate_cache_key,
+    cached_method,
+    clear_cache,
+)
 
 
 class TestClass:
@@ -66,3 +73,81 @@ def test_clear_cache(test_instance, monkeypatch):
     clear_cache()
 
     assert test_instance.adjusted_factorial.cache_info().currsize == 0
+
+
+@pytest.fixture
+def clock():
+    """Patch the monotonic clock used by the caches."""
+    with patch("qbraid._caching.time.monotonic", return_value=100.0) as mock_clock:
+        yield mock_clock
+
+
+def test_stale_while_revalidate_fresh_and_expired(clock, monkeypatch):
+    """Test that values are reused within the TTL and re-fetched once fully expired."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    fetch = Mock(side_effect=[1, 2])
+    cache = StaleWhileRevalidateCache(fetch, ttl=10, max_stale=5)
+
+    assert cache.get() == 1
+    clock.return_value = 109.0
+    assert cache.get() == 1
+    assert fetch.call_count == 1
+
+    clock.return_value = 116.0
+    assert cache.get() == 2
+    assert fetch.call_count == 2
+
+
+def test_stale_while_revalidate_background_refresh(clock, monkeypatch):
+    """Test that stale values are returned while a single background refresh runs."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    release = threading.Event()
+    values = iter([1, 2])
+
+    def fetch():
+        value = next(values)
+        if value == 2:
+            release.wait(5)
+        return value
+
+    cache = StaleWhileRevalidateCache(fetch, ttl=10, max_stale=30)
+    assert cache.get() == 1
+
+    threads, thread_class = [], threading.Thread
+
+    def make_thread(*args, **kwargs):
+        threads.append(thread_class(*args, **kwargs))
+        return threads[-1]
+
+    clock.return_value = 120.0
+    with patch("qbraid._caching.threading.Thread", side_effect=make_thread):
+        assert cache.get() == 1
+        assert cache.get() == 1
+    assert len(threads) == 1
+
+    release.set()
+    threads[0].join(5)
+    assert cache.get() == 2
+
+
+def test_stale_while_revalidate_bypassed(monkeypatch):
+    """Test that the cache is bypassed when disabled or with a zero TTL."""
+    fetch = Mock(side_effect=[1, 2, 3, 4])
+    cache = StaleWhileRevalidateCache(fetch, ttl=10)
+
+    monkeypatch.setenv("DISABLE_CACHE", "1")
+    assert [cache.get(), cache.get()] == [1, 2]
+
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    cache.ttl = 0
+    assert [cache.get(), cache.get()] == [3, 4]
+
+
+def test_stale_while_revalidate_invalidate(monkeypatch):
+    """Test that invalidating the cache forces the next value to be fetched."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    fetch = Mock(side_effect=[1, 2])
+    cache = StaleWhileRevalidateCache(fetch, ttl=10)
+    assert cache.get() == 1
+    cache.invalidate()
+    assert cache.get() == 2
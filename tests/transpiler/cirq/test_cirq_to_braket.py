@@ -34,6 +34,8 @@ from qbraid.interface.random import random_unitary_matrix
 from qbraid.transpiler.conversions.cirq import cirq_to_braket
 from qbraid.transpiler.conversions.cirq.braket_custom import C
 from qbraid.transpiler.conversions.cirq.cirq_to_braket import (
+    _kak_template,
+    _one_qubit_template,
     _to_one_qubit_braket_instruction,
     _to_two_qubit_braket_instruction,
 )
@@ -394,3 +396,40 @@ def test_braket_custom_gate():
     custom_gate = C(sub_gate=Gate(1, "a"), targets=QubitSet([0, 1]))
     instr = custom_gate.c(QubitSet([0, 1]), sub_gate=Gate(1, "a"))
     assert isinstance(instr, Instruction)
+
+
+def test_repeated_two_qubit_unitary_decomposed_once():
+    """Test that repeated arbitrary two-qubit unitaries share one cached KAK decomposition"""
+    matrix = random_unitary_matrix(4)
+    gate = cirq.MatrixGate(matrix)
+    qubits = LineQubit.range(4)
+    circuit = Circuit(gate.on(qubits[0], qubits[1]), gate.on(qubits[3], qubits[2]))
+
+    _kak_template.cache_clear()
+    with patch(
+        "qbraid.transpiler.conversions.cirq.cirq_to_braket.kak_decomposition",
+        wraps=cirq.kak_decomposition,
+    ) as mock_kak:
+        braket_circuit = cirq_to_braket(circuit)
+
+    assert mock_kak.call_count == 1
+    assert circuits_allclose(circuit, braket_circuit, strict_gphase=False)
+
+    instructions = braket_circuit.instructions
+    half = len(instructions) // 2
+    assert [instr.operator for instr in instructions[:half]] == [
+        instr.operator for instr in instructions[half:]
+    ]
+    assert {int(q) for instr in instructions[half:] for q in instr.target} == {2, 3}
+
+
+def test_one_qubit_gate_template_cached():
+    """Test that one-qubit gate conversions are cached per gate and placed on each target"""
+    _one_qubit_template.cache_clear()
+    circuit = Circuit(cirq.rx(0.3).on(q) for q in LineQubit.range(5))
+    braket_circuit = cirq_to_braket(circuit)
+
+    info = _one_qubit_template.cache_info()
+    assert (info.misses, info.hits) == (1, 4)
+    assert [int(instr.target[0]) for instr in braket_circuit.instructions] == [0, 1, 2, 3, 4]
+    assert circuits_allclose(circuit, braket_circuit, strict_gphase=False)
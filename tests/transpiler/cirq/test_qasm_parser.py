@@ -24,7 +24,9 @@ Unit tests for Cirq Qasm Parser
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
+from unittest.mock import patch
 
 import cirq
 import cirq.testing as ct
@@ -1076,3 +1078,33 @@ def test_single_qubit_gates(qasm_gate: str, cirq_gate: cirq.Gate):
 
     ct.assert_same_circuits(parsed_qasm.circuit, expected_circuit)
     assert parsed_qasm.qregs == {"q": 2}
+
+
+def test_parse_tables_generated_once():
+    QasmParser()
+    with patch("ply.yacc.yacc") as mock_yacc:
+        parser = QasmParser()
+        parsed_qasm = parser.parse("OPENQASM 2.0; qreg q[1]; U(0, 0, 0) q[0];")
+    mock_yacc.assert_not_called()
+    assert parsed_qasm.qregs == {"q": 1}
+
+
+def test_reset_parser_for_reuse():
+    parser = QasmParser()
+    first = parser.parse("OPENQASM 2.0; qreg q[2];")
+    parser.reset()
+    second = parser.parse("OPENQASM 2.0; creg c[1];")
+    assert first.qregs == {"q": 2} and first.cregs == {}
+    assert second.qregs == {} and second.cregs == {"c": 1}
+
+
+def test_parser_for_thread():
+    parser = QasmParser.for_thread()
+    parsed_qasm = parser.parse("OPENQASM 2.0; qreg q[1];")
+    assert QasmParser.for_thread() is parser
+    assert parser.parsedQasm is None
+    assert parsed_qasm.qregs == {"q": 1}
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(QasmParser.for_thread).result()
+    assert other is not parser
@@ -21,6 +21,7 @@
 Module for testing qBraid QuilOutput.
 
 """
+import io
 import os
 
 import cirq
@@ -121,6 +122,41 @@ X 0\n"""
     )
 
 
+def test_write_to_stream():
+    """Test that QuilOutput.write streams the same output as str(QuilOutput)."""
+    q0, q1 = _make_qubits(2)
+    output = QuilOutput((cirq.H(q0), cirq.CNOT(q0, q1), cirq.measure(q0, q1, key="m")), (q0, q1))
+    sink = io.StringIO()
+    output.write(sink)
+    assert sink.getvalue() == str(output)
+
+
+def test_defgates_numbered_inline():
+    """Test that every DEFGATE and its uses are numbered, including the last gate."""
+    q0, q1 = _make_qubits(2)
+    operations = [QuilOneQubitGate(np.diag([1, 1j**k])).on(q0) for k in range(11)]
+    operations.append(cirq.X(q1))
+    operations.append(QuilTwoQubitGate(np.eye(4)).on(q0, q1))
+    operations.append(QuilOneQubitGate(np.eye(2)).on(q1))
+    lines = str(QuilOutput(operations, (q0, q1))).splitlines()
+    assert [line for line in lines if line.startswith("DEFGATE")] == [
+        f"DEFGATE USERGATE{n}:" for n in range(1, 14)
+    ]
+    assert lines[-1] == "USERGATE13 1"
+    assert lines[-5] == "USERGATE12 0 1"
+
+
+def test_gate_subclass_dispatch():
+    """Test that subclasses of supported gates are converted with their base gate converter."""
+
+    class MyXPowGate(cirq.XPowGate):
+        """XPowGate subclass without a QUIL converter of its own."""
+
+    (q0,) = _make_qubits(1)
+    output = QuilOutput((MyXPowGate(exponent=0.5).on(q0),), (q0,))
+    assert str(output) == f"# Created using qBraid.\n\nRX({np.pi / 2}) 0\n"
+
+
 def test_quil_one_qubit_gate_repr():
     """Test that the QuilOneQubitGate __repr__ method works as expected."""
     gate = QuilOneQubitGate(np.array([[1, 0], [0, 1]]))
@@ -18,7 +18,10 @@ Unit tests for OpenQASM 3.0 to CUDA-Q kernel transpilation.
 """
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -28,7 +31,13 @@ from qiskit.qasm3 import loads as qasm3_loads
 
 from qbraid.interface import assert_allclose_up_to_global_phase, circuits_allclose
 from qbraid.transpiler.conversions.openqasm3 import openqasm3_to_cudaq
-from qbraid.transpiler.conversions.openqasm3.openqasm3_to_cudaq import make_gate_kernel
+from qbraid.transpiler.conversions.openqasm3.openqasm3_to_cudaq import (
+    _build_kernel,
+    clear_gate_kernel_cache,
+    get_gate_kernel,
+    make_gate_kernel,
+    openqasm3_to_cudaq_batch,
+)
 from qbraid.transpiler.conversions.qasm2.qasm2_to_qasm3 import qasm2_to_qasm3
 from qbraid.transpiler.exceptions import ProgramConversionError
 
@@ -295,6 +304,92 @@ def test_openqasm3_to_cudaq_caching():
     assert str(cudaq_out).count("quake.x") == 1
 
 
+def test_openqasm3_to_cudaq_gate_kernel_cache_shared():
+    """OpenQASM3 -> CUDA-Q: Test that gate kernels are cached across conversions,
+    keyed by gate name and parameter types."""
+    qasm3_str_in = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[2] q;
+    x q[0];
+    rx(0.5) q[1];
+    swap q[0], q[1];
+    """
+    clear_gate_kernel_cache()
+    with patch(
+        "qbraid.transpiler.conversions.openqasm3.openqasm3_to_cudaq.make_gate_kernel",
+        wraps=make_gate_kernel,
+    ) as mock_make:
+        for _ in range(3):
+            _check_output(qasm3_str_in, openqasm3_to_cudaq(qasm3_str_in), method="state")
+        assert mock_make.call_count == 3
+
+        assert get_gate_kernel("rx", (float,)) is get_gate_kernel("rx", (float,))
+        assert get_gate_kernel("rx", (int,)) is not get_gate_kernel("rx", (float,))
+
+        clear_gate_kernel_cache()
+        openqasm3_to_cudaq(qasm3_str_in)
+        assert mock_make.call_count == 7
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_openqasm3_to_cudaq_batch(use_executor):
+    """OpenQASM3 -> CUDA-Q: Test converting a batch of programs."""
+    programs = [
+        """
+        OPENQASM 3.0;
+        include "stdgates.inc";
+        qubit[2] q;
+        h q[0];
+        cx q[0], q[1];
+        """,
+        """
+        OPENQASM 3.0;
+        include "stdgates.inc";
+        qubit[1] q;
+        ry(0.25) q[0];
+        """,
+    ]
+    if use_executor:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            kernels = openqasm3_to_cudaq_batch(programs, executor=executor)
+    else:
+        kernels = openqasm3_to_cudaq_batch(programs)
+
+    assert len(kernels) == len(programs)
+    for qasm3_str_in, kernel in zip(programs, kernels):
+        _check_output(qasm3_str_in, kernel, method="state")
+
+
+def test_openqasm3_to_cudaq_batch_builds_serially():
+    """OpenQASM3 -> CUDA-Q: Test that kernels of a concurrent batch are built one at a time."""
+    active, overlaps = [], []
+
+    def tracked_build(program):
+        active.append(program)
+        overlaps.append(len(active))
+        time.sleep(0.01)
+        try:
+            return _build_kernel(program)
+        finally:
+            active.remove(program)
+
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[1] q;
+    rx(0.5) q[0];
+    """
+    with patch(
+        "qbraid.transpiler.conversions.openqasm3.openqasm3_to_cudaq._build_kernel",
+        side_effect=tracked_build,
+    ):
+        kernels = openqasm3_to_cudaq_batch([qasm] * 6, max_workers=4)
+
+    assert len(kernels) == 6
+    assert max(overlaps) == 1
+
+
 @pytest.mark.parametrize(
     "qasm_code, error_message",
     [
@@ -17,6 +17,7 @@ Unit tests for qasm2/qasm3 to IonQDictType transpilation
 
 """
 import importlib.util
+import json
 import sys
 from unittest.mock import Mock, patch
 
@@ -29,8 +30,8 @@ from qbraid.programs.gate_model.qasm3 import OpenQasm3Program
 from qbraid.programs.typer import IonQDictType, Qasm3StringType
 from qbraid.transpiler.conversions.openqasm3.openqasm3_to_ionq import (
     _parse_gates,
-    extract_params,
     openqasm3_to_ionq,
+    openqasm3_to_ionq_json,
 )
 from qbraid.transpiler.conversions.qasm2.qasm2_to_ionq import qasm2_to_ionq
 from qbraid.transpiler.conversions.qasm3.qasm3_to_ionq import qasm3_to_ionq
@@ -187,16 +188,16 @@ def deutch_jozsa_ionq() -> IonQDictType:
         "format": InputFormat.CIRCUIT.value,
         "qubits": 5,
         "circuit": [
-            {"gate": "x", "target": 0},
+            {"gate": "x", "target": 4},
             {"gate": "h", "target": 0},
             {"gate": "h", "target": 1},
             {"gate": "h", "target": 2},
             {"gate": "h", "target": 3},
-            {"gate": "h", "target": 0},
-            {"gate": "cnot", "control": 0, "target": 0},
-            {"gate": "cnot", "control": 1, "target": 0},
-            {"gate": "cnot", "control": 2, "target": 0},
-            {"gate": "cnot", "control": 3, "target": 0},
+            {"gate": "h", "target": 4},
+            {"gate": "cnot", "control": 0, "target": 4},
+            {"gate": "cnot", "control": 1, "target": 4},
+            {"gate": "cnot", "control": 2, "target": 4},
+            {"gate": "cnot", "control": 3, "target": 4},
             {"gate": "h", "target": 0},
             {"gate": "h", "target": 1},
             {"gate": "h", "target": 2},
@@ -574,19 +575,6 @@ def test_qasm3_to_ionq_mixed_gate_types_raises_value_error():
     assert "Cannot mix native and QIS gates in the same circuit." in str(excinfo.value)
 
 
-def test_extract_params_index_error_caught():
-    """Test that the extract_params returns empty list for non-parametric gates."""
-    h_gate_qasm = """
-    OPENQASM 3.0;
-    qubit[1] q;
-    h q[0];    
-    """
-    program = parse(h_gate_qasm)
-    statement = program.statements[1]
-    assert isinstance(statement, openqasm3.ast.QuantumGate)
-    assert extract_params(statement) == []
-
-
 @pytest.mark.skip(reason="To validate in pyqasm through definition of ms gate")
 @pytest.mark.parametrize(
     "program_text",
@@ -734,3 +722,36 @@ def test_parse_gates_uses_unrolled_ast_when_no_top_level_gates():
 
     gates = _parse_gates(program)
     assert len(gates) > 0
+
+
+def test_openqasm3_to_ionq_register_offsets():
+    """Test that qubits of multiple registers are numbered in declaration order,
+    and that register operands are broadcast."""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[2] q;
+    qubit[2] r;
+    h r;
+    cx q, r;
+    rz(pi / 4) r[1];
+    """
+    assert openqasm3_to_ionq(qasm)["circuit"] == [
+        {"gate": "h", "target": 2},
+        {"gate": "h", "target": 3},
+        {"gate": "cnot", "control": 0, "target": 2},
+        {"gate": "cnot", "control": 1, "target": 3},
+        {"gate": "rz", "target": 3, "rotation": 0.7853981633974483},
+    ]
+
+
+def test_openqasm3_to_ionq_json(deutsch_jozsa_qasm3):
+    """Test that the serialized IonQ program matches encoding the IonQ dict."""
+    qasm = """
+    OPENQASM 3.0;
+    qubit[2] q;
+    gpi2(0.25) q[0];
+    ms(0, 0.5, 0.25) q[0], q[1];
+    """
+    for program in (qasm, deutsch_jozsa_qasm3):
+        assert openqasm3_to_ionq_json(program) == json.dumps(openqasm3_to_ionq(program)).encode()